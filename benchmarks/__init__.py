@@ -0,0 +1 @@
+"""Reproducible performance benchmarks of the platform API."""
@@ -0,0 +1,277 @@
+"""Throughput and latency of the authentication flows.
+
+Measures ``POST /auth/login``, ``POST /auth/refresh``,
+``DELETE /auth/logout`` and the bearer token dependency chain through
+``GET /user/me``. The app runs in-process against the database in
+``DB_DATABASE_URL``, which must be a disposable database migrated with
+``alembic upgrade head``. Benchmark users are identified by their email
+domain and are replaced on every run.
+
+Usage:
+    DB_DATABASE_URL=<bench database URL> python -m benchmarks.auth
+        [--users 1000] [--requests 2000] [--concurrency 16]
+
+Compare two runs with ``python -m benchmarks.compare OLD NEW``.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import selectinload
+
+from benchmarks.harness import FlowResult, QueryCounter, run_flow, write_results
+from src.auth.dependencies import check_login_rate_limit
+from src.auth.services import AuthService, Hasher
+from src.database import async_db_session, engine
+from src.main import app
+from src.settings import Settings
+from src.users.models import User
+
+logger = logging.getLogger(__name__)
+settings = Settings.load()
+
+EMAIL_DOMAIN = 'bench.example.com'
+PASSWORD = 'Bench-password-1'  # noqa: S105
+API_PREFIX = '/api/v1'
+
+
+@dataclass(slots=True)
+class BenchSession:
+    """Tokens of a logged in benchmark user."""
+
+    access_token: str
+    refresh_token: str
+
+
+async def seed_users(count: int) -> list[str]:
+    """Replace the benchmark users with ``count`` fresh ones.
+
+    All users share one password hash, so seeding doesn't run bcrypt
+    per user.
+
+    Returns:
+        list[str]: Emails of the seeded users.
+
+    """
+    hashed_password = Hasher.hash_password(PASSWORD)
+    emails = [f'user{index}@{EMAIL_DOMAIN}' for index in range(count)]
+    async with async_db_session() as session, session.begin():
+        await session.execute(
+            delete(User).where(User.email.endswith(f'@{EMAIL_DOMAIN}'))
+        )
+        await session.execute(
+            insert(User),
+            [
+                {
+                    'id': uuid.uuid4(),
+                    'name': 'Bench',
+                    'surname': 'User',
+                    'email': email,
+                    'password': hashed_password,
+                }
+                for email in emails
+            ],
+        )
+    return emails
+
+
+async def issue_sessions() -> list[BenchSession]:
+    """Issue one pair of tokens per benchmark user, bypassing bcrypt."""
+    async with async_db_session() as session:
+        async with session.begin():
+            result = await session.scalars(
+                select(User)
+                .where(User.email.endswith(f'@{EMAIL_DOMAIN}'))
+                .options(selectinload(User.author))
+            )
+            users = list(result.all())
+        service = AuthService(session)
+        sessions: list[BenchSession] = []
+        for user in users:
+            token = await service.create_token(user)
+            sessions.append(
+                BenchSession(token.access_token, token.refresh_token)
+            )
+    return sessions
+
+
+def _raise_for_status(response: httpx.Response, expected: int) -> None:
+    if response.status_code != expected:
+        msg = f'{response.request.url}: {response.status_code}'
+        raise RuntimeError(msg)
+
+
+async def run_suite(
+    users: int, requests: int, concurrency: int, login_requests: int
+) -> dict[str, FlowResult]:
+    """Seed the database and benchmark every authentication flow.
+
+    Args:
+        users (int): Number of seeded users.
+        requests (int): Requests per flow, logout is capped at ``users``
+            since every logout ends a session.
+        concurrency (int): Requests in flight at the same time.
+        login_requests (int): Requests of the login flow, which is
+            bound by bcrypt and usually needs fewer.
+
+    Returns:
+        dict[str, FlowResult]: Results by flow name.
+
+    """
+    emails = await seed_users(users)
+    query_counter = QueryCounter(engine)
+    results: dict[str, FlowResult] = {}
+    rng = random.Random(0)  # noqa: S311
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(
+            transport=transport, base_url='http://bench'
+        ) as client,
+    ):
+
+        async def login(client: httpx.AsyncClient, _: int) -> None:
+            response = await client.post(
+                f'{API_PREFIX}/auth/login',
+                data={'username': rng.choice(emails), 'password': PASSWORD},
+            )
+            _raise_for_status(response, 200)
+
+        logger.info('Benchmarking login')
+        results['login'] = await run_flow(
+            client, query_counter, login, login_requests, concurrency
+        )
+
+        sessions = await issue_sessions()
+
+        async def me(client: httpx.AsyncClient, index: int) -> None:
+            response = await client.get(
+                f'{API_PREFIX}/user/me',
+                headers={
+                    'Authorization': sessions[
+                        index % len(sessions)
+                    ].access_token
+                },
+            )
+            _raise_for_status(response, 200)
+
+        logger.info('Benchmarking user/me')
+        results['user_me'] = await run_flow(
+            client, query_counter, me, requests, concurrency
+        )
+
+        idle_sessions: asyncio.Queue[BenchSession] = asyncio.Queue()
+        for bench_session in sessions:
+            idle_sessions.put_nowait(bench_session)
+
+        async def refresh(client: httpx.AsyncClient, _: int) -> None:
+            # A refresh token is single use, so a session is never
+            # refreshed by two requests at once.
+            bench_session = await idle_sessions.get()
+            try:
+                response = await client.post(
+                    f'{API_PREFIX}/auth/refresh',
+                    headers={
+                        'Cookie': (
+                            f'refresh_token={bench_session.refresh_token}'
+                        )
+                    },
+                )
+                _raise_for_status(response, 200)
+                token: dict[str, Any] = response.json()
+                bench_session.access_token = token['access_token']
+                bench_session.refresh_token = token['refresh_token']
+            finally:
+                idle_sessions.put_nowait(bench_session)
+
+        logger.info('Benchmarking refresh')
+        results['refresh'] = await run_flow(
+            client, query_counter, refresh, requests, concurrency
+        )
+
+        async def logout(client: httpx.AsyncClient, index: int) -> None:
+            bench_session = sessions[index]
+            response = await client.delete(
+                f'{API_PREFIX}/auth/logout',
+                headers={
+                    'Authorization': bench_session.access_token,
+                    'Cookie': f'refresh_token={bench_session.refresh_token}',
+                },
+            )
+            _raise_for_status(response, 200)
+
+        logger.info('Benchmarking logout')
+        results['logout'] = await run_flow(
+            client,
+            query_counter,
+            logout,
+            min(requests, len(sessions)),
+            concurrency,
+        )
+    return results
+
+
+def main() -> None:
+    """Run the authentication benchmark and save its results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--login-requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=Path('benchmarks/results')
+        / f'auth-{datetime.now(UTC):%Y%m%dT%H%M%S}.json',
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    # Statement logging and login throttling would dominate the numbers
+    engine.sync_engine.echo = False
+    app.dependency_overrides[check_login_rate_limit] = lambda: None
+
+    results = asyncio.run(
+        run_suite(
+            args.users, args.requests, args.concurrency, args.login_requests
+        )
+    )
+    write_results(
+        args.output,
+        'auth',
+        {
+            'users': args.users,
+            'requests': args.requests,
+            'login_requests': args.login_requests,
+            'concurrency': args.concurrency,
+            'claims_auth': settings.token_settings.CLAIMS_AUTH,
+            'hasher_rounds': settings.hasher_settings.ROUNDS,
+            'hasher_pool_size': settings.hasher_settings.POOL_SIZE,
+        },
+        results,
+    )
+    for name, result in results.items():
+        logger.info(
+            '%-8s %8.1f req/s  p50 %7.2f ms  p95 %7.2f ms  p99 %7.2f ms  '
+            '%5.2f queries/req  %d errors',
+            name,
+            result.throughput_rps,
+            result.p50_ms,
+            result.p95_ms,
+            result.p99_ms,
+            result.queries_per_request,
+            result.errors,
+        )
+    logger.info('Results saved to %s', args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Compare two saved benchmark results and flag regressions.
+
+Usage:
+    python -m benchmarks.compare OLD.json NEW.json [--threshold 10]
+
+Exits with status 1 if a flow got slower than the threshold, in percent,
+on throughput or latency, or runs more queries per request.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _change(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def _compare_flow(
+    name: str,
+    old_result: dict[str, float],
+    new_result: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    """Compare the metrics of one flow, see ``compare``."""
+    regressions: list[str] = []
+    changes: list[str] = []
+    for metric, new_value in new_result.items():
+        old_value = old_result.get(metric)
+        if old_value is None:
+            continue
+        if metric == 'queries_per_request':
+            difference = new_value - old_value
+            changes.append(f'{metric} {difference:+.2f}')
+            if difference > 0:
+                regressions.append(f'{name}: {metric} {difference:+.2f}')
+            continue
+        if metric.endswith(('_rps', '_per_s')):
+            slowdown = -_change(old_value, new_value)
+        elif metric.endswith('_ms'):
+            slowdown = _change(old_value, new_value)
+        else:
+            continue
+        changes.append(f'{metric} {_change(old_value, new_value):+.1f}%')
+        if slowdown > threshold:
+            regressions.append(
+                f'{name}: {metric} {_change(old_value, new_value):+.1f}%'
+            )
+    logger.info('%-18s %s', name, '  '.join(changes))
+    return regressions
+
+
+def compare(
+    old: dict[str, Any], new: dict[str, Any], threshold: float
+) -> list[str]:
+    """Log the differences between two results and return regressions.
+
+    Throughput metrics (``*_rps``, ``*_per_s``) regress when they drop
+    by more than the threshold, latencies (``*_ms``) when they grow by
+    more than it, and queries per request whenever they grow.
+
+    Args:
+        old (dict[str, Any]): Baseline results document.
+        new (dict[str, Any]): Results document to check.
+        threshold (float): Tolerated slowdown in percent.
+
+    Returns:
+        list[str]: Descriptions of the regressions found.
+
+    """
+    regressions: list[str] = []
+    for name, new_result in new['results'].items():
+        old_result = old['results'].get(name)
+        if old_result is None:
+            logger.info('%-18s new flow', name)
+            continue
+        regressions += _compare_flow(name, old_result, new_result, threshold)
+    return regressions
+
+
+def main() -> None:
+    """Compare two benchmark result files."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('old', type=Path)
+    parser.add_argument('new', type=Path)
+    parser.add_argument('--threshold', type=float, default=10.0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    regressions = compare(
+        json.loads(args.old.read_text()),
+        json.loads(args.new.read_text()),
+        args.threshold,
+    )
+    for regression in regressions:
+        logger.warning('Regression: %s', regression)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
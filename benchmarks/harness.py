@@ -0,0 +1,178 @@
+"""Building blocks shared by the benchmark suites.
+
+A suite runs the FastAPI app in-process through ``httpx.ASGITransport``
+against a real PostgreSQL database, so the measured cost includes the
+whole request pipeline and every SQL round trip, but no network or
+server overhead.
+"""
+
+import asyncio
+import json
+import platform
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+type RequestFactory = Callable[[httpx.AsyncClient, int], Awaitable[None]]
+
+
+class QueryCounter:
+    """Count SQL statements executed through an engine."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Initialize the counter for an engine without attaching it.
+
+        Args:
+            engine (AsyncEngine): Engine whose statements are counted.
+
+        """
+        self._engine: AsyncEngine = engine
+        self.count: int = 0
+
+    def _on_execute(self, *_: Any) -> None:
+        self.count += 1
+
+    @contextmanager
+    def counting(self) -> Iterator['QueryCounter']:
+        """Count statements executed inside the block."""
+        self.count = 0
+        event.listen(
+            self._engine.sync_engine,
+            'before_cursor_execute',
+            self._on_execute,
+        )
+        try:
+            yield self
+        finally:
+            event.remove(
+                self._engine.sync_engine,
+                'before_cursor_execute',
+                self._on_execute,
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class FlowResult:
+    """Measurements of one benchmarked flow.
+
+    Attributes:
+        requests (int): Completed requests, including failed ones.
+        errors (int): Requests that raised or got an unexpected status.
+        concurrency (int): Requests in flight at the same time.
+        duration_s (float): Wall time of the whole flow.
+        throughput_rps (float): Completed requests per second.
+        p50_ms (float): Median request latency.
+        p95_ms (float): 95th percentile request latency.
+        p99_ms (float): 99th percentile request latency.
+        queries_per_request (float): Mean SQL statements per request.
+
+    """
+
+    requests: int
+    errors: int
+    concurrency: int
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries_per_request: float
+
+
+def _percentiles(latencies: list[float]) -> tuple[float, float, float]:
+    if len(latencies) < 2:  # noqa: PLR2004
+        value = latencies[0] if latencies else 0.0
+        return value, value, value
+    cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+    return cuts[49], cuts[94], cuts[98]
+
+
+async def run_flow(
+    client: httpx.AsyncClient,
+    query_counter: QueryCounter,
+    send_request: RequestFactory,
+    requests: int,
+    concurrency: int,
+) -> FlowResult:
+    """Send requests with bounded concurrency and measure them.
+
+    Args:
+        client (httpx.AsyncClient): Client bound to the app.
+        query_counter (QueryCounter): Counter of the app's engine.
+        send_request (RequestFactory): Sends the i-th request and raises
+            if the response is not the expected one.
+        requests (int): Number of requests to send.
+        concurrency (int): Requests in flight at the same time.
+
+    Returns:
+        FlowResult: Throughput, latency percentiles and query counts.
+
+    """
+    latencies: list[float] = []
+    errors = 0
+    next_index = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for index in next_index:
+            started = time.perf_counter()
+            try:
+                await send_request(client, index)
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    with query_counter.counting():
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - started
+    p50, p95, p99 = _percentiles(latencies)
+    return FlowResult(
+        requests=len(latencies),
+        errors=errors,
+        concurrency=concurrency,
+        duration_s=round(duration, 3),
+        throughput_rps=round(len(latencies) / duration, 1) if duration else 0,
+        p50_ms=round(p50, 2),
+        p95_ms=round(p95, 2),
+        p99_ms=round(p99, 2),
+        queries_per_request=round(
+            query_counter.count / len(latencies) if latencies else 0, 2
+        ),
+    )
+
+
+def write_results(
+    path: Path,
+    suite: str,
+    parameters: dict[str, Any],
+    results: dict[str, Any],
+) -> None:
+    """Save the results of a suite as JSON for later comparison.
+
+    Args:
+        path (Path): Output file, parent directories are created.
+        suite (str): Name of the benchmark suite.
+        parameters (dict[str, Any]): Settings the suite was run with.
+        results (dict[str, Any]): Result dataclasses by flow name.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        'suite': suite,
+        'created_at': datetime.now(UTC).isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'parameters': parameters,
+        'results': {name: asdict(result) for name, result in results.items()},
+    }
+    path.write_text(json.dumps(document, indent=2) + '\n')
@@ -0,0 +1,213 @@
+"""Cost of listing courses as ORM entities versus column projections.
+
+Lists the benchmark courses through ``BaseDAO.get_page`` followed by
+``model_validate`` of every entity, as the catalog endpoint did before,
+and through ``BaseDAO.get_page_projected``, which selects the response
+schema columns only. Both run sequentially on one session, so the
+numbers isolate the per-row cost. ``DB_DATABASE_URL`` must point to a
+disposable database migrated with ``alembic upgrade head``. Benchmark
+rows are identified by their email domain and slug prefix and are
+replaced on every run.
+
+Usage:
+    DB_DATABASE_URL=<bench database URL> python -m benchmarks.projection
+        [--rows 10000] [--repeat 20]
+
+Compare two runs with ``python -m benchmarks.compare OLD NEW``.
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import delete, insert
+
+from benchmarks.harness import QueryCounter, write_results
+from src.courses.dao import CourseDAO
+from src.courses.enums import (
+    AvailableLanguagesEnum,
+    CourseLevelEnum,
+    CurrencyEnum,
+)
+from src.courses.models import Course
+from src.courses.schemas import BaseCourseResponseSchema
+from src.database import async_db_session, engine
+from src.users.models import Author, User
+
+logger = logging.getLogger(__name__)
+
+EMAIL = 'author@projection.bench.example.com'
+SLUG_PREFIX = 'bench-projection-'
+ORDER_BY = ('-rating', '-created_at', '-id')
+
+
+@dataclass(frozen=True, slots=True)
+class ListingResult:
+    """Measurements of one way of listing the courses.
+
+    Attributes:
+        rows (int): Courses returned per listing.
+        p50_ms (float): Median listing latency.
+        p95_ms (float): 95th percentile listing latency.
+        rows_per_s (float): Courses listed per second.
+        queries_per_request (float): SQL statements per listing.
+
+    """
+
+    rows: int
+    p50_ms: float
+    p95_ms: float
+    rows_per_s: float
+    queries_per_request: float
+
+
+async def seed_courses(count: int) -> None:
+    """Replace the benchmark courses with ``count`` active ones."""
+    user_id, author_id = uuid.uuid4(), uuid.uuid4()
+    async with async_db_session() as session, session.begin():
+        await session.execute(delete(User).where(User.email == EMAIL))
+        await session.execute(
+            insert(User),
+            [
+                {
+                    'id': user_id,
+                    'name': 'Bench',
+                    'surname': 'Author',
+                    'email': EMAIL,
+                    'password': '!',
+                }
+            ],
+        )
+        await session.execute(
+            insert(Author),
+            [{'id': author_id, 'user_id': user_id, 'slug': f'{SLUG_PREFIX}a'}],
+        )
+        await session.execute(
+            insert(Course),
+            [
+                {
+                    'slug': f'{SLUG_PREFIX}{index}',
+                    'title': f'Benchmark course {index}',
+                    'description': 'A course seeded by the benchmark. ' * 10,
+                    'level': CourseLevelEnum.BASIC,
+                    'logo': 'https://bench.example.com/logo.png',
+                    'author_id': author_id,
+                    'is_active': True,
+                    'rating': Decimal(index % 5),
+                    'price': Decimal('10.00'),
+                    'currency': CurrencyEnum.USD,
+                    'language': AvailableLanguagesEnum.EN,
+                }
+                for index in range(count)
+            ],
+        )
+
+
+async def _measure(
+    listing: Callable[[], Awaitable[int]],
+    repeat: int,
+    query_counter: QueryCounter,
+) -> ListingResult:
+    await listing()  # Warm up caches and the connection
+    latencies: list[float] = []
+    rows = 0
+    with query_counter.counting():
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = await listing()
+            latencies.append((time.perf_counter() - started) * 1000)
+    cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+    return ListingResult(
+        rows=rows,
+        p50_ms=round(cuts[49], 2),
+        p95_ms=round(cuts[94], 2),
+        rows_per_s=round(rows * repeat / (sum(latencies) / 1000), 1),
+        queries_per_request=round(query_counter.count / repeat, 2),
+    )
+
+
+async def run_suite(rows: int, repeat: int) -> dict[str, ListingResult]:
+    """Seed the courses and measure both ways of listing them.
+
+    Args:
+        rows (int): Number of seeded courses, all listed at once.
+        repeat (int): Listings per measurement.
+
+    Returns:
+        dict[str, ListingResult]: Results by listing name.
+
+    """
+    await seed_courses(rows)
+    query_counter = QueryCounter(engine)
+    filters = (Course.slug.startswith(SLUG_PREFIX),)
+
+    async def list_entities() -> int:
+        async with async_db_session() as session, session.begin():
+            page = await CourseDAO(session, Course).get_page(
+                *filters, order_by=ORDER_BY, limit=rows
+            )
+            items = [
+                BaseCourseResponseSchema.model_validate(course)
+                for course in page.items
+            ]
+        return len(items)
+
+    async def list_projected() -> int:
+        async with async_db_session() as session, session.begin():
+            page = await CourseDAO(session, Course).get_page_projected(
+                BaseCourseResponseSchema,
+                *filters,
+                order_by=ORDER_BY,
+                limit=rows,
+            )
+        return len(page.items)
+
+    return {
+        'orm_entities': await _measure(list_entities, repeat, query_counter),
+        'projection': await _measure(list_projected, repeat, query_counter),
+    }
+
+
+def main() -> None:
+    """Run the projection benchmark and save its results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=Path('benchmarks/results')
+        / f'projection-{datetime.now(UTC):%Y%m%dT%H%M%S}.json',
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    engine.sync_engine.echo = False
+    results = asyncio.run(run_suite(args.rows, args.repeat))
+    write_results(
+        args.output,
+        'projection',
+        {'rows': args.rows, 'repeat': args.repeat},
+        results,
+    )
+    for name, result in results.items():
+        logger.info(
+            '%-14s %6d rows  p50 %8.2f ms  p95 %8.2f ms  %10.1f rows/s',
+            name,
+            result.rows,
+            result.p50_ms,
+            result.p95_ms,
+            result.rows_per_s,
+        )
+    logger.info('Results saved to %s', args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Encode and decode throughput of the JWT signing backends.
+
+Compares the previous way of signing, python-jose called with the raw
+secret string, against every SigningBackend with its keys parsed once.
+Keys are generated for the run, no settings or database are needed.
+
+Usage:
+    python -m benchmarks.signing [--iterations 2000]
+"""
+
+import argparse
+import logging
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import ecdsa  # type: ignore[import-untyped]
+import rsa
+from jose import jwt
+from jose.backends import ECKey
+
+from benchmarks.harness import write_results
+from src.auth.services.signing import (
+    AsymmetricSigningBackend,
+    HMACSigningBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+SECRET = 'benchmark-secret'  # noqa: S105
+
+
+@dataclass(frozen=True, slots=True)
+class SigningResult:
+    """Throughput of one way of signing tokens.
+
+    Attributes:
+        encode_per_s (float): Tokens signed per second.
+        decode_per_s (float): Tokens verified and decoded per second.
+
+    """
+
+    encode_per_s: float
+    decode_per_s: float
+
+
+def _per_second(func: Callable[[], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return round(iterations / (time.perf_counter() - started), 1)
+
+
+def _measure(
+    encode: Callable[[dict[str, Any]], str],
+    decode: Callable[[str], dict[str, Any]],
+    iterations: int,
+) -> SigningResult:
+    claims = {
+        'sub': str(uuid.uuid4()),
+        'jti': uuid.uuid4().hex,
+        'exp': datetime.now(UTC) + timedelta(minutes=15),
+    }
+    token = encode(claims)
+    return SigningResult(
+        encode_per_s=_per_second(lambda: encode(claims), iterations),
+        decode_per_s=_per_second(lambda: decode(token), iterations),
+    )
+
+
+def run_suite(iterations: int) -> dict[str, SigningResult]:
+    """Measure every signing backend.
+
+    Args:
+        iterations (int): Tokens encoded and decoded per backend.
+
+    Returns:
+        dict[str, SigningResult]: Results by backend name.
+
+    """
+    hmac_backend = HMACSigningBackend('HS256', SECRET)
+    ec_backend = AsymmetricSigningBackend(
+        'ES256',
+        'bench',
+        ecdsa.SigningKey.generate(curve=ecdsa.NIST256p).to_pem(),
+    )
+    _, rsa_private_key = rsa.newkeys(2048)
+    rsa_backend = AsymmetricSigningBackend(
+        'RS256', 'bench', rsa_private_key.save_pkcs1()
+    )
+    return {
+        'hs256_raw_secret': _measure(
+            lambda claims: jwt.encode(claims, SECRET, algorithm='HS256'),
+            lambda token: jwt.decode(token, SECRET, algorithms='HS256'),
+            iterations,
+        ),
+        'hs256': _measure(hmac_backend.encode, hmac_backend.decode, iterations),
+        'es256': _measure(ec_backend.encode, ec_backend.decode, iterations),
+        'rs256': _measure(rsa_backend.encode, rsa_backend.decode, iterations),
+    }
+
+
+def main() -> None:
+    """Run the signing benchmark and save its results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=Path('benchmarks/results')
+        / f'signing-{datetime.now(UTC):%Y%m%dT%H%M%S}.json',
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    results = run_suite(args.iterations)
+    write_results(
+        args.output,
+        'signing',
+        # python-jose uses cryptography when installed, pure Python else
+        {'iterations': args.iterations, 'jose_backend': ECKey.__module__},
+        results,
+    )
+    for name, result in results.items():
+        logger.info(
+            '%-18s encode %9.1f/s  decode %9.1f/s',
+            name,
+            result.encode_per_s,
+            result.decode_per_s,
+        )
+    logger.info('Results saved to %s', args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""Per-call overhead of preparing the BaseDAO lookup statements.
+
+Compares building a fresh ``select()`` for every call, as BaseDAO did
+before, with reusing the cached lookup statements. Each call covers
+what SQLAlchemy does before sending SQL: building the statement,
+generating its cache key and finding the compiled form in the
+compiled cache. No database is contacted, but ``DB_DATABASE_URL`` and
+``PAGINATION_CURSOR_SECRET`` must be set for the settings to load.
+
+Usage:
+    DB_DATABASE_URL=<any database URL> PAGINATION_CURSOR_SECRET=<any>
+        python -m benchmarks.statements [--iterations 20000]
+"""
+
+import argparse
+import logging
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import configure_mappers, selectinload
+from sqlalchemy.util import LRUCache
+
+from benchmarks.harness import write_results
+from src.base.dao import BaseDAO
+from src.courses.models import Course
+from src.database import async_db_session, engine
+from src.lessons.models import Lesson
+from src.users.models import Author, User
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class StatementResult:
+    """Overhead of preparing one lookup statement.
+
+    Attributes:
+        calls_per_s (float): Statements prepared per second.
+        per_call_us (float): Microseconds spent per statement.
+
+    """
+
+    calls_per_s: float
+    per_call_us: float
+
+
+@dataclass(frozen=True, slots=True)
+class Lookup:
+    """A fixed-shape lookup made by the services."""
+
+    model: type[Any]
+    filters_by: dict[str, Any]
+    relations: tuple[str, ...] = ()
+
+
+LOOKUPS = {
+    'user_by_id': Lookup(User, {'id': uuid.uuid4(), 'is_active': True}),
+    'user_by_email': Lookup(
+        User,
+        {'email': 'user@bench.example.com', 'is_active': True},
+        ('author',),
+    ),
+    'author_by_user_id': Lookup(
+        Author, {'user_id': uuid.uuid4(), 'is_verified': True}, ('user',)
+    ),
+    'course_with_lessons': Lookup(
+        Course, {'id': uuid.uuid4(), 'author_id': uuid.uuid4()}, ('lessons',)
+    ),
+    'lesson_with_course': Lookup(Lesson, {'id': uuid.uuid4()}, ('course',)),
+}
+
+
+def _build_dynamic(lookup: Lookup) -> Select[Any]:
+    """Build the statement the way BaseDAO did before caching."""
+    return (
+        select(lookup.model)
+        .filter_by(**lookup.filters_by)
+        .options(
+            *(
+                selectinload(getattr(lookup.model, relation))
+                for relation in lookup.relations
+            )
+        )
+    )
+
+
+def _measure(
+    build: Callable[[], Select[Any]], iterations: int
+) -> StatementResult:
+    compiled_cache: LRUCache[Any, Any] = LRUCache(100)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        # What Connection.execute does before reaching the DBAPI
+        build()._compile_w_cache(  # noqa: SLF001
+            engine.dialect, compiled_cache=compiled_cache, column_keys=[]
+        )
+    elapsed = time.perf_counter() - started
+    return StatementResult(
+        calls_per_s=round(iterations / elapsed, 1),
+        per_call_us=round(elapsed / iterations * 1e6, 2),
+    )
+
+
+def run_suite(iterations: int) -> dict[str, StatementResult]:
+    """Measure every lookup, built fresh and cached.
+
+    Args:
+        iterations (int): Statements prepared per lookup and variant.
+
+    Returns:
+        dict[str, StatementResult]: Results by lookup and variant name.
+
+    """
+    configure_mappers()
+    session = async_db_session()
+    results: dict[str, StatementResult] = {}
+    for name, lookup in LOOKUPS.items():
+        dao: BaseDAO[Any] = BaseDAO(session, lookup.model)
+        filter_names = tuple(sorted(lookup.filters_by))
+        results[f'{name}.dynamic'] = _measure(
+            partial(_build_dynamic, lookup), iterations
+        )
+        results[f'{name}.cached'] = _measure(
+            partial(
+                dao._get_lookup_statement,  # noqa: SLF001
+                filter_names,
+                lookup.relations,
+            ),
+            iterations,
+        )
+    return results
+
+
+def main() -> None:
+    """Run the statement benchmark and save its results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=20000)
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=Path('benchmarks/results')
+        / f'statements-{datetime.now(UTC):%Y%m%dT%H%M%S}.json',
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    results = run_suite(args.iterations)
+    write_results(
+        args.output, 'statements', {'iterations': args.iterations}, results
+    )
+    for name, result in results.items():
+        logger.info(
+            '%-30s %9.1f/s  %7.2f us/call',
+            name,
+            result.calls_per_s,
+            result.per_call_us,
+        )
+    logger.info('Results saved to %s', args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -20,8 +20,9 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 
 from src.database import Base
+from src.base.models import RateLimitBucket
 from src.users.models import User, Author, UserCourses
-from src.auth.models import RefreshToken
+from src.auth.models import RefreshToken, RevokedAccessToken
 from src.courses.models import Course
 from src.lessons.models import Lesson
 target_metadata = Base.metadata
@@ -0,0 +1,82 @@
+"""refresh token expires at
+
+Revision ID: d41f8a6c2e07
+Revises: b7e2c94d1a3f
+Create Date: 2026-10-17 11:03:27.194502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f8a6c2e07'
+down_revision: Union[str, None] = 'b7e2c94d1a3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'refresh_tokens',
+        sa.Column('expires_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.execute(
+        "UPDATE refresh_tokens "
+        "SET expires_at = created_at + expires_in * interval '1 second'"
+    )
+    op.alter_column('refresh_tokens', 'expires_at', nullable=False)
+    op.drop_column('refresh_tokens', 'expires_in')
+    op.create_index(
+        op.f('ix_refresh_tokens_expires_at'),
+        'refresh_tokens',
+        ['expires_at'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_refresh_tokens_user_id'),
+        'refresh_tokens',
+        ['user_id'],
+        unique=False,
+    )
+    op.drop_index(
+        op.f('ix_refresh_tokens_refresh_token'), table_name='refresh_tokens'
+    )
+    op.create_index(
+        op.f('ix_refresh_tokens_refresh_token'),
+        'refresh_tokens',
+        ['refresh_token'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f('ix_refresh_tokens_refresh_token'), table_name='refresh_tokens'
+    )
+    op.create_index(
+        op.f('ix_refresh_tokens_refresh_token'),
+        'refresh_tokens',
+        ['refresh_token'],
+        unique=False,
+    )
+    op.drop_index(
+        op.f('ix_refresh_tokens_user_id'), table_name='refresh_tokens'
+    )
+    op.drop_index(
+        op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens'
+    )
+    op.add_column(
+        'refresh_tokens',
+        sa.Column('expires_in', sa.Float(), nullable=True),
+    )
+    op.execute(
+        'UPDATE refresh_tokens '
+        'SET expires_in = extract(epoch FROM expires_at - created_at)'
+    )
+    op.alter_column('refresh_tokens', 'expires_in', nullable=False)
+    op.drop_column('refresh_tokens', 'expires_at')
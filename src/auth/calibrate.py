@@ -0,0 +1,49 @@
+"""Measure bcrypt on this host and report the cost fitting the budget.
+
+Usage:
+    python -m src.auth.calibrate [--target-ms 250] [--min-rounds 10]
+        [--max-rounds 16]
+
+Defaults are taken from HasherSettings. Put the reported value into
+HASHER_ROUNDS so that every worker hashes with the same cost.
+"""
+
+import argparse
+import logging
+
+from src.auth.services.hasher import calibrate_rounds
+from src.logger import configure_logging
+from src.settings import Settings
+
+logger = logging.getLogger(__name__)
+settings = Settings.load()
+
+
+def main() -> None:
+    """Run the bcrypt cost calibration."""
+    configure_logging()
+    hasher_settings = settings.hasher_settings
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--target-ms', type=float, default=hasher_settings.TARGET_HASH_MS
+    )
+    parser.add_argument(
+        '--min-rounds', type=int, default=hasher_settings.MIN_ROUNDS
+    )
+    parser.add_argument(
+        '--max-rounds', type=int, default=hasher_settings.MAX_ROUNDS
+    )
+    args = parser.parse_args()
+    rounds = calibrate_rounds(
+        args.target_ms / 1000, args.min_rounds, args.max_rounds
+    )
+    logger.info(
+        'bcrypt cost %d fits the %.0f ms budget: HASHER_ROUNDS=%d',
+        rounds,
+        args.target_ms,
+        rounds,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    Row,
+    delete,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql import func
+
+from src.auth.models import RefreshToken, RevokedAccessToken
+from src.auth.schemas import CreateRefreshTokenSchema
+from src.base.dao import BaseDAO
+from src.users.models import Author, User
+
+
+class RefreshTokenDAO(BaseDAO[RefreshToken, CreateRefreshTokenSchema]):
+    """Data Access Object for RefreshToken model.
+
+    Provides the atomic issue and rotation of a refresh token and the
+    batched cleanup of expired tokens in addition to the common
+    operations.
+    """
+
+    async def replace_user_tokens(
+        self,
+        user_id: uuid.UUID,
+        hashed_password: str,
+        refresh_token: uuid.UUID,
+        expires_at: datetime,
+    ) -> bool:
+        """Replace all refresh tokens of a user with a new one.
+
+        The old tokens are deleted and the new one is inserted by a single
+        statement with a data-modifying CTE. Nothing is changed unless the
+        user is still active and still has the given password hash, which
+        closes the gap between the credentials check and the token issue.
+
+        Args:
+            user_id (uuid.UUID): ID of the user the token is issued for.
+            hashed_password (str): Password hash the credentials were
+                verified against.
+            refresh_token (uuid.UUID): New refresh token.
+            expires_at (datetime): Expiration time of the new token.
+
+        Returns:
+            bool: True if the token was issued.
+
+        """
+        owner = (
+            select(User.id)
+            .where(
+                User.id == user_id,
+                User.is_active.is_(True),
+                User.password == hashed_password,
+            )
+            .cte('owner')
+        )
+        deleted = (
+            delete(RefreshToken)
+            .where(RefreshToken.user_id.in_(select(owner.c.id)))
+            .cte('deleted')
+        )
+        query = (
+            insert(RefreshToken)
+            .from_select(
+                ['refresh_token', 'expires_at', 'user_id'],
+                select(
+                    literal(refresh_token, RefreshToken.refresh_token.type),
+                    literal(expires_at, RefreshToken.expires_at.type),
+                    owner.c.id,
+                ),
+            )
+            .add_cte(deleted)
+            .returning(RefreshToken.id)
+        )
+        issued_id: int | None = await self.session.scalar(query)
+        return issued_id is not None
+
+    async def rotate_token(
+        self,
+        refresh_token: uuid.UUID,
+        new_refresh_token: uuid.UUID,
+        expires_at: datetime,
+    ) -> Row[Any] | None:
+        """Replace a valid refresh token with a new one in one statement.
+
+        The token is only replaced if it exists, has not expired and
+        belongs to an active user. Concurrent rotations of the same token
+        are serialized by the row lock, and every one but the first
+        matches no row.
+
+        Args:
+            refresh_token (uuid.UUID): Refresh token to rotate.
+            new_refresh_token (uuid.UUID): Refresh token replacing it.
+            expires_at (datetime): Expiration time of the new token.
+
+        Returns:
+            Row[Any] | None: The user's id, role, is_active,
+                token_version, author_id and author_is_verified, or None
+                if the token could not be rotated.
+
+        """
+        query = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.refresh_token == refresh_token,
+                RefreshToken.expires_at > func.now(),
+                RefreshToken.user_id == User.id,
+                User.is_active.is_(True),
+            )
+            .values(
+                refresh_token=new_refresh_token,
+                expires_at=expires_at,
+                created_at=func.now(),
+            )
+            .returning(
+                User.id,
+                User.role,
+                User.is_active,
+                User.token_version,
+                select(Author.id)
+                .where(Author.user_id == User.id)
+                .scalar_subquery()
+                .label('author_id'),
+                select(Author.is_verified)
+                .where(Author.user_id == User.id)
+                .scalar_subquery()
+                .label('author_is_verified'),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.one_or_none()
+
+    async def delete_expired(self, limit: int) -> int:
+        """Delete a batch of expired refresh tokens.
+
+        Rows locked by concurrent transactions are skipped, so several
+        workers can clean up at the same time without waiting on each
+        other.
+
+        Args:
+            limit (int): Maximum number of rows to delete.
+
+        Returns:
+            int: Number of deleted rows.
+
+        """
+        expired = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at <= func.now())
+            .order_by(RefreshToken.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            delete(RefreshToken)
+            .where(RefreshToken.id.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.rowcount
+
+
+class RevokedAccessTokenDAO(BaseDAO[RevokedAccessToken]):
+    """Data Access Object for RevokedAccessToken model."""
+
+    async def revoke(
+        self,
+        key: str,
+        revoked_at: datetime,
+        expires_at: datetime,
+        user_id: uuid.UUID | str | None = None,
+    ) -> None:
+        """Store a revocation, renewing it if the key is already revoked.
+
+        Args:
+            key (str): Revocation key, see RevokedAccessToken.
+            revoked_at (datetime): Time of the revocation.
+            expires_at (datetime): Time after which no token revoked by
+                the key can be valid.
+            user_id (uuid.UUID | str | None): User whose tokens are all
+                revoked. Their current token version, as bumped by the
+                transaction, is stored as the cut-off.
+
+        """
+        token_version = (
+            select(User.token_version)
+            .where(User.id == user_id)
+            .scalar_subquery()
+            if user_id is not None
+            else None
+        )
+        insert_query = pg_insert(RevokedAccessToken).values(
+            key=key,
+            revoked_at=revoked_at,
+            expires_at=expires_at,
+            token_version=token_version,
+        )
+        query = insert_query.on_conflict_do_update(
+            index_elements=[RevokedAccessToken.key],
+            set_={
+                'revoked_at': revoked_at,
+                'expires_at': func.greatest(
+                    RevokedAccessToken.expires_at, expires_at
+                ),
+                'token_version': insert_query.excluded.token_version,
+            },
+        )
+        await self.session.execute(query)
+
+    async def get_active_keys(self) -> list[str]:
+        """Return the keys of all revocations that haven't expired."""
+        query = select(RevokedAccessToken.key).where(
+            RevokedAccessToken.expires_at > func.now()
+        )
+        result = await self.session.scalars(query)
+        return list(result.all())
+
+    async def get_revocations(
+        self, keys: list[str]
+    ) -> dict[str, int | None]:
+        """Return the token version cut-off of each revoked key.
+
+        Args:
+            keys (list[str]): Revocation keys to look up.
+
+        Returns:
+            dict[str, int | None]: Token version by key, None for single
+                tokens, for the keys with a revocation that hasn't
+                expired.
+
+        """
+        query = select(
+            RevokedAccessToken.key, RevokedAccessToken.token_version
+        ).where(
+            RevokedAccessToken.key.in_(keys),
+            RevokedAccessToken.expires_at > func.now(),
+        )
+        result = await self.session.execute(query)
+        return dict(result.tuples().all())
+
+    async def delete_expired(self, limit: int) -> int:
+        """Delete a batch of expired revocations.
+
+        Args:
+            limit (int): Maximum number of rows to delete.
+
+        Returns:
+            int: Number of deleted rows.
+
+        """
+        expired = (
+            select(RevokedAccessToken.key)
+            .where(RevokedAccessToken.expires_at <= func.now())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            delete(RevokedAccessToken)
+            .where(RevokedAccessToken.key.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.rowcount
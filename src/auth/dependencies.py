@@ -1,32 +1,164 @@
+import hmac
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Header
 from fastapi.params import Security
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from starlette.requests import Request
 
-from src.auth.services import AuthService
+from src.auth.exceptions import (
+    AccessTokenOutdatedException,
+    AccessTokenRevokedException,
+    IntrospectionForbiddenException,
+    TooManyLoginAttemptsException,
+)
+from src.auth.revocation import revocation_list
+from src.auth.schemas import UserPrincipal
+from src.auth.services import AuthService, TokenManager
 from src.base.dependencies import get_service
+from src.base.rate_limit import TokenBucketLimiter, create_rate_limit_backend
+from src.settings import Settings
 from src.users.exceptions import UserNotAuthorizedException
 from src.users.models import User
 from src.users.permissions.user import BaseUserPermission
 from src.users.services import UserService
 
+settings = Settings.load()
+
 oauth_scheme: OAuth2PasswordBearer = OAuth2PasswordBearer(
     tokenUrl='/auth/login',
     auto_error=False,
 )
 
+_rate_limit_backend = create_rate_limit_backend(settings.rate_limit_settings)
+_login_ip_limiter = TokenBucketLimiter(
+    'login_ip',
+    _rate_limit_backend,
+    capacity=settings.rate_limit_settings.LOGIN_IP_BURST,
+    per_minute=settings.rate_limit_settings.LOGIN_IP_PER_MINUTE,
+)
+_login_email_limiter = TokenBucketLimiter(
+    'login_email',
+    _rate_limit_backend,
+    capacity=settings.rate_limit_settings.LOGIN_EMAIL_BURST,
+    per_minute=settings.rate_limit_settings.LOGIN_EMAIL_PER_MINUTE,
+)
+
+
+async def check_login_rate_limit(
+    request: Request,
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+) -> None:
+    """Throttle login attempts per client IP and per email.
+
+    Runs before the user lookup and the password check, so a burst of
+    attempts is rejected without spending database or bcrypt time.
+
+    Raises:
+        TooManyLoginAttemptsException: If either limit is exceeded.
+
+    """
+    client_ip: str = request.client.host if request.client else 'unknown'
+    retry_after: int = await _login_ip_limiter.check(client_ip)
+    if not retry_after:
+        retry_after = await _login_email_limiter.check(
+            form_data.username.strip().lower()
+        )
+    if retry_after:
+        raise TooManyLoginAttemptsException(retry_after)
 
-async def _get_optional_user_from_jwt(
+
+async def verify_introspection_secret(
+    x_introspection_secret: Annotated[str | None, Header()] = None,
+) -> None:
+    """Allow only internal services knowing the shared secret.
+
+    The endpoint stays closed while no secret is configured.
+
+    Raises:
+        IntrospectionForbiddenException: If the secret is missing or wrong.
+
+    """
+    secret: str = settings.token_settings.INTROSPECTION_SECRET
+    if (
+        not secret
+        or not x_introspection_secret
+        or not hmac.compare_digest(
+            secret.encode(), x_introspection_secret.encode()
+        )
+    ):
+        raise IntrospectionForbiddenException
+
+
+async def _get_optional_claims_from_jwt(
     token: Annotated[str, Security(oauth_scheme)],
-    auth_service: Annotated[AuthService, Depends(get_service(AuthService))],
-    user_service: Annotated[UserService, Depends(get_service(UserService))],
-) -> User | None:
+) -> dict[str, str | int] | None:
+    """Return verified claims of the bearer token, if a token was sent.
+
+    FastAPI caches dependency results per request, so every dependency
+    that needs the token shares a single verification. Tokens that were
+    never revoked pass the revocation check without a query.
+
+    Raises:
+        AccessTokenRevokedException: If the token has been revoked.
+
+    """
     if not token:
         return None
-    user_id = await auth_service.validate_token_for_user(token)
-    return await user_service.get_user_by_id(user_id)
+    claims = TokenManager.verify_access_token(token)
+    if await revocation_list.is_revoked(claims):
+        raise AccessTokenRevokedException
+    return claims
+
+
+def _has_authorization_claims(claims: dict[str, str | int]) -> bool:
+    """Check if the request can be authorized from the token claims.
+
+    Tokens issued before claims authorization was enabled carry no
+    role and are authorized from the database until they expire.
+    """
+    return settings.token_settings.CLAIMS_AUTH and 'role' in claims
+
+
+async def _get_principal_from_claims(
+    claims: dict[str, str | int], user_service: UserService
+) -> UserPrincipal:
+    """Build the user principal from claims and check they are current.
+
+    Only the token version is looked up, which is served from the
+    identity cache. Deactivation, role changes and becoming an author
+    bump the version, so tokens issued before are rejected.
+
+    Raises:
+        WrongCredentialsException: If the claims are invalid.
+        AccessTokenOutdatedException: If the user is inactive or the
+            token version is outdated.
+
+    """
+    principal = UserPrincipal.from_claims(claims)
+    token_version = await user_service.get_token_version(principal.id)
+    if token_version != principal.token_version:
+        raise AccessTokenOutdatedException
+    return principal
+
+
+async def _get_optional_principal_from_jwt(
+    claims: Annotated[
+        dict[str, str | int] | None, Depends(_get_optional_claims_from_jwt)
+    ],
+    user_service: Annotated[UserService, Depends(get_service(UserService))],
+) -> User | UserPrincipal | None:
+    """Return the identity behind the bearer token, if a token was sent.
+
+    In claims authorization mode the identity is a UserPrincipal built
+    from the token, otherwise the active User is loaded.
+    """
+    if not claims:
+        return None
+    if _has_authorization_claims(claims):
+        return await _get_principal_from_claims(claims, user_service)
+    user_id = AuthService.get_user_id_from_jwt(claims)
+    return await user_service.get_current_user(user_id)
 
 
 class UserPermissionDependency:
@@ -44,6 +176,10 @@ class UserPermissionDependency:
     and calling its validate_permission() method.
     If any permission check fails, an exception is raised.
 
+    With load_user=False the identity used for the permission checks is
+    returned as is. In claims authorization mode that is a UserPrincipal,
+    so routes that only need the user's ID or role skip the user lookup.
+
     Usage:
         @app.get("/protected")
         async def protected_route(
@@ -54,21 +190,33 @@ class UserPermissionDependency:
             return {"message": "Access granted"}
     """
 
-    def __init__(self, permissions: list[type[BaseUserPermission]]):
+    def __init__(
+        self,
+        permissions: list[type[BaseUserPermission]],
+        *,
+        load_user: bool = True,
+    ):
         """Initialize the permission dependency with a list of permissions.
 
         Args:
             permissions (list[type[BaseUserPermission]]): List of permission
                 classes to validate against the current user context.
+            load_user (bool): Return the User model instead of the token
+                identity. Defaults to True.
 
         """
         self.permissions = permissions
+        self.load_user = load_user
 
     async def __call__(
         self,
         request: Request,
-        user: Annotated[User | None, Depends(_get_optional_user_from_jwt)],
-    ) -> User:
+        user: Annotated[
+            User | UserPrincipal | None,
+            Depends(_get_optional_principal_from_jwt),
+        ],
+        user_service: Annotated[UserService, Depends(get_service(UserService))],
+    ) -> User | UserPrincipal:
         """Callable used as a FastAPI dependency.
 
         It receives the request and
@@ -84,4 +232,6 @@ class UserPermissionDependency:
         # Just to be sure that the user is authenticated after the permission.
         if not user:
             raise UserNotAuthorizedException
+        if self.load_user and isinstance(user, UserPrincipal):
+            return await user_service.get_current_user(user.id)
         return user
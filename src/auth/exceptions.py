@@ -20,6 +20,25 @@ class AccessTokenExpiredException(HTTPException):
         super().__init__(status_code=404, detail='Access token expired')
 
 
+class AccessTokenRevokedException(HTTPException):
+    """Custom exception for when an access token has been revoked."""
+
+    def __init__(self) -> None:
+        """Initialize the AccessTokenRevokedException with status 404."""
+        super().__init__(status_code=404, detail='Access token revoked')
+
+
+class AccessTokenOutdatedException(HTTPException):
+    """Custom exception for when access token claims are out of date."""
+
+    def __init__(self) -> None:
+        """Initialize the AccessTokenOutdatedException with status 404."""
+        super().__init__(
+            status_code=404,
+            detail='Access token is outdated, refresh it',
+        )
+
+
 class RefreshTokenException(HTTPException):
     """Custom exception for when a refresh token is invalid."""
 
@@ -32,3 +51,55 @@ class RefreshTokenException(HTTPException):
             "expired, doesn't exist or"
             ' attached to deleted user.',
         )
+
+
+class TooManyLoginAttemptsException(HTTPException):
+    """Custom exception for when login attempts are rate limited."""
+
+    def __init__(self, retry_after: int) -> None:
+        """Initialize the TooManyLoginAttemptsException with status 429.
+
+        Args:
+            retry_after (int): Seconds until the next attempt is allowed.
+
+        """
+        super().__init__(
+            status_code=429,
+            detail='Too many login attempts. Try again later.',
+            headers={'Retry-After': str(retry_after)},
+        )
+
+
+class PasswordHasherBusyException(HTTPException):
+    """Custom exception for when the password hashing pool is saturated."""
+
+    def __init__(self) -> None:
+        """Initialize the PasswordHasherBusyException with status 503."""
+        super().__init__(
+            status_code=503,
+            detail='Authentication service is busy. Try again later.',
+            headers={'Retry-After': '1'},
+        )
+
+
+class PasswordHasherTimeoutException(HTTPException):
+    """Custom exception for when password hashing takes too long."""
+
+    def __init__(self) -> None:
+        """Initialize the PasswordHasherTimeoutException with status 503."""
+        super().__init__(
+            status_code=503,
+            detail='Authentication service timed out. Try again later.',
+            headers={'Retry-After': '1'},
+        )
+
+
+class IntrospectionForbiddenException(HTTPException):
+    """Custom exception for when an introspection caller is not trusted."""
+
+    def __init__(self) -> None:
+        """Initialize the IntrospectionForbiddenException with status 403."""
+        super().__init__(
+            status_code=403,
+            detail='Token introspection is not allowed',
+        )
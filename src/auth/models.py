@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, ForeignKey
+from sqlalchemy import TIMESTAMP, ForeignKey, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -15,7 +15,7 @@ class RefreshToken(Base):
     Attributes:
         id (int): Primary key identifier of the refresh session.
         refresh_token (uuid.UUID): Unique refresh token.
-        expires_in (float): Expiration time (in seconds or timestamp).
+        expires_at (datetime): Timestamp when the refresh token expires.
         created_at (datetime): Timestamp when the refresh session was created.
         user_id (uuid.UUID): Foreign key referencing the associated user.
 
@@ -27,8 +27,14 @@ class RefreshToken(Base):
         primary_key=True,
         index=True,
     )
-    refresh_token: Mapped[uuid.UUID] = mapped_column(UUID, index=True)
-    expires_in: Mapped[float]
+    refresh_token: Mapped[uuid.UUID] = mapped_column(
+        UUID, unique=True, index=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        index=True,
+    )
+    token_version: Mapped[int | None] = mapped_column()
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=func.now(),
@@ -36,4 +42,36 @@ class RefreshToken(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID,
         ForeignKey('users.id', ondelete='CASCADE'),
+        index=True,
+    )
+
+
+class RevokedAccessToken(Base):
+    """SQLAlchemy model of an access token revocation.
+
+    The key is either ``jti:<token ID>`` for a single token or
+    ``sub:<user ID>`` for every token of a user carrying a token version
+    older than ``token_version``. A row is only needed until
+    ``expires_at``, when all tokens it revokes have expired anyway.
+
+    Attributes:
+        key (str): Revoked token ID or user ID with its kind prefix.
+        revoked_at (datetime): Timestamp of the revocation.
+        expires_at (datetime): Timestamp after which the row is obsolete.
+        token_version (int | None): Token version of the user once
+            revoked, None for a single token.
+
+    """
+
+    __tablename__ = 'revoked_access_tokens'
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    revoked_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        index=True,
     )
+    token_version: Mapped[int | None] = mapped_column()
@@ -0,0 +1,127 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+
+from prometheus_client import Counter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dao import RefreshTokenDAO, RevokedAccessTokenDAO
+from src.auth.models import RefreshToken, RevokedAccessToken
+from src.database import async_db_session
+from src.settings import Settings, TokenSettings
+
+logger = logging.getLogger(__name__)
+settings = Settings.load()
+
+REFRESH_TOKENS_REAPED_TOTAL = Counter(
+    'auth_refresh_tokens_reaped_total',
+    'Expired refresh tokens deleted by the reaper.',
+)
+REVOCATIONS_REAPED_TOTAL = Counter(
+    'auth_access_token_revocations_reaped_total',
+    'Expired access token revocations deleted by the reaper.',
+)
+
+
+class RefreshTokenReaper:
+    """Background task deleting expired refresh tokens.
+
+    Expired tokens are deleted in bounded batches, each in its own short
+    transaction, so the cleanup never holds many row locks or a long
+    transaction on the refresh_tokens table. Expired access token
+    revocations are deleted the same way.
+    """
+
+    def __init__(self, interval: float, batch_size: int) -> None:
+        """Initialize the reaper without starting it.
+
+        Args:
+            interval (float): Seconds between cleanup runs.
+            batch_size (int): Maximum rows deleted per transaction.
+
+        """
+        self._interval: float = interval
+        self._batch_size: int = batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_settings(
+        cls, token_settings: TokenSettings
+    ) -> 'RefreshTokenReaper':
+        """Create a reaper configured from TokenSettings."""
+        return cls(
+            interval=token_settings.REAPER_INTERVAL_SECONDS,
+            batch_size=token_settings.REAPER_BATCH_SIZE,
+        )
+
+    async def _delete_in_batches(
+        self, delete_batch: Callable[[AsyncSession], Awaitable[int]]
+    ) -> int:
+        total = 0
+        while True:
+            async with async_db_session() as session, session.begin():
+                deleted = await delete_batch(session)
+            total += deleted
+            if deleted < self._batch_size:
+                return total
+
+    async def reap(self) -> int:
+        """Delete all currently expired refresh tokens batch by batch.
+
+        Returns:
+            int: Number of deleted tokens.
+
+        """
+        deleted = await self._delete_in_batches(
+            lambda session: RefreshTokenDAO(
+                session=session, model=RefreshToken
+            ).delete_expired(self._batch_size)
+        )
+        REFRESH_TOKENS_REAPED_TOTAL.inc(deleted)
+        return deleted
+
+    async def reap_revocations(self) -> int:
+        """Delete all currently expired access token revocations.
+
+        Returns:
+            int: Number of deleted revocations.
+
+        """
+        deleted = await self._delete_in_batches(
+            lambda session: RevokedAccessTokenDAO(
+                session=session, model=RevokedAccessToken
+            ).delete_expired(self._batch_size)
+        )
+        REVOCATIONS_REAPED_TOTAL.inc(deleted)
+        return deleted
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                deleted = await self.reap()
+                await self.reap_revocations()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('Token cleanup failed')
+            else:
+                if deleted:
+                    logger.info('Deleted %d expired refresh tokens', deleted)
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        """Start periodic cleanup in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic cleanup."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+refresh_token_reaper = RefreshTokenReaper.from_settings(settings.token_settings)
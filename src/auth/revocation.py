@@ -0,0 +1,253 @@
+import asyncio
+import math
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar
+
+from prometheus_client import Counter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dao import RevokedAccessTokenDAO
+from src.auth.models import RevokedAccessToken
+from src.base.bloom import BloomFilter
+from src.base.cache import TTLCache
+from src.base.invalidation import invalidation_bus
+from src.database import async_db_session
+from src.settings import Settings, TokenSettings
+
+settings = Settings.load()
+
+REVOCATION_LOOKUPS_TOTAL = Counter(
+    'access_token_revocation_lookups_total',
+    'Exact revocation checks of tokens matched by the Bloom filter.',
+    ['result'],
+)
+
+# Token version cut-off of keys without a current revocation. Tokens
+# issued before every token carried a version are read with it, so any
+# revocation of their user covers them.
+NOT_REVOKED = -1
+
+
+class AccessTokenRevocationList:
+    """Revoked access tokens with a Bloom filter in front of the database.
+
+    Revocations are stored in the revoked_access_tokens table, either for
+    a single token by its ``jti`` or for every token of a user carrying
+    a token version older than the one the revocation bumped to. Tokens
+    issued afterwards, even within the same second, carry the new
+    version and are accepted. Each worker keeps the keys of all current
+    revocations in a Bloom filter, so a token that was never revoked is
+    accepted without a query. Only filter hits are checked exactly, and
+    those results are cached until the key is revoked again.
+
+    New revocations are added to the filter of every worker through the
+    cache invalidation bus. Revocations can't be removed from a Bloom
+    filter, so it is rebuilt from the table periodically and whenever
+    notifications could have been missed.
+    """
+
+    CHANNEL: ClassVar[str] = 'access_token_revocation'
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        rebuild_interval: float,
+    ) -> None:
+        """Initialize a revocation list that loads on first use.
+
+        Args:
+            capacity (int): Expected number of current revocations.
+            error_rate (float): Target false positive rate of the filter.
+            rebuild_interval (float): Seconds between filter rebuilds.
+
+        """
+        self._capacity: int = capacity
+        self._error_rate: float = error_rate
+        self._rebuild_interval: float = rebuild_interval
+        self._filter: BloomFilter = BloomFilter(capacity, error_rate)
+        self._cutoffs: TTLCache[str, float] = TTLCache(
+            'access_token_revocation',
+            max_size=capacity,
+            ttl=rebuild_interval,
+        )
+        self._loaded_at: float | None = None
+        self._generation: int = 0
+        self._pending: list[str] | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    @classmethod
+    def from_settings(
+        cls, token_settings: TokenSettings
+    ) -> 'AccessTokenRevocationList':
+        """Create a revocation list configured from TokenSettings."""
+        return cls(
+            capacity=token_settings.REVOCATION_FILTER_CAPACITY,
+            error_rate=token_settings.REVOCATION_FILTER_ERROR_RATE,
+            rebuild_interval=token_settings.REVOCATION_REBUILD_SECONDS,
+        )
+
+    def mark_revoked(self, key: str) -> None:
+        """Add a revocation key committed by any worker to this process."""
+        self._filter.add(key)
+        if self._pending is not None:
+            self._pending.append(key)
+        self._cutoffs.pop(key)
+
+    def reset(self) -> None:
+        """Rebuild the filter on next use, revocations could be missed."""
+        self._generation += 1
+        self._loaded_at = None
+        self._cutoffs.clear()
+
+    def _is_loaded(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self._rebuild_interval
+        )
+
+    async def _ensure_loaded(self) -> None:
+        """Build the filter from the table if it is missing or too old."""
+        if self._is_loaded():
+            return
+        async with self._lock:
+            if self._is_loaded():
+                return
+            generation = self._generation
+            # Keys revoked while the table is read are replayed into the
+            # new filter, so none is lost by the swap.
+            self._pending = []
+            try:
+                async with async_db_session() as session, session.begin():
+                    keys = await RevokedAccessTokenDAO(
+                        session=session, model=RevokedAccessToken
+                    ).get_active_keys()
+                bloom_filter = BloomFilter(
+                    max(self._capacity, len(keys)), self._error_rate
+                )
+                for key in [*keys, *self._pending]:
+                    bloom_filter.add(key)
+                self._filter = bloom_filter
+            finally:
+                self._pending = None
+            if generation == self._generation:
+                self._loaded_at = time.monotonic()
+
+    async def _get_cutoffs(self, keys: list[str]) -> dict[str, float]:
+        """Return the token version cut-off of keys.
+
+        Tokens carrying a version below the cut-off of one of their keys
+        are revoked. Revoked token IDs revoke any version.
+        """
+        cutoffs: dict[str, float] = {}
+        missing: list[str] = []
+        for key in keys:
+            cached = self._cutoffs.get(key)
+            if cached is None:
+                missing.append(key)
+            else:
+                cutoffs[key] = cached
+        if missing:
+            async with async_db_session() as session, session.begin():
+                found = await RevokedAccessTokenDAO(
+                    session=session, model=RevokedAccessToken
+                ).get_revocations(missing)
+            for key in missing:
+                if key not in found:
+                    cutoff: float = NOT_REVOKED
+                else:
+                    token_version = found[key]
+                    cutoff = (
+                        math.inf if token_version is None else token_version
+                    )
+                self._cutoffs.set(key, cutoff)
+                cutoffs[key] = cutoff
+        return cutoffs
+
+    async def is_revoked(self, claims: dict[str, str | int]) -> bool:
+        """Check whether verified access token claims were revoked.
+
+        Args:
+            claims (dict[str, str | int]): Claims of a verified token.
+
+        Returns:
+            bool: True if the token or all tokens of its user carrying
+                its token version were revoked.
+
+        """
+        await self._ensure_loaded()
+        user_key = f'sub:{claims.get("sub")}'
+        token_key = f'jti:{claims["jti"]}' if 'jti' in claims else None
+        keys = [
+            key
+            for key in (user_key, token_key)
+            if key is not None and key in self._filter
+        ]
+        if not keys:
+            return False
+        cutoffs = await self._get_cutoffs(keys)
+        token_version = int(claims.get('ver', NOT_REVOKED))
+        revoked = any(token_version < cutoffs[key] for key in keys)
+        REVOCATION_LOOKUPS_TOTAL.labels(
+            'revoked' if revoked else 'false_positive'
+        ).inc()
+        return revoked
+
+    async def _revoke(
+        self,
+        session: AsyncSession,
+        key: str,
+        expires_at: datetime,
+        user_id: uuid.UUID | str | None = None,
+    ) -> None:
+        await RevokedAccessTokenDAO(
+            session=session, model=RevokedAccessToken
+        ).revoke(key, datetime.now(UTC), expires_at, user_id=user_id)
+        await invalidation_bus.publish(session, self.CHANNEL, key)
+
+    async def revoke_token(
+        self, session: AsyncSession, token_id: str, expires_at: datetime
+    ) -> None:
+        """Revoke a single access token.
+
+        Args:
+            session (AsyncSession): Session of the transaction revoking the
+                token. Other workers learn about it once it is committed.
+            token_id (str): The ``jti`` claim of the token.
+            expires_at (datetime): Expiration time of the token.
+
+        """
+        await self._revoke(session, f'jti:{token_id}', expires_at)
+
+    async def revoke_user(
+        self, session: AsyncSession, user_id: uuid.UUID | str
+    ) -> None:
+        """Revoke every access token issued to a user until now.
+
+        Tokens carrying a token version older than the user's current
+        one are revoked, so the transaction must bump it first.
+
+        Args:
+            session (AsyncSession): Session of the transaction revoking the
+                tokens. Other workers learn about it once it is committed.
+            user_id (uuid.UUID | str): ID of the user.
+
+        """
+        expires_at = datetime.now(UTC) + timedelta(
+            minutes=settings.token_settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        )
+        await self._revoke(
+            session, f'sub:{user_id}', expires_at, user_id=user_id
+        )
+
+
+revocation_list = AccessTokenRevocationList.from_settings(
+    settings.token_settings
+)
+invalidation_bus.subscribe(
+    AccessTokenRevocationList.CHANNEL,
+    revocation_list.mark_revoked,
+    revocation_list.reset,
+)
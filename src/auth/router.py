@@ -1,20 +1,32 @@
 import uuid
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Request, Response
+from fastapi import APIRouter, Depends, Request, Response, Security
 from fastapi.security import OAuth2PasswordRequestForm
 
-from src.auth.schemas import Token
-from src.auth.services import AuthService
+from src.auth.dependencies import (
+    check_login_rate_limit,
+    oauth_scheme,
+    verify_introspection_secret,
+)
+from src.auth.schemas import (
+    IntrospectRequestSchema,
+    IntrospectResponseSchema,
+    Token,
+)
+from src.auth.services import AuthService, TokenManager
 from src.base.dependencies import get_service
 from src.settings import Settings
-from src.users.models import User
 
 auth_router = APIRouter()
 settings = Settings.load()
 
 
-@auth_router.post(path='/login', response_model=Token)
+@auth_router.post(
+    path='/login',
+    response_model=Token,
+    dependencies=[Depends(check_login_rate_limit)],
+)
 async def login_user(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     service: Annotated[AuthService, Depends(get_service(AuthService))],
@@ -31,11 +43,10 @@ async def login_user(
         Token: Access and refresh tokens to be used for authentication.
 
     """
-    user: User = await service.auth_user(
+    token: Token = await service.login(
         email=form_data.username,
         password=form_data.password,
     )
-    token: Token = await service.create_token(user.id)
     response.set_cookie(
         'access_token',
         token.access_token,
@@ -97,6 +108,7 @@ async def logout_user(
     request: Request,
     response: Response,
     service: Annotated[AuthService, Depends(get_service(AuthService))],
+    token: Annotated[str | None, Security(oauth_scheme)],
 ) -> dict[str, str]:
     """Log out the user.
 
@@ -104,12 +116,57 @@ async def logout_user(
         request (Request): HTTP request to read cookies.
         response (Response): HTTP response to delete cookies.
         service (AuthService): Auth service dependency.
+        token (str | None): Access token from the Authorization header,
+            the access token cookie is used without it.
 
     Returns:
         dict[str, str]: Confirmation message of successful logout.
 
     """
-    await service.logout_user(request.cookies.get('refresh_token'))
+    await service.logout_user(
+        request.cookies.get('refresh_token'),
+        token or request.cookies.get('access_token'),
+    )
     response.delete_cookie('access_token')
     response.delete_cookie('refresh_token')
     return {'message': 'Logged out successfully'}
+
+
+@auth_router.post(
+    path='/introspect',
+    response_model=IntrospectResponseSchema,
+    dependencies=[Depends(verify_introspection_secret)],
+)
+async def introspect_tokens(
+    introspect_request: IntrospectRequestSchema,
+    service: Annotated[AuthService, Depends(get_service(AuthService))],
+) -> IntrospectResponseSchema:
+    """Check a batch of access tokens on behalf of an internal service.
+
+    Requires the ``X-Introspection-Secret`` header.
+
+    Args:
+        introspect_request (IntrospectRequestSchema): Tokens to check.
+        service (AuthService): Auth service dependency.
+
+    Returns:
+        IntrospectResponseSchema: Per-token results in request order.
+
+    """
+    results = await service.introspect_tokens(introspect_request.tokens)
+    return IntrospectResponseSchema(results=results)
+
+
+@auth_router.get(path='/.well-known/jwks.json')
+async def get_jwks() -> dict[str, list[dict[str, Any]]]:
+    """Publish the public keys verifying access tokens.
+
+    Other services verify tokens locally with these keys, selecting one
+    by the ``kid`` token header. The set is empty for shared-secret
+    algorithms.
+
+    Returns:
+        dict[str, list[dict[str, Any]]]: JWK set of the public keys.
+
+    """
+    return TokenManager.get_jwks()
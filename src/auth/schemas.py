@@ -1,8 +1,15 @@
 import uuid
+from datetime import datetime
+from typing import Any, Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
+from src.auth.exceptions import WrongCredentialsException
 from src.base.schemas import BaseSchema
+from src.settings import Settings
+from src.users.enums import UserRole
+
+settings = Settings.load()
 
 
 class Token(BaseModel):
@@ -22,10 +29,129 @@ class CreateRefreshTokenSchema(BaseSchema):
     Attributes:
         user_id (uuid.UUID): The ID of the user for whom the token is created.
         refresh_token (uuid.UUID): The unique refresh token value.
-        expires_in (float): The total seconds until.
+        expires_at (datetime): The moment the token expires.
 
     """
 
     user_id: uuid.UUID
     refresh_token: uuid.UUID
-    expires_in: float
+    expires_at: datetime
+
+
+class BasePrincipal(BaseModel):
+    """Base model for identities stored as access token claims.
+
+    Fields are validated from ORM objects by name and from decoded
+    claims by alias, so the same model issues and reads the claims.
+    """
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        validate_by_name=True,
+        validate_by_alias=True,
+    )
+
+    @classmethod
+    def from_claims(cls, claims: dict[str, str | int]) -> Self:
+        """Build the principal from verified access token claims.
+
+        Raises:
+            WrongCredentialsException: If the claims are missing or invalid.
+
+        """
+        try:
+            return cls.model_validate(claims)
+        except ValidationError:
+            raise WrongCredentialsException from None
+
+    def to_claims(self) -> dict[str, Any]:
+        """Return the principal as JSON-serializable token claims."""
+        return self.model_dump(mode='json', by_alias=True)
+
+
+class UserPrincipal(BasePrincipal):
+    """Authorization state of a user carried by an access token.
+
+    Exposes the same role properties as the User model, so permissions
+    can authorize either of them.
+
+    Attributes:
+        id (uuid.UUID): User ID, the ``sub`` claim.
+        role (UserRole): User role.
+        is_active (bool): Whether the account was active on issue.
+        token_version (int): User token version on issue. A token whose
+            version differs from the stored one is outdated.
+
+    """
+
+    id: uuid.UUID = Field(alias='sub')
+    role: UserRole
+    is_active: bool = Field(alias='active')
+    token_version: int = Field(alias='ver')
+
+    @property
+    def is_user_admin(self) -> bool:
+        """Check if a user is admin or not."""
+        return self.role == UserRole.ADMIN
+
+    @property
+    def is_user_superadmin(self) -> bool:
+        """Check if a user is superadmin or not."""
+        return self.role == UserRole.SUPERADMIN
+
+    @property
+    def is_user_in_admin_group(self) -> bool:
+        """Check if user in an admin group or not."""
+        return self.is_user_admin or self.is_user_superadmin
+
+
+class AuthorPrincipal(BasePrincipal):
+    """Author profile of a user carried by an access token.
+
+    Attributes:
+        id (uuid.UUID): Author ID.
+        user_id (uuid.UUID): User ID, the ``sub`` claim.
+        is_verified (bool): Whether the author was verified on issue.
+
+    """
+
+    id: uuid.UUID = Field(alias='author_id')
+    user_id: uuid.UUID = Field(alias='sub')
+    is_verified: bool = Field(alias='author_verified')
+
+    def to_claims(self) -> dict[str, Any]:
+        """Return author claims, the user ID is issued as ``sub``."""
+        return self.model_dump(mode='json', by_alias=True, exclude={'user_id'})
+
+
+class IntrospectRequestSchema(BaseModel):
+    """Pydantic model for a batch of access tokens to introspect."""
+
+    tokens: list[str] = Field(
+        min_length=1,
+        max_length=settings.token_settings.INTROSPECTION_MAX_TOKENS,
+    )
+
+
+class IntrospectedTokenSchema(BaseModel):
+    """Pydantic model for the introspection result of one access token.
+
+    Attributes:
+        active (bool): Whether the token is valid and its user is active.
+        user_id (uuid.UUID | None): ID of the user of an active token.
+        role (UserRole | None): Role of the user of an active token.
+        exp (int | None): Expiration unix timestamp of an active token.
+
+    """
+
+    active: bool
+    user_id: uuid.UUID | None = None
+    role: UserRole | None = None
+    exp: int | None = None
+
+
+class IntrospectResponseSchema(BaseModel):
+    """Pydantic model for introspection results, in request order."""
+
+    results: list[IntrospectedTokenSchema]
@@ -1,20 +1,36 @@
+import asyncio
+import logging
 import uuid
-from typing import cast
+from datetime import UTC, datetime
+from typing import Any, ClassVar, cast
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.exceptions import RefreshTokenException, WrongCredentialsException
+from src.auth.dao import RefreshTokenDAO
+from src.auth.exceptions import (
+    AccessTokenExpiredException,
+    RefreshTokenException,
+    WrongCredentialsException,
+)
 from src.auth.models import RefreshToken
-from src.auth.schemas import CreateRefreshTokenSchema, Token
+from src.auth.revocation import revocation_list
+from src.auth.schemas import (
+    AuthorPrincipal,
+    IntrospectedTokenSchema,
+    Token,
+    UserPrincipal,
+)
 from src.auth.services.hasher import Hasher
 from src.auth.services.token import TokenManager
-from src.base.dao import BaseDAO
 from src.base.service import BaseService
+from src.database import async_db_session
+from src.settings import Settings
+from src.users.dao import UserDAO
 from src.users.models import User
-from src.users.schemas import CreateUserRequestSchema
 
-type UserDAO = BaseDAO[User, CreateUserRequestSchema]
-type AuthDAO = BaseDAO[RefreshToken, CreateRefreshTokenSchema]
+logger = logging.getLogger(__name__)
+settings = Settings.load()
 
 
 class AuthService(BaseService):
@@ -26,10 +42,12 @@ class AuthService(BaseService):
 
     """
 
+    _rehash_tasks: ClassVar[set[asyncio.Task[None]]] = set()
+
     def __init__(
         self,
         db_session: AsyncSession,
-        auth_dao: AuthDAO | None = None,
+        auth_dao: RefreshTokenDAO | None = None,
         user_dao: UserDAO | None = None,
     ) -> None:
         """Initialize AuthService with a database session and optional DAOs.
@@ -39,28 +57,28 @@ class AuthService(BaseService):
 
         Args:
             db_session (AsyncSession): SQLAlchemy async database session
-            auth_dao (AuthDAO | None, optional): Data access object for auth
+            auth_dao (RefreshTokenDAO | None, optional): Data access object
+                for auth
                 If None, creates a new instance. Defaults to None.
             user_dao (UserDAO | None, optional): Data access object for user
                 If None, creates a new instance. Defaults to None.
 
         Note:
-            The service will create new instances of AuthDAO and UserDAO.
+            The service will create new instances of RefreshTokenDAO and
+            UserDAO.
 
         """
         super().__init__(db_session)
-        self._auth_dao: AuthDAO = auth_dao or BaseDAO[
-            RefreshToken,
-            CreateRefreshTokenSchema,
-        ](session=db_session, model=RefreshToken)
-        self._user_dao: UserDAO = user_dao or BaseDAO[
-            User,
-            CreateUserRequestSchema,
-        ](session=db_session, model=User)
+        self._auth_dao: RefreshTokenDAO = auth_dao or RefreshTokenDAO(
+            session=db_session, model=RefreshToken
+        )
+        self._user_dao: UserDAO = user_dao or UserDAO(
+            session=db_session, model=User
+        )
 
     @property
-    def auth_dao(self) -> AuthDAO:
-        """Return the AuthDAO instance."""
+    def auth_dao(self) -> RefreshTokenDAO:
+        """Return the RefreshTokenDAO instance."""
         return self._auth_dao
 
     @property
@@ -69,14 +87,72 @@ class AuthService(BaseService):
         return self._user_dao
 
     @staticmethod
-    def _verify_user_password(user: User | None, password: str) -> None:
+    async def _verify_user_password(user: User | None, password: str) -> None:
         """Verify that the given password matches the user's password.
 
+        The bcrypt check runs in the hashing process pool, so the event
+        loop stays free while it is computed.
         Raise WrongCredentialsException if verification fails.
         """
-        if not user or not Hasher.verify_password(password, user.password):
+        if not user or not await Hasher.verify_password_async(
+            password, user.password
+        ):
             raise WrongCredentialsException
 
+    @staticmethod
+    async def _get_token_user(
+        user_dao: UserDAO, **filters_by: Any
+    ) -> User | None:
+        """Fetch the user tokens are issued for.
+
+        In claims authorization mode the author profile is loaded as well,
+        since it is embedded into the access token.
+        """
+        if settings.token_settings.CLAIMS_AUTH:
+            return await user_dao.get_one_with_relations(
+                relations=['author'], **filters_by
+            )
+        return await user_dao.get_one(**filters_by)
+
+    @staticmethod
+    def _get_access_token_claims(
+        user: UserPrincipal, author: AuthorPrincipal | None
+    ) -> dict[str, Any]:
+        """Return authorization claims to embed into an access token."""
+        claims: dict[str, Any] = user.to_claims()
+        if author:
+            claims.update(author.to_claims())
+        return claims
+
+    @staticmethod
+    async def _rehash_password(
+        user_id: uuid.UUID, hashed_password: str, password: str
+    ) -> None:
+        """Replace a password hash made with an outdated bcrypt cost.
+
+        Runs in the background with its own session. The hash is only
+        replaced if it has not changed since the login, so a concurrent
+        password change always wins.
+        """
+        try:
+            new_hashed_password = await Hasher.hash_password_async(password)
+            async with async_db_session() as session, session.begin():
+                await UserDAO(session=session, model=User).update(
+                    {'password': new_hashed_password},
+                    id=user_id,
+                    password=hashed_password,
+                )
+        except Exception:
+            logger.exception('Failed to rehash password of user %s', user_id)
+
+    def _schedule_rehash(self, user: User, password: str) -> None:
+        task = asyncio.create_task(
+            self._rehash_password(user.id, user.password, password)
+        )
+        # Keep a reference until the task is done, see asyncio docs
+        self._rehash_tasks.add(task)
+        task.add_done_callback(self._rehash_tasks.discard)
+
     async def auth_user(self, email: str, password: str) -> User:
         """Authenticate a user by email and password.
 
@@ -87,15 +163,48 @@ class AuthService(BaseService):
             User: Authenticated user instance.
 
         """
-        async with self.session.begin():
-            user: User | None = await self.user_dao.get_one(
-                email=email, is_active=True
+        # Looked up on a short-lived session of its own rather than in
+        # the request unit of work, so that its connection is released
+        # before bcrypt runs without committing the request early
+        async with async_db_session() as session, session.begin():
+            user: User | None = await self._get_token_user(
+                UserDAO(session=session, model=User),
+                email=email,
+                is_active=True,
             )
-        self._verify_user_password(user, password)
+        await self._verify_user_password(user, password)
         return cast(User, user)
 
+    async def login(self, email: str, password: str) -> Token:
+        """Authenticate a user and issue a new pair of tokens.
+
+        The user lookup and the token issue are one statement each. The
+        bcrypt check runs between them with no connection checked out,
+        and the token issue re-checks the verified password hash, so no
+        transaction has to span the hashing. A password hashed with a
+        lower bcrypt cost than the configured one is rehashed in the
+        background once the tokens are issued, since the token issue
+        would fail if the new hash were stored first.
+
+        Args:
+            email (str): Email of the user.
+            password (str): Plain password of the user.
+
+        Returns:
+            Token: New access and refresh tokens.
+
+        Raises:
+            WrongCredentialsException: If the credentials are invalid.
+
+        """
+        user: User = await self.auth_user(email=email, password=password)
+        token: Token = await self.create_token(user)
+        if Hasher.needs_update(user.password):
+            self._schedule_rehash(user, password)
+        return token
+
     @staticmethod
-    def _get_user_id_from_jwt(decoded_jwt: dict[str, str | int]) -> str:
+    def get_user_id_from_jwt(decoded_jwt: dict[str, str | int]) -> str:
         """Extract and return user ID from a decoded JWT payload.
 
         Raises WrongCredentialsException if user ID is missing or invalid.
@@ -114,8 +223,8 @@ class AuthService(BaseService):
     ) -> uuid.UUID | str:
         """Validate a JWT token and retrieve the associated user.
 
-        This method decodes the provided JWT token, validates its expiration,
-        and retrieves the associated user from the database.
+        This method verifies the provided JWT token through the
+        TokenManager claims cache and extracts the associated user ID.
 
         Args:
             user_jwt_token (str): The JWT token to validate.
@@ -128,48 +237,136 @@ class AuthService(BaseService):
                 or the user cannot be found.
 
         """
-        decoded_jwt: dict[str, str | int] = TokenManager.decode_access_token(
+        decoded_jwt: dict[str, str | int] = TokenManager.verify_access_token(
             token=user_jwt_token,
         )
-        TokenManager.validate_access_token_expired(decoded_jwt)
-        user_id: uuid.UUID | str = self._get_user_id_from_jwt(decoded_jwt)
+        user_id: uuid.UUID | str = self.get_user_id_from_jwt(decoded_jwt)
         if not user_id:
             raise WrongCredentialsException
         return user_id
 
-    async def create_token(self, user_id: uuid.UUID) -> Token:
+    @staticmethod
+    def _get_valid_token_claims(
+        token: str,
+    ) -> tuple[uuid.UUID, dict[str, str | int]] | None:
+        """Return the user ID and claims of a valid token, otherwise None."""
+        try:
+            claims = TokenManager.verify_access_token(
+                token.removeprefix('Bearer ').strip()
+            )
+            return uuid.UUID(str(claims['sub'])), claims
+        except (
+            WrongCredentialsException,
+            AccessTokenExpiredException,
+            KeyError,
+            ValueError,
+        ):
+            return None
+
+    async def introspect_tokens(
+        self, tokens: list[str]
+    ) -> list[IntrospectedTokenSchema]:
+        """Check a batch of access tokens for internal services.
+
+        Every token is verified through the TokenManager claims cache and
+        the users of all valid tokens are loaded by a single query.
+        A token is active if it is valid, not revoked, its user is active
+        and, in claims authorization mode, its token version is current.
+
+        Args:
+            tokens (list[str]): Access tokens, with or without the
+                ``Bearer`` prefix.
+
+        Returns:
+            list[IntrospectedTokenSchema]: One result per token, in the
+                order of the tokens.
+
+        """
+        verified = [self._get_valid_token_claims(t) for t in tokens]
+        verified = [
+            entry
+            if entry and not await revocation_list.is_revoked(entry[1])
+            else None
+            for entry in verified
+        ]
+        user_ids = list({entry[0] for entry in verified if entry})
+        async with self.transaction():
+            users: list[User] = await self.user_dao.get_by_ids(
+                user_ids, is_active=True
+            )
+        users_by_id: dict[uuid.UUID, User] = {user.id: user for user in users}
+        results: list[IntrospectedTokenSchema] = []
+        for entry in verified:
+            user = users_by_id.get(entry[0]) if entry else None
+            if not entry or not user:
+                results.append(IntrospectedTokenSchema(active=False))
+                continue
+            claims = entry[1]
+            if (
+                settings.token_settings.CLAIMS_AUTH
+                and 'ver' in claims
+                and claims['ver'] != user.token_version
+            ):
+                results.append(IntrospectedTokenSchema(active=False))
+                continue
+            results.append(
+                IntrospectedTokenSchema(
+                    active=True,
+                    user_id=user.id,
+                    role=user.role,
+                    exp=int(claims['exp']),
+                )
+            )
+        return results
+
+    async def create_token(self, user: User) -> Token:
         """Generate new access and refresh tokens for a user.
 
         This method creates a new pair of tokens (access and refresh)
-        for the given user,
-        deletes any existing refresh tokens for that user,
-         and stores the new refresh token
-        in the database.
+        for the given user. Existing refresh tokens of the user are
+        deleted and the new one is stored by a single statement, which
+        also checks that the user is still active and that the password
+        hasn't changed since it was verified.
 
         Args:
-            user_id (uuid.UUID): The unique identifier
-             of the user for whom to generate tokens.
+            user (User): The user for whom to generate tokens. In claims
+             authorization mode its author relation must be loaded.
 
         Returns:
             Token: A Token object containing the new
             access_token and refresh_token.
 
+        Raises:
+            WrongCredentialsException: If the user was deactivated or
+                changed the password after authentication.
+
         Note:
             The method will delete all existing refresh
             tokens for the user before creating
             new ones to ensure security and prevent token accumulation.
 
         """
-        access_token: str = TokenManager.generate_access_token(user_id=user_id)
-        refresh_token, tm_delta = TokenManager.generate_refresh_token()
-        create_token_schema = CreateRefreshTokenSchema(
-            user_id=user_id,
-            refresh_token=refresh_token,
-            expires_in=tm_delta.total_seconds(),
+        claims: dict[str, Any] | None = None
+        if settings.token_settings.CLAIMS_AUTH:
+            claims = self._get_access_token_claims(
+                UserPrincipal.model_validate(user),
+                AuthorPrincipal.model_validate(user.author)
+                if user.author
+                else None,
+            )
+        access_token: str = TokenManager.generate_access_token(
+            user_id=user.id, token_version=user.token_version, claims=claims
         )
-        async with self.session.begin():
-            await self.auth_dao.delete(RefreshToken.user_id == user_id)
-            await self.auth_dao.create(create_token_schema)
+        refresh_token, expires_at = TokenManager.generate_refresh_token()
+        async with self.transaction():
+            issued: bool = await self.auth_dao.replace_user_tokens(
+                user_id=user.id,
+                hashed_password=user.password,
+                refresh_token=refresh_token,
+                expires_at=expires_at,
+            )
+        if not issued:
+            raise WrongCredentialsException
         return Token(
             access_token=access_token,
             refresh_token=str(refresh_token),
@@ -178,9 +375,10 @@ class AuthService(BaseService):
     async def refresh_token(self, refresh_token: uuid.UUID) -> Token:
         """Generate new access and refresh tokens.
 
-        This method validates the provided refresh token, checks
-         if it exists and hasn't expired,
-        then generates new access and refresh tokens for the user.
+        The refresh token is rotated by a single conditional UPDATE that
+        checks the token exists, hasn't expired and belongs to an active
+        user, and returns the user's claims. When the same token is
+        refreshed concurrently only one request succeeds.
 
         Args:
         refresh_token (uuid.UUID): The current refresh token to be
@@ -191,58 +389,59 @@ class AuthService(BaseService):
 
         Raises:
         RefreshTokenException: If the refresh token is invalid,
-        expired, or the associated user
-        cannot be found.
+        expired, already rotated or the associated user is inactive.
 
         """
-        async with self.session.begin():
-            refresh_token_model: (
-                RefreshToken | None
-            ) = await self.auth_dao.get_one(
+        updated_refresh_token, expires_at = (
+            TokenManager.generate_refresh_token()
+        )
+        async with self.transaction():
+            rotated_user: Row[Any] | None = await self.auth_dao.rotate_token(
                 refresh_token=refresh_token,
+                new_refresh_token=updated_refresh_token,
+                expires_at=expires_at,
             )
-            if not refresh_token_model:
-                raise RefreshTokenException
-            TokenManager.validate_refresh_token_expired(
-                refresh_token_model=refresh_token_model,
-            )
-            user_id: uuid.UUID = refresh_token_model.user_id
-            user: User | None = await self.user_dao.get_one(
-                id=user_id,
-            )
-            if not user:
-                raise RefreshTokenException
-            access_token: str = TokenManager.generate_access_token(
-                user_id=user_id,
-            )
-            updated_refresh_token, tm_delta = (
-                TokenManager.generate_refresh_token()
-            )
-            updated_refresh_token_model: (
-                RefreshToken | None
-            ) = await self.auth_dao.update(
-                {
-                    'refresh_token': updated_refresh_token,
-                    'expires_in': tm_delta.total_seconds(),
-                },
-                id=refresh_token_model.id,
-            )
-            if not updated_refresh_token_model:
-                raise RefreshTokenException
-            return Token(
-                access_token=access_token,
-                refresh_token=str(updated_refresh_token),
+        if not rotated_user:
+            raise RefreshTokenException
+        claims: dict[str, Any] | None = None
+        if settings.token_settings.CLAIMS_AUTH:
+            claims = self._get_access_token_claims(
+                UserPrincipal.model_validate(rotated_user),
+                AuthorPrincipal.model_validate(
+                    {
+                        'id': rotated_user.author_id,
+                        'user_id': rotated_user.id,
+                        'is_verified': rotated_user.author_is_verified,
+                    }
+                )
+                if rotated_user.author_id
+                else None,
             )
+        access_token: str = TokenManager.generate_access_token(
+            user_id=rotated_user.id,
+            token_version=rotated_user.token_version,
+            claims=claims,
+        )
+        return Token(
+            access_token=access_token,
+            refresh_token=str(updated_refresh_token),
+        )
 
     async def logout_user(
         self,
         refresh_token: str | None,
+        access_token: str | None = None,
     ) -> None:
         """Log out a user by invalidating their refresh token.
 
+        The access token of the session, if given and still valid, is
+        revoked as well, so it is rejected right away instead of at its
+        expiry.
+
         Args:
             refresh_token (str | None): The refresh token to invalidate.
                 If None, RefreshTokenException will be raised.
+            access_token (str | None): The access token to revoke.
 
         Raises:
             RefreshTokenException: If the refresh token is None or invalid.
@@ -253,7 +452,7 @@ class AuthService(BaseService):
         """
         if not refresh_token:
             raise RefreshTokenException
-        async with self.session.begin():
+        async with self.transaction():
             refresh_token_model: (
                 RefreshToken | None
             ) = await self.auth_dao.get_one(
@@ -264,3 +463,19 @@ class AuthService(BaseService):
             await self.auth_dao.delete(
                 id=refresh_token_model.id,
             )
+            verified = (
+                self._get_valid_token_claims(access_token)
+                if access_token
+                else None
+            )
+            if (
+                verified
+                and verified[0] == refresh_token_model.user_id
+                and 'jti' in verified[1]
+            ):
+                claims = verified[1]
+                await revocation_list.revoke_token(
+                    self.session,
+                    str(claims['jti']),
+                    datetime.fromtimestamp(int(claims['exp']), UTC),
+                )
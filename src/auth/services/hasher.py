@@ -1,4 +1,206 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
 from passlib.context import CryptContext
+from passlib.hash import bcrypt
+from prometheus_client import Counter, Gauge, Histogram
+
+from src.auth.exceptions import (
+    PasswordHasherBusyException,
+    PasswordHasherTimeoutException,
+)
+from src.settings import HasherSettings, Settings
+
+logger = logging.getLogger(__name__)
+settings = Settings.load()
+
+HASHER_QUEUE_WAIT_SECONDS = Histogram(
+    'auth_hasher_queue_wait_seconds',
+    'Time a hashing job waited for a free worker process.',
+    ['operation'],
+)
+HASHER_COMPUTE_SECONDS = Histogram(
+    'auth_hasher_compute_seconds',
+    'Time a worker process spent computing a hash.',
+    ['operation'],
+)
+HASHER_REJECTED_TOTAL = Counter(
+    'auth_hasher_rejected_total',
+    'Hashing jobs rejected because the pool was saturated or timed out.',
+    ['operation', 'reason'],
+)
+HASHER_IN_FLIGHT = Gauge(
+    'auth_hasher_in_flight',
+    'Hashing jobs currently queued or running in the pool.',
+)
+
+
+def _run_timed[T](func: Callable[..., T], *args: Any) -> tuple[T, float, float]:
+    """Run func inside a worker process and report when it ran.
+
+    Wall-clock timestamps are used because they are comparable between
+    the event loop process and the worker process.
+    """
+    started_at = time.time()
+    result = func(*args)
+    return result, started_at, time.time()
+
+
+def _hash_password(unhashed_password: str, rounds: int | None) -> str:
+    """Hash a password with the given bcrypt cost.
+
+    Worker processes do not share the calibrated CryptContext of the
+    event loop process, so the cost is passed with every job.
+    """
+    handler = bcrypt.using(rounds=rounds) if rounds else bcrypt
+    return handler.hash(unhashed_password)
+
+
+def calibrate_rounds(
+    target_seconds: float, min_rounds: int, max_rounds: int
+) -> int:
+    """Return the highest bcrypt cost whose hash time fits the budget.
+
+    Hashing time is measured at min_rounds and extrapolated, since every
+    extra round doubles the bcrypt work.
+
+    :param target_seconds: Latency budget of a single hash
+    :param min_rounds: Lowest acceptable cost, returned even if too slow
+    :param max_rounds: Highest cost to consider
+    :return: bcrypt cost (log2 of the rounds)
+    """
+    handler = bcrypt.using(rounds=min_rounds)
+    elapsed = float('inf')
+    for _ in range(3):  # Best of three to skip warm-up and noise
+        started_at = time.perf_counter()
+        handler.hash('calibration-password')
+        elapsed = min(elapsed, time.perf_counter() - started_at)
+    rounds = min_rounds
+    while rounds < max_rounds and elapsed * 2 <= target_seconds:
+        rounds += 1
+        elapsed *= 2
+    return rounds
+
+
+class PasswordHashingPool:
+    """Bounded process pool for CPU-bound password hashing.
+
+    Keeps bcrypt off the event loop. At most ``pool_size + queue_depth``
+    jobs are accepted at once; everything above that is rejected right
+    away instead of queueing behind a login spike.
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        queue_depth: int,
+        timeout: float,
+    ) -> None:
+        """Initialize the pool. Worker processes are started lazily.
+
+        Args:
+            pool_size (int): Number of worker processes.
+            queue_depth (int): Jobs allowed to wait for a free worker.
+            timeout (float): Seconds to wait for a job result.
+
+        """
+        self._pool_size: int = pool_size
+        self._max_in_flight: int = pool_size + queue_depth
+        self._timeout: float = timeout
+        self._in_flight: int = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    @classmethod
+    def from_settings(
+        cls, hasher_settings: HasherSettings
+    ) -> 'PasswordHashingPool':
+        """Create a pool configured from HasherSettings."""
+        return cls(
+            pool_size=hasher_settings.POOL_SIZE,
+            queue_depth=hasher_settings.QUEUE_DEPTH,
+            timeout=hasher_settings.TIMEOUT_SECONDS,
+        )
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Return the process pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._pool_size,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return self._executor
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        HASHER_IN_FLIGHT.dec()
+
+    def _on_job_done(
+        self, loop: asyncio.AbstractEventLoop, _: Future[Any]
+    ) -> None:
+        # Called from the executor thread, hand over to the event loop.
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._release)
+
+    async def run[T](
+        self, operation: str, func: Callable[..., T], *args: Any
+    ) -> T:
+        """Run func in a worker process and return its result.
+
+        Args:
+            operation (str): Metric label of the job, e.g. 'hash'.
+            func (Callable[..., T]): Picklable callable to execute.
+            *args (Any): Picklable arguments for func.
+
+        Returns:
+            T: The value returned by func.
+
+        Raises:
+            PasswordHasherBusyException: If the pool is saturated.
+            PasswordHasherTimeoutException: If the job took too long.
+
+        """
+        if self._in_flight >= self._max_in_flight:
+            HASHER_REJECTED_TOTAL.labels(operation, 'saturated').inc()
+            raise PasswordHasherBusyException
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        try:
+            future = self.executor.submit(_run_timed, func, *args)
+            self._in_flight += 1
+            HASHER_IN_FLIGHT.inc()
+            future.add_done_callback(lambda f: self._on_job_done(loop, f))
+            result, started_at, finished_at = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self._timeout
+            )
+        except TimeoutError:
+            HASHER_REJECTED_TOTAL.labels(operation, 'timeout').inc()
+            raise PasswordHasherTimeoutException from None
+        except BrokenProcessPool:
+            # A worker died; the next job starts a fresh pool.
+            logger.exception('Password hashing pool is broken, restarting')
+            self.shutdown()
+            HASHER_REJECTED_TOTAL.labels(operation, 'broken').inc()
+            raise PasswordHasherBusyException from None
+        HASHER_QUEUE_WAIT_SECONDS.labels(operation).observe(
+            max(started_at - submitted_at, 0.0)
+        )
+        HASHER_COMPUTE_SECONDS.labels(operation).observe(
+            finished_at - started_at
+        )
+        return result
+
+    def shutdown(self) -> None:
+        """Stop worker processes and drop jobs that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
 
 class Hasher:
@@ -10,10 +212,17 @@ class Hasher:
     Attributes:
         _crypt_context (CryptContext): Configured CryptContext instance using
             bcrypt scheme with auto-deprecation.
+        _pool (PasswordHashingPool): Process pool used by the async API.
+        _rounds (int | None): Configured bcrypt cost, None for the default.
 
     Methods:
         hash_password: Creates a secure hash from a plain text password.
         verify_password: Verifies if a plain text password matches its hash.
+        hash_password_async: hash_password executed in the process pool.
+        verify_password_async: verify_password executed in the process pool.
+        needs_update: Checks if a hash was made with a lower bcrypt cost.
+        configure_rounds: Sets the bcrypt cost of new hashes.
+        configure_from_settings: Sets the cost from settings or calibration.
 
     """
 
@@ -21,6 +230,10 @@ class Hasher:
         schemes=['bcrypt'],
         deprecated='auto',
     )
+    _pool: PasswordHashingPool = PasswordHashingPool.from_settings(
+        settings.hasher_settings
+    )
+    _rounds: int | None = None
 
     @classmethod
     def hash_password(cls: type['Hasher'], unhashed_password: str) -> str:
@@ -44,3 +257,100 @@ class Hasher:
         :return: True if hashed password identical to raw, false otherwise
         """
         return cls._crypt_context.verify(unhashed_password, hashed_password)
+
+    @classmethod
+    async def hash_password_async(
+        cls: type['Hasher'], unhashed_password: str
+    ) -> str:
+        """Return a hash of password computed in the hashing pool.
+
+        :param unhashed_password: A password to hash
+        :return: hashed password
+        :raises: PasswordHasherBusyException, PasswordHasherTimeoutException
+        """
+        return await cls._pool.run(
+            'hash', _hash_password, unhashed_password, cls._rounds
+        )
+
+    @classmethod
+    async def verify_password_async(
+        cls: type['Hasher'],
+        unhashed_password: str,
+        hashed_password: str,
+    ) -> bool:
+        """Check a password against its hash in the hashing pool.
+
+        :param unhashed_password: Raw password
+        :param hashed_password: Hashed password
+        :return: True if hashed password identical to raw, false otherwise
+        :raises: PasswordHasherBusyException, PasswordHasherTimeoutException
+        """
+        return await cls._pool.run(
+            'verify', cls.verify_password, unhashed_password, hashed_password
+        )
+
+    @classmethod
+    def needs_update(cls: type['Hasher'], hashed_password: str) -> bool:
+        """Check if a hash should be recomputed with the current cost.
+
+        Only hashes below the configured cost are outdated. Workers that
+        calibrated on startup may settle on different costs, and a hash
+        made with a higher one is kept rather than rehashed back and
+        forth between them.
+
+        :param hashed_password: Hashed password
+        :return: True if the hash was made with a lower bcrypt cost
+        """
+        if cls._rounds is None:
+            return cls._crypt_context.needs_update(hashed_password)
+        try:
+            rounds: int = bcrypt.from_string(hashed_password).rounds
+        except ValueError:
+            return cls._crypt_context.needs_update(hashed_password)
+        return rounds < cls._rounds
+
+    @classmethod
+    def configure_rounds(cls: type['Hasher'], rounds: int) -> None:
+        """Use a bcrypt cost for new hashes.
+
+        Existing hashes made with a lower cost are reported by
+        needs_update, so they are upgraded on login.
+
+        :param rounds: bcrypt cost (log2 of the rounds)
+        """
+        cls._crypt_context.update(
+            bcrypt__default_rounds=rounds,
+            bcrypt__min_rounds=rounds,
+            bcrypt__max_rounds=rounds,
+        )
+        cls._rounds = rounds
+
+    @classmethod
+    async def configure_from_settings(
+        cls: type['Hasher'], hasher_settings: HasherSettings
+    ) -> None:
+        """Set the bcrypt cost from HasherSettings.
+
+        A fixed ROUNDS value wins. Otherwise, if CALIBRATE_ON_STARTUP is
+        set, the cost is calibrated inside a worker of the hashing pool,
+        where the hashes are computed.
+
+        :param hasher_settings: Hasher settings
+        """
+        rounds: int | None = hasher_settings.ROUNDS
+        if rounds is None and hasher_settings.CALIBRATE_ON_STARTUP:
+            rounds = await cls._pool.run(
+                'calibrate',
+                calibrate_rounds,
+                hasher_settings.TARGET_HASH_MS / 1000,
+                hasher_settings.MIN_ROUNDS,
+                hasher_settings.MAX_ROUNDS,
+            )
+        if rounds is not None:
+            cls.configure_rounds(rounds)
+            logger.info('Using bcrypt cost %d', rounds)
+
+    @classmethod
+    def shutdown_pool(cls: type['Hasher']) -> None:
+        """Stop the hashing pool worker processes."""
+        cls._pool.shutdown()
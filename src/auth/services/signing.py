@@ -0,0 +1,179 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+
+from src.auth.exceptions import WrongCredentialsException
+from src.settings import TokenSettings
+
+HMAC_ALGORITHMS = frozenset({'HS256', 'HS384', 'HS512'})
+
+
+class SigningBackend(ABC):
+    """Signs and verifies JWTs with keys parsed once at startup."""
+
+    def __init__(self, algorithm: str) -> None:
+        """Initialize the backend for a JWS algorithm.
+
+        :param algorithm: JWS algorithm, e.g. HS256 or ES256
+        """
+        self._algorithm: str = algorithm
+
+    @property
+    def algorithm(self) -> str:
+        """Return the JWS algorithm of issued tokens."""
+        return self._algorithm
+
+    @abstractmethod
+    def encode(self, claims: dict[str, Any]) -> str:
+        """Sign claims into a JWT.
+
+        :param claims: Claims to sign
+        :return: Encoded JWT without the Bearer prefix
+        """
+        ...
+
+    @abstractmethod
+    def decode(self, token: str) -> dict[str, Any]:
+        """Verify a JWT and return its claims.
+
+        :param token: Encoded JWT
+        :return: Dictionary containing decoded token claims
+        :raises: WrongCredentialsException if the token is invalid
+        """
+        ...
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the public keys verifying issued tokens as a JWK set.
+
+        Shared-secret backends have no public keys.
+        """
+        return {'keys': []}
+
+
+class HMACSigningBackend(SigningBackend):
+    """Shared-secret signing, tokens can only be verified by this API."""
+
+    def __init__(self, algorithm: str, secret: str) -> None:
+        """Parse the shared secret.
+
+        :param algorithm: One of the HS* algorithms
+        :param secret: Shared secret
+        """
+        super().__init__(algorithm)
+        self._key: Key = jwk.construct(secret, algorithm)
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        """Sign claims into a JWT."""
+        return jwt.encode(claims, self._key, algorithm=self._algorithm)
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """Verify a JWT and return its claims."""
+        try:
+            return jwt.decode(token, self._key, algorithms=[self._algorithm])
+        except JWTError:
+            raise WrongCredentialsException from None
+
+
+class AsymmetricSigningBackend(SigningBackend):
+    """Private key signing with key rotation by ``kid``.
+
+    Tokens are signed with the current private key and carry its ``kid``
+    header. They are verified with the public key of that ``kid``, which
+    is either the current key or a retired one still accepted until the
+    tokens it signed have expired. Other services verify tokens locally
+    with the keys published by ``jwks``.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        key_id: str,
+        private_key: str | bytes,
+        retired_public_keys: dict[str, str | bytes] | None = None,
+    ) -> None:
+        """Parse the signing key and every verification key.
+
+        :param algorithm: Asymmetric JWS algorithm, e.g. ES256 or RS256
+        :param key_id: Key ID of the current signing key
+        :param private_key: PEM of the current signing key
+        :param retired_public_keys: PEM public keys of retired signing
+            keys by key ID
+        """
+        super().__init__(algorithm)
+        self._key_id: str = key_id
+        self._signing_key: Key = jwk.construct(private_key, algorithm)
+        self._verification_keys: dict[str, Key] = {
+            kid: jwk.construct(public_key, algorithm)
+            for kid, public_key in (retired_public_keys or {}).items()
+        }
+        self._verification_keys[key_id] = self._signing_key.public_key()
+        self._headers: dict[str, str] = {'kid': key_id}
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        """Sign claims into a JWT with the current key."""
+        return jwt.encode(
+            claims,
+            self._signing_key,
+            algorithm=self._algorithm,
+            headers=self._headers,
+        )
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """Verify a JWT with the key named by its ``kid`` header."""
+        try:
+            key = self._verification_keys.get(
+                jwt.get_unverified_header(token).get('kid', '')
+            )
+            if key is None:
+                raise WrongCredentialsException
+            return jwt.decode(token, key, algorithms=[self._algorithm])
+        except JWTError:
+            raise WrongCredentialsException from None
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the current and retired public keys as a JWK set."""
+        return {
+            'keys': [
+                {**key.to_dict(), 'kid': kid, 'use': 'sig'}
+                for kid, key in self._verification_keys.items()
+            ]
+        }
+
+
+def create_signing_backend(token_settings: TokenSettings) -> SigningBackend:
+    """Create the signing backend for the algorithm in TokenSettings.
+
+    Retired public keys are read from ``<kid>.pem`` files in
+    TOKEN_RETIRED_KEYS_DIR.
+
+    :param token_settings: Token settings
+    :return: Signing backend with parsed keys
+    """
+    if token_settings.ALGORITHM in HMAC_ALGORITHMS:
+        return HMACSigningBackend(
+            token_settings.ALGORITHM, token_settings.SECRET_KEY
+        )
+    if not token_settings.SIGNING_KEY_FILE or not token_settings.SIGNING_KEY_ID:
+        msg = (
+            f'{token_settings.ALGORITHM} requires TOKEN_SIGNING_KEY_FILE '
+            'and TOKEN_SIGNING_KEY_ID'
+        )
+        raise ValueError(msg)
+    retired_keys_dir: Path | None = token_settings.RETIRED_KEYS_DIR
+    retired_public_keys: dict[str, str | bytes] = (
+        {
+            path.stem: path.read_bytes()
+            for path in retired_keys_dir.glob('*.pem')
+        }
+        if retired_keys_dir
+        else {}
+    )
+    return AsymmetricSigningBackend(
+        token_settings.ALGORITHM,
+        token_settings.SIGNING_KEY_ID,
+        token_settings.SIGNING_KEY_FILE.read_bytes(),
+        retired_public_keys,
+    )
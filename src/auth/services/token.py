@@ -1,20 +1,17 @@
+import hashlib
 import uuid
 from calendar import timegm
 from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar
 
-from jose import JWTError, jwt
-
-from src.auth.exceptions import (
-    AccessTokenExpiredException,
-    RefreshTokenException,
-    WrongCredentialsException,
-)
-from src.auth.models import RefreshToken
+from src.auth.exceptions import AccessTokenExpiredException
+from src.auth.services.signing import SigningBackend, create_signing_backend
+from src.base.cache import TTLCache
 from src.settings import Settings
 
 settings = Settings.load()
 
-type access_token = dict[str, str | datetime]
+type access_token = dict[str, Any]
 
 
 class TokenManager:
@@ -23,39 +20,63 @@ class TokenManager:
     This class provides functionality to:
     - Generate and decode JWT access tokens
     - Generate refresh tokens with expiration times
-    - Validate token expiration for both access and refresh tokens
+    - Validate access token expiration
+    - Cache verified access token claims until the token expires
 
     All methods are implemented as class methods for stateless operation.
+    Tokens are signed by the SigningBackend selected in TokenSettings,
+    which parses its keys once.
     """
 
+    _signing_backend: ClassVar[SigningBackend] = create_signing_backend(
+        settings.token_settings
+    )
+
+    _claims_cache: ClassVar[TTLCache[bytes, dict[str, str | int]]] = TTLCache(
+        'access_token_claims',
+        max_size=settings.token_settings.CLAIMS_CACHE_SIZE,
+    )
+
     @classmethod
-    def generate_access_token(cls, user_id: uuid.UUID) -> str:
+    def generate_access_token(
+        cls,
+        user_id: uuid.UUID,
+        token_version: int,
+        claims: dict[str, Any] | None = None,
+    ) -> str:
         """Generate a new JWT access token for the user.
 
+        The token carries a unique ``jti`` and the user's token version
+        ``ver``, so it can be revoked on its own or with all tokens of the
+        user issued before a version bump.
+
         :param user_id: UUID of the user to generate token for
+        :param token_version: Current token version of the user
+        :param claims: Additional signed claims, e.g. authorization claims
         :return: Bearer token string containing the JWT
         """
+        now = datetime.now(UTC)
         to_encode: access_token = {
+            **(claims or {}),
             'sub': str(user_id),
-            'exp': datetime.now(UTC)
+            'ver': token_version,
+            'jti': uuid.uuid4().hex,
+            'iat': now.timestamp(),
+            'exp': now
             + timedelta(
                 minutes=settings.token_settings.ACCESS_TOKEN_EXPIRE_MINUTES
             ),
         }
-        encoded_jwt: str = jwt.encode(
-            to_encode,
-            settings.token_settings.SECRET_KEY,
-            algorithm=settings.token_settings.ALGORITHM,
-        )
+        encoded_jwt: str = cls._signing_backend.encode(to_encode)
         return f'Bearer {encoded_jwt}'
 
     @classmethod
-    def generate_refresh_token(cls) -> tuple[uuid.UUID, timedelta]:
+    def generate_refresh_token(cls) -> tuple[uuid.UUID, datetime]:
         """Generate a new refresh token and its expiration time.
 
-        :return: Tuple of (UUID refresh token, timedelta expiration time)
+        :return: Tuple of (UUID refresh token, datetime of expiration)
         """
-        return uuid.uuid4(), timedelta(
+        return uuid.uuid4(), datetime.now(UTC) + timedelta(
             days=settings.token_settings.REFRESH_TOKEN_EXPIRE_DAYS
         )
 
@@ -65,15 +86,34 @@ class TokenManager:
 
         :param token: JWT token string to decode
         :return: Dictionary containing decoded token claims
+        :raises: WrongCredentialsException if the token is invalid
+        """
+        decoded_jwt: dict[str, str | int] = cls._signing_backend.decode(token)
+        return decoded_jwt
+
+    @classmethod
+    def verify_access_token(cls, token: str) -> dict[str, str | int]:
+        """Decode a JWT token and validate its expiration, using a cache.
+
+        Verified claims are cached under a digest of the token until the
+        token's ``exp``, so repeated requests with the same bearer token
+        skip signature verification. The returned dict is shared and must
+        not be modified.
+
+        :param token: JWT token string to verify
+        :return: Dictionary containing decoded token claims
+        :raises: WrongCredentialsException if the token is invalid
+        :raises: AccessTokenExpiredException if the token has expired
         """
-        try:
-            decoded_jwt: dict[str, str | int] = jwt.decode(
-                token=token,
-                key=settings.token_settings.SECRET_KEY,
-                algorithms=settings.token_settings.ALGORITHM,
-            )
-        except JWTError:
-            raise WrongCredentialsException from None
+        token_digest: bytes = hashlib.sha256(token.encode()).digest()
+        cached_claims = cls._claims_cache.get(token_digest)
+        if cached_claims is not None:
+            return cached_claims
+        decoded_jwt = cls.decode_access_token(token)
+        cls.validate_access_token_expired(decoded_jwt)
+        cls._claims_cache.set(
+            token_digest, decoded_jwt, expires_at=int(decoded_jwt['exp'])
+        )
         return decoded_jwt
 
     @classmethod
@@ -92,20 +132,9 @@ class TokenManager:
             raise AccessTokenExpiredException
 
     @classmethod
-    def validate_refresh_token_expired(
-        cls,
-        refresh_token_model: RefreshToken,
-    ) -> None:
-        """Check if the refresh token has expired.
+    def get_jwks(cls) -> dict[str, list[dict[str, Any]]]:
+        """Return the public keys verifying access tokens as a JWK set.
 
-        :param refresh_token_model: RefreshSessionModel instance
-        containing token details
-        :raises: RefreshTokenException if the token has not expired
+        :return: JWK set, empty for shared-secret algorithms
         """
-        current_date: datetime = datetime.now(UTC)
-        refresh_token_expire_date: datetime = (
-            refresh_token_model.created_at
-            + timedelta(seconds=refresh_token_model.expires_in)
-        )
-        if current_date >= refresh_token_expire_date:
-            raise RefreshTokenException
+        return cls._signing_backend.jwks()
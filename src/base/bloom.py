@@ -0,0 +1,58 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Compact probabilistic set of strings.
+
+    Membership checks never give false negatives: a key that was added is
+    always reported as present. Keys that were not added are reported as
+    present with about ``error_rate`` probability while the filter holds
+    at most ``capacity`` keys, and more often once it is overfilled.
+    Keys cannot be removed; build a new filter instead.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Initialize an empty filter sized for the expected keys.
+
+        Args:
+            capacity (int): Expected number of keys.
+            error_rate (float): Target false positive probability.
+
+        """
+        capacity = max(capacity, 1)
+        self._size: int = max(
+            math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2), 8
+        )
+        self._hash_count: int = max(
+            round(self._size / capacity * math.log(2)), 1
+        )
+        self._bits: bytearray = bytearray(math.ceil(self._size / 8))
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of added keys, counting duplicates."""
+        return self._count
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [
+            (first + i * second) % self._size for i in range(self._hash_count)
+        ]
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, key: object) -> bool:
+        """Return False if the key was definitely never added."""
+        if not isinstance(key, str):
+            return False
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
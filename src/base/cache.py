@@ -0,0 +1,107 @@
+import time
+from collections import OrderedDict
+
+from prometheus_client import Counter, Gauge
+
+CACHE_HITS_TOTAL = Counter(
+    'cache_hits_total', 'In-process cache hits.', ['cache']
+)
+CACHE_MISSES_TOTAL = Counter(
+    'cache_misses_total', 'In-process cache misses.', ['cache']
+)
+CACHE_ENTRIES = Gauge(
+    'cache_entries', 'Entries currently stored in the cache.', ['cache']
+)
+
+
+class TTLCache[Key, Value]:
+    """Bounded in-process cache with a per-entry expiry.
+
+    Entries are dropped when their expiry passes or, once the cache is
+    full, in least-recently-used order. Expiry is a wall-clock unix
+    timestamp, so it can be taken directly from a JWT ``exp`` claim.
+
+    The cache is not thread-safe; it is meant to be used from the event
+    loop of a single worker process.
+    """
+
+    def __init__(
+        self, name: str, max_size: int, ttl: float | None = None
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            name (str): Cache name used as the metrics label.
+            max_size (int): Maximum number of stored entries.
+            ttl (float | None): Default time to live in seconds. Entries
+                without ttl or expires_at never expire on their own.
+
+        """
+        self._name: str = name
+        self._max_size: int = max_size
+        self._ttl: float | None = ttl
+        self._entries: OrderedDict[Key, tuple[float, Value]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def name(self) -> str:
+        """Return the cache name."""
+        return self._name
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: Key) -> Value | None:
+        """Return the cached value or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                self.pop(key)
+            self.misses += 1
+            CACHE_MISSES_TOTAL.labels(self._name).inc()
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        CACHE_HITS_TOTAL.labels(self._name).inc()
+        return entry[1]
+
+    def set(
+        self,
+        key: Key,
+        value: Value,
+        ttl: float | None = None,
+        expires_at: float | None = None,
+    ) -> None:
+        """Store a value.
+
+        Args:
+            key (Key): Cache key.
+            value (Value): Value to store.
+            ttl (float | None): Time to live in seconds, overrides the
+                default ttl of the cache.
+            expires_at (float | None): Absolute unix timestamp of expiry,
+                overrides ttl.
+
+        """
+        if expires_at is None:
+            ttl = ttl if ttl is not None else self._ttl
+            expires_at = time.time() + ttl if ttl is not None else float('inf')
+        if expires_at <= time.time():
+            return  # Already expired, nothing to cache
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        CACHE_ENTRIES.labels(self._name).set(len(self._entries))
+
+    def pop(self, key: Key) -> None:
+        """Remove a key from the cache if it is present."""
+        self._entries.pop(key, None)
+        CACHE_ENTRIES.labels(self._name).set(len(self._entries))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._entries.clear()
+        CACHE_ENTRIES.labels(self._name).set(0)
@@ -1,26 +1,43 @@
 import datetime as dt
-import uuid
-from typing import Any, TypeVar, cast
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any, ClassVar, TypeVar, cast
 
 from pydantic import BaseModel
 from sqlalchemy import (
+    ColumnDefault,
     Delete,
     Result,
     Select,
     Update,
     and_,
+    any_,
+    bindparam,
+    column,
     desc,
+    func,
+    literal,
+    literal_column,
     or_,
     select,
+    text,
+    tuple_,
     update,
+    values,
 )
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.base.exceptions import InvalidCursorException
+from src.base.pagination import Page, decode_cursor, encode_cursor
 from src.database import Base
+from src.settings import Settings
+
+settings = Settings.load()
 
 Model = TypeVar('Model', bound=Base)
 CreateSchema = TypeVar('CreateSchema', bound=BaseModel)
+Schema = TypeVar('Schema', bound=BaseModel)
 
 
 class BaseDAO[
@@ -39,6 +56,14 @@ class BaseDAO[
     session and Pydantic schemas for data validation.
     """
 
+    # SELECTs of keyword-only lookups by model, filter names and eager
+    # loaded relations. Reusing one statement object spares rebuilding it
+    # and its cache key on every call; the values are bound on execution.
+    # The key space is bounded by the lookups written in the code.
+    _lookup_statements: ClassVar[dict[tuple[Any, ...], Select[Any]]] = {}
+    # Columns selected for a response schema, see _get_projection
+    _projections: ClassVar[dict[tuple[Any, ...], list[Any]]] = {}
+
     def __init__(self, session: AsyncSession, model: type[Model]):
         """Initialize a new BaseDAO instance."""
         self._session: AsyncSession = session
@@ -82,10 +107,208 @@ class BaseDAO[
         self.session.add(created_model)
         return created_model
 
+    @staticmethod
+    def _to_values(data: CreateSchema | dict[str, Any]) -> dict[str, Any]:
+        """Return the column values of a schema or dictionary row."""
+        if isinstance(data, dict):
+            return data
+        return cast(BaseModel, data).model_dump(exclude_unset=True)
+
+    @staticmethod
+    def _chunks(
+        rows: Sequence[dict[str, Any]],
+    ) -> Iterator[Sequence[dict[str, Any]]]:
+        """Split rows into chunks of at most BULK_CHUNK_SIZE rows."""
+        size = settings.database_settings.BULK_CHUNK_SIZE
+        for start in range(0, len(rows), size):
+            yield rows[start : start + size]
+
+    async def bulk_create(
+        self, data: Sequence[CreateSchema | dict[str, Any]]
+    ) -> list[Model]:
+        """Insert many records with multi-row INSERT ... RETURNING.
+
+        Rows are sent in chunks of BULK_CHUNK_SIZE, one statement each,
+        instead of one INSERT per ORM object.
+
+        Args:
+            data: Pydantic model instances or dictionaries, one per row.
+
+        Returns:
+            list[Model]: The created model instances, in input order.
+
+        Note:
+            The method does not commit the transaction. The caller is
+            responsible for that.
+
+        """
+        rows = [self._to_values(item) for item in data]
+        created: list[Model] = []
+        for chunk in self._chunks(rows):
+            result = await self.session.scalars(
+                insert(self.model).returning(
+                    self.model, sort_by_parameter_order=True
+                ),
+                chunk,
+            )
+            created.extend(result.all())
+        return created
+
+    async def bulk_update(self, data: Sequence[dict[str, Any]]) -> list[Model]:
+        """Update many records by ID with UPDATE ... FROM (VALUES ...).
+
+        Each dictionary holds the ``id`` of a record and its new column
+        values. Rows updating the same columns share one statement per
+        chunk of BULK_CHUNK_SIZE rows.
+
+        Args:
+            data: Dictionaries with an ``id`` key and the values to set.
+
+        Returns:
+            list[Model]: The updated model instances, in no particular
+                order. Rows whose ID matches no record are skipped.
+
+        Note:
+            The method does not commit the transaction. The caller is
+            responsible for that.
+
+        """
+        table = self.model.__table__  # type: ignore[attr-defined]
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in data:
+            columns = tuple(sorted(key for key in row if key != 'id'))
+            groups.setdefault(columns, []).append(row)
+        updated: list[Model] = []
+        for columns, rows in groups.items():
+            if not columns:
+                continue
+            names = ('id', *columns)
+            for chunk in self._chunks(rows):
+                new_values = values(
+                    *(column(name, table.c[name].type) for name in names),
+                    name='new_values',
+                ).data([tuple(row[name] for name in names) for row in chunk])
+                query: Update = (
+                    update(self.model)
+                    .where(table.c.id == new_values.c.id)
+                    .values({name: new_values.c[name] for name in columns})
+                    .returning(self.model)
+                    .execution_options(synchronize_session='fetch')
+                )
+                result = await self.session.scalars(query)
+                updated.extend(result.all())
+        return updated
+
+    async def upsert(
+        self,
+        data: Sequence[CreateSchema | dict[str, Any]],
+        conflict_columns: list[str],
+        update_columns: list[str] | None = None,
+    ) -> list[Model]:
+        """Insert many records, updating or skipping conflicting ones.
+
+        Runs INSERT ... ON CONFLICT DO UPDATE when update_columns is
+        given, ON CONFLICT DO NOTHING otherwise, in chunks of
+        BULK_CHUNK_SIZE rows. Columns updated on every UPDATE, like
+        ``updated_at``, are refreshed on conflict too.
+
+        Args:
+            data: Pydantic model instances or dictionaries, one per row.
+            conflict_columns: Columns of the unique constraint to check.
+            update_columns: Columns to overwrite on conflict, or None to
+                leave conflicting records untouched.
+
+        Returns:
+            list[Model]: The inserted and updated model instances. With
+                DO NOTHING, records that already existed are left out.
+
+        Note:
+            The method does not commit the transaction. The caller is
+            responsible for that.
+
+        """
+        rows = [self._to_values(item) for item in data]
+        query = insert(self.model)
+        if update_columns:
+            set_: dict[str, Any] = {
+                name: query.excluded[name] for name in update_columns
+            }
+            for column in self.model.__table__.c:  # type: ignore[attr-defined]
+                onupdate = column.onupdate
+                if (
+                    isinstance(onupdate, ColumnDefault)
+                    and onupdate.is_clause_element
+                    and column.name not in set_
+                ):
+                    set_[column.name] = onupdate.arg
+            query = query.on_conflict_do_update(
+                index_elements=conflict_columns, set_=set_
+            )
+        else:
+            query = query.on_conflict_do_nothing(
+                index_elements=conflict_columns
+            )
+        upserted: list[Model] = []
+        for chunk in self._chunks(rows):
+            result = await self.session.scalars(
+                query.returning(self.model),
+                chunk,
+                execution_options={'populate_existing': True},
+            )
+            upserted.extend(result.all())
+        return upserted
+
+    def _get_lookup_statement(
+        self, filter_names: tuple[str, ...], relations: tuple[str, ...] = ()
+    ) -> Select[Any]:
+        """Return the cached SELECT filtering by the given column names.
+
+        Each column is compared with a bound parameter of the same name.
+
+        Args:
+            filter_names: Names of the columns to filter by, sorted.
+            relations: Names of the relations to eager load.
+
+        Returns:
+            Select[Any]: Statement to execute with the filter values.
+
+        """
+        key = (self.model, filter_names, relations)
+        query: Select[Any] | None = self._lookup_statements.get(key)
+        if query is None:
+            query = (
+                select(self.model)
+                .where(
+                    *(
+                        getattr(self.model, name) == bindparam(name)
+                        for name in filter_names
+                    )
+                )
+                .options(
+                    *(
+                        selectinload(getattr(self.model, relation))
+                        for relation in relations
+                    )
+                )
+            )
+            self._lookup_statements[key] = query
+        return query
+
+    @staticmethod
+    def _is_lookup(
+        filters: tuple[Any, ...], filters_by: dict[str, Any]
+    ) -> bool:
+        """Return whether a query can use a cached lookup statement.
+
+        A None value is excluded, since filter_by renders it as IS NULL.
+        """
+        return not filters and None not in filters_by.values()
+
     async def _get(self, *filters: Any, **filters_by: Any) -> Result[Any]:
         """Execute a database query with the specified filters.
 
         Method that constructs and executes a SELECT query with filters.
+        Queries filtering by keywords only reuse a cached statement.
 
         Args:
             *filters: Variable length argument list of filter conditions
@@ -95,6 +318,9 @@ class BaseDAO[
             Result[Any]: SQLAlchemy Result object containing the query results
 
         """
+        if self._is_lookup(filters, filters_by):
+            lookup = self._get_lookup_statement(tuple(sorted(filters_by)))
+            return await self.session.execute(lookup, filters_by)
         query: Select[Any] = (
             select(self.model).where(*filters).filter_by(**filters_by)
         )
@@ -119,6 +345,8 @@ class BaseDAO[
     ) -> Model | None:
         """Retrieve a single record with specified relationships loaded.
 
+        Queries filtering by keywords only reuse a cached statement.
+
         Args:
             *filters: Positional SQLAlchemy filter expressions.
             relations (list[str]): List of relation names to eager load.
@@ -128,6 +356,12 @@ class BaseDAO[
             Model | None: Model instance with relations or None.
 
         """
+        if self._is_lookup(filters, filters_by):
+            lookup = self._get_lookup_statement(
+                tuple(sorted(filters_by)), tuple(relations)
+            )
+            result: Result[Any] = await self.session.execute(lookup, filters_by)
+            return result.scalar_one_or_none()
         options = [
             selectinload(getattr(self.model, relation))
             for relation in relations
@@ -138,58 +372,493 @@ class BaseDAO[
             .filter_by(**filters_by)
             .options(*options)
         )
-        result: Result[Any] = await self.session.execute(query)
+        result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def exists(self, *filters: Any, **filters_by: Any) -> bool:
+        """Check whether any record matches the specified filters.
+
+        Compiles to ``SELECT EXISTS (SELECT 1 ...)``, which stops at the
+        first matching row and transfers a single boolean.
+
+        Args:
+            *filters: Variable length argument list of filter conditions
+            **filters_by: Arbitrary kwargs for filtering by column values
+
+        Returns:
+            bool: True if at least one record matches.
+
+        """
+        subquery: Select[Any] = (
+            select(literal_column('1'))
+            .select_from(self.model)
+            .where(*filters)
+            .filter_by(**filters_by)
+        )
+        return bool(await self.session.scalar(select(subquery.exists())))
+
+    async def count(self, *filters: Any, **filters_by: Any) -> int:
+        """Count the records matching the specified filters.
+
+        Compiles to ``SELECT count(*)``. An exact count reads every
+        matching row, see estimated_count for whole tables.
+
+        Args:
+            *filters: Variable length argument list of filter conditions
+            **filters_by: Arbitrary kwargs for filtering by column values
+
+        Returns:
+            int: Number of matching records.
+
+        """
+        query: Select[Any] = (
+            select(func.count())
+            .select_from(self.model)
+            .where(*filters)
+            .filter_by(**filters_by)
+        )
+        return int(await self.session.scalar(query) or 0)
+
+    async def estimated_count(self) -> int:
+        """Return the planner's estimate of the number of records.
+
+        Reads ``pg_class.reltuples``, kept up to date by VACUUM, ANALYZE
+        and autovacuum, instead of scanning the table. Good enough for
+        totals of large tables; falls back to an exact count for a
+        table that was never analyzed.
+
+        Returns:
+            int: Estimated number of records in the table.
+
+        """
+        query = text(
+            'SELECT reltuples::bigint FROM pg_class '
+            'WHERE oid = to_regclass(:table_name)'
+        )
+        estimate = await self.session.scalar(
+            query,
+            {'table_name': self.model.__table__.fullname},  # type: ignore[attr-defined]
+        )
+        if estimate is None or estimate < 0:
+            return await self.count()
+        return int(estimate)
+
+    async def get_by_ids(
+        self,
+        ids: list[Any],
+        *filters: Any,
+        relations: list[str] | None = None,
+        **filters_by: Any,
+    ) -> list[Model]:
+        """Retrieve the records with any of the given IDs in one query.
+
+        The IDs are sent as a single array parameter of
+        ``WHERE id = ANY(...)``, so the statement is the same for any
+        number of IDs.
+
+        Args:
+            ids: IDs of the records to retrieve.
+            *filters: Variable length argument list of filter conditions
+            relations: Optional list of relation names to eager load.
+            **filters_by: Arbitrary kwargs for filtering by column values
+
+        Returns:
+            list[Model]: Found model instances, in no particular order.
+
+        """
+        if not ids:
+            return []
+        id_column = self.model.id  # type: ignore
+        query: Select[Any] = (
+            select(self.model)
+            .where(
+                id_column
+                == any_(bindparam('ids', ids, type_=ARRAY(id_column.type))),
+                *filters,
+            )
+            .filter_by(**filters_by)
+            .options(
+                *(
+                    selectinload(getattr(self.model, relation))
+                    for relation in relations or ()
+                )
+            )
+        )
+        result = await self.session.execute(query)
+        return cast(list[Model], result.scalars().all())
+
+    def _get_order_by(self, order_by: Sequence[str]) -> list[Any]:
+        """Return ORDER BY clauses of column names, ``-`` for descending."""
+        return [
+            desc(getattr(self.model, key[1:]))
+            if key.startswith('-')
+            else getattr(self.model, key)
+            for key in order_by
+        ]
+
     async def get_all(
         self,
-        created_at: dt.datetime | None = None,
-        last_id: uuid.UUID | None = None,
-        limit: int | None = None,
-        order_by: list[str] | None = None,
         *filters: Any,
+        limit: int | None = None,
+        order_by: Sequence[str] = ('-created_at', '-id'),
         **filters_by: Any,
-    ) -> list[Model] | None:
+    ) -> list[Model]:
         """Retrieve all records matching the specified filters.
 
+        Use get_page to paginate through large results.
+
         Args:
-            last_id: Optional UUID for filtering by last_id, for pagination
-            created_at: Optional datetime object for filtering by created_at
-            limit: Optional num for limiting the number of results returned.
-            order_by: Optional list of columns to order by.
             *filters: Variable length argument list of filter conditions
+            limit: Optional num for limiting the number of results returned.
+            order_by: Column names to order by, prefixed with ``-`` for
+                descending order.
             **filters_by: Arbitrary kwargs for filtering by column values
 
         Returns:
-            list[Model] | None: List of model instances matching the filters
+            list[Model]: List of model instances matching the filters
 
         """
-        pagination = []
-        if created_at and last_id:
-            pagination = [
-                or_(
-                    self.model.created_at < created_at,  # type: ignore
-                    and_(
-                        self.model.created_at == created_at,  # type: ignore
-                        self.model.id < last_id,  # type: ignore
-                    ),
-                )
-            ]
         query: Select[Any] = (
             select(self.model)
-            .where(*filters, *pagination)
+            .where(*filters)
             .filter_by(**filters_by)
-            .order_by(
-                desc(*order_by),  # type: ignore
-                desc(self.model.created_at),  # type: ignore
-                desc(self.model.id),  # type: ignore
-            )
+            .order_by(*self._get_order_by(order_by))
         )
         if limit:
             query = query.limit(limit)
         result = await self.session.execute(query)
         return cast(list[Model], result.scalars().all())
 
+    def _get_keyset_predicate(
+        self, order_by: Sequence[str], values: list[Any]
+    ) -> Any:
+        """Return the condition selecting rows after a sort key.
+
+        Sort keys in one direction compare as one row value, which lets
+        PostgreSQL seek straight to the start of the page in a matching
+        index. Mixed directions are expanded into the equivalent
+        ``a < :a OR (a = :a AND b > :b) ...`` condition.
+        """
+        columns = [getattr(self.model, key.lstrip('-')) for key in order_by]
+        descending = [key.startswith('-') for key in order_by]
+        if len(set(descending)) == 1:
+            after = tuple_(*columns)
+            before = tuple_(
+                *(
+                    literal(value, column.type)
+                    for column, value in zip(columns, values, strict=True)
+                )
+            )
+            return after < before if descending[0] else after > before
+        return or_(
+            *(
+                and_(
+                    *(columns[j] == values[j] for j in range(i)),
+                    columns[i] < values[i]
+                    if descending[i]
+                    else columns[i] > values[i],
+                )
+                for i in range(len(columns))
+            )
+        )
+
+    def _parse_cursor_values(
+        self, order_by: Sequence[str], values: list[Any]
+    ) -> list[Any]:
+        """Convert the JSON values of a cursor to the column types."""
+        parsed: list[Any] = []
+        try:
+            for key, value in zip(order_by, values, strict=True):
+                python_type = getattr(
+                    self.model, key.lstrip('-')
+                ).type.python_type
+                if python_type is dt.datetime:
+                    parsed.append(dt.datetime.fromisoformat(value))
+                else:
+                    parsed.append(python_type(value))
+        except (ArithmeticError, TypeError, ValueError) as exc:
+            raise InvalidCursorException from exc
+        return parsed
+
+    @staticmethod
+    def _get_sort_keys(order_by: Sequence[str]) -> list[str]:
+        """Return the sort keys with ``id`` appended when missing."""
+        keys = list(order_by)
+        if not any(key.lstrip('-') == 'id' for key in keys):
+            keys.append('-id' if keys and keys[-1].startswith('-') else 'id')
+        return keys
+
+    def _paginate(
+        self,
+        query: Select[Any],
+        keys: list[str],
+        limit: int,
+        cursor: str | None,
+    ) -> Select[Any]:
+        """Order a query by the sort keys and restrict it to one page."""
+        query = query.order_by(*self._get_order_by(keys)).limit(
+            limit + 1  # One more row tells if a next page exists
+        )
+        if cursor is None:
+            return query
+        values = self._parse_cursor_values(keys, decode_cursor(cursor, keys))
+        return query.where(self._get_keyset_predicate(keys, values))
+
+    async def get_page(
+        self,
+        *filters: Any,
+        order_by: Sequence[str],
+        limit: int,
+        cursor: str | None = None,
+        **filters_by: Any,
+    ) -> Page[Model]:
+        """Retrieve one page of records with keyset pagination.
+
+        Instead of an OFFSET, the page starts right after the sort key of
+        the last row of the previous page, encoded in a signed cursor.
+        With an index matching order_by, a deep page costs the same as
+        the first one. ``id`` is appended to the sort keys when missing,
+        so the order is total and no row is skipped or repeated. The
+        sort key columns must not be nullable.
+
+        Args:
+            *filters: Variable length argument list of filter conditions
+            order_by: Column names to order by, prefixed with ``-`` for
+                descending order.
+            limit: Maximum number of records in the page.
+            cursor: next_cursor of the previous page, None for the first.
+            **filters_by: Arbitrary kwargs for filtering by column values
+
+        Returns:
+            Page[Model]: Records of the page and the cursor of the next.
+
+        Raises:
+            InvalidCursorException: If the cursor is invalid or was issued
+                for another ordering.
+
+        """
+        keys = self._get_sort_keys(order_by)
+        query: Select[Any] = self._paginate(
+            select(self.model).where(*filters).filter_by(**filters_by),
+            keys,
+            limit,
+            cursor,
+        )
+        result = await self.session.scalars(query)
+        items = cast(list[Model], result.all())
+        if len(items) <= limit:
+            return Page(items=items, next_cursor=None)
+        items = items[:limit]
+        next_cursor = encode_cursor(
+            keys, [getattr(items[-1], key.lstrip('-')) for key in keys]
+        )
+        return Page(items=items, next_cursor=next_cursor)
+
+    def _get_projection(
+        self, schema: type[BaseModel], extra: Sequence[str] = ()
+    ) -> list[Any]:
+        """Return the columns of the model a schema, and extra names, need.
+
+        Optional schema fields that are not columns of the model are
+        skipped and keep their default.
+
+        Raises:
+            ValueError: If a required field of the schema is not a column
+                of the model, e.g. a relation.
+
+        """
+        key = (self.model, schema, tuple(extra))
+        columns = self._projections.get(key)
+        if columns is None:
+            mapper = self.model.__mapper__  # type: ignore[attr-defined]
+            column_names = set(mapper.column_attrs.keys())
+            missing = [
+                name
+                for name, field in schema.model_fields.items()
+                if field.is_required() and name not in column_names
+            ]
+            if missing:
+                msg = (
+                    f'{schema.__name__} can not be selected from '
+                    f'{self.model.__name__}, required fields '
+                    f'{", ".join(missing)} are not columns'
+                )
+                raise ValueError(msg)
+            names = dict.fromkeys(
+                name
+                for name in (*schema.model_fields, *extra)
+                if name in column_names
+            )
+            columns = [getattr(self.model, name) for name in names]
+            self._projections[key] = columns
+        return columns
+
+    async def get_one_projected(
+        self, schema: type[Schema], *filters: Any, **filters_by: Any
+    ) -> Schema | None:
+        """Retrieve a single record as a schema, selecting only its columns.
+
+        The row is validated straight into the schema: no ORM instance is
+        built and the identity map is not involved, so use it for read
+        only responses.
+
+        Args:
+            schema: Response schema whose fields are model columns.
+            *filters: Variable length argument list of filter conditions
+            **filters_by: Arbitrary kwargs for filtering by column values
+
+        Returns:
+            Schema | None: Schema instance of the record or None.
+
+        """
+        query: Select[Any] = (
+            select(*self._get_projection(schema))
+            .where(*filters)
+            .filter_by(**filters_by)
+        )
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+        return None if row is None else schema.model_validate(row._asdict())
+
+    async def get_page_projected(
+        self,
+        schema: type[Schema],
+        *filters: Any,
+        order_by: Sequence[str],
+        limit: int,
+        cursor: str | None = None,
+        **filters_by: Any,
+    ) -> Page[Schema]:
+        """Retrieve one page of records as schemas, see get_page.
+
+        Only the columns of the schema, plus the sort keys, are selected
+        and the rows are validated straight into the schema, like in
+        get_one_projected. Cursors are the same as those of get_page.
+
+        Args:
+            schema: Response schema whose fields are model columns.
+            *filters: Variable length argument list of filter conditions
+            order_by: Column names to order by, prefixed with ``-`` for
+                descending order.
+            limit: Maximum number of records in the page.
+            cursor: next_cursor of the previous page, None for the first.
+            **filters_by: Arbitrary kwargs for filtering by column values
+
+        Returns:
+            Page[Schema]: Schemas of the page and the cursor of the next.
+
+        Raises:
+            InvalidCursorException: If the cursor is invalid or was issued
+                for another ordering.
+
+        """
+        keys = self._get_sort_keys(order_by)
+        columns = self._get_projection(
+            schema, [key.lstrip('-') for key in keys]
+        )
+        query: Select[Any] = self._paginate(
+            select(*columns).where(*filters).filter_by(**filters_by),
+            keys,
+            limit,
+            cursor,
+        )
+        result = await self.session.execute(query)
+        rows = result.all()
+        next_cursor: str | None = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_row = rows[-1]._mapping  # noqa: SLF001
+            next_cursor = encode_cursor(
+                keys, [last_row[key.lstrip('-')] for key in keys]
+            )
+        return Page(
+            items=[schema.model_validate(row._asdict()) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    def _get_stream_query(
+        self,
+        query: Select[Any],
+        order_by: Sequence[str] | None,
+        fetch_size: int | None,
+    ) -> Select[Any]:
+        """Order a query to stream and set its server-side fetch size."""
+        if order_by:
+            query = query.order_by(*self._get_order_by(order_by))
+        return query.execution_options(
+            yield_per=fetch_size or settings.database_settings.STREAM_FETCH_SIZE
+        )
+
+    async def stream(
+        self,
+        *filters: Any,
+        order_by: Sequence[str] | None = None,
+        fetch_size: int | None = None,
+        **filters_by: Any,
+    ) -> AsyncIterator[Model]:
+        """Iterate over the matching records through a server-side cursor.
+
+        Rows are fetched fetch_size at a time, so walking a whole table
+        runs in constant memory. The session must be in a transaction
+        for the whole iteration, and can't run other statements
+        meanwhile.
+
+        Args:
+            *filters: Variable length argument list of filter conditions
+            order_by: Optional column names to order by, prefixed with
+                ``-`` for descending order. Unordered by default.
+            fetch_size: Rows per fetch, DB_STREAM_FETCH_SIZE by default.
+            **filters_by: Arbitrary kwargs for filtering by column values
+
+        Yields:
+            Model: Model instances matching the filters.
+
+        """
+        query = self._get_stream_query(
+            select(self.model).where(*filters).filter_by(**filters_by),
+            order_by,
+            fetch_size,
+        )
+        result = await self.session.stream_scalars(query)
+        async for item in result:
+            yield item
+
+    async def stream_projected(
+        self,
+        schema: type[Schema],
+        *filters: Any,
+        order_by: Sequence[str] | None = None,
+        fetch_size: int | None = None,
+        **filters_by: Any,
+    ) -> AsyncIterator[Schema]:
+        """Iterate over the matching records as schemas, see stream.
+
+        Only the columns of the schema are selected, like in
+        get_one_projected.
+
+        Args:
+            schema: Response schema whose fields are model columns.
+            *filters: Variable length argument list of filter conditions
+            order_by: Optional column names to order by, prefixed with
+                ``-`` for descending order. Unordered by default.
+            fetch_size: Rows per fetch, DB_STREAM_FETCH_SIZE by default.
+            **filters_by: Arbitrary kwargs for filtering by column values
+
+        Yields:
+            Schema: Schema instances of the matching records.
+
+        """
+        query = self._get_stream_query(
+            select(*self._get_projection(schema))
+            .where(*filters)
+            .filter_by(**filters_by),
+            order_by,
+            fetch_size,
+        )
+        result = await self.session.stream(query)
+        async for row in result:
+            yield schema.model_validate(row._asdict())
+
     async def update(
         self,
         update_data: dict[str, Any],
@@ -54,7 +54,9 @@ def get_service[Service](
 
     """
 
-    def _get_service(db: Annotated[AsyncSession, Depends(get_db)]) -> Service:
+    def _get_service(
+        db: Annotated[AsyncSession, Depends(get_db)],
+    ) -> Service:
         return service_type(db_session=db)  # type: ignore
 
     return _get_service
@@ -0,0 +1,12 @@
+from fastapi import HTTPException
+
+
+class InvalidCursorException(HTTPException):
+    """Exception raised when a pagination cursor is invalid or tampered."""
+
+    def __init__(self) -> None:
+        """Initialize InvalidCursorException with status 422."""
+        super().__init__(
+            status_code=422,
+            detail='Invalid pagination cursor',
+        )
@@ -0,0 +1,136 @@
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidationBus:
+    """Propagates cache invalidations to every worker process.
+
+    Built on PostgreSQL LISTEN/NOTIFY. ``publish`` evicts the key locally
+    right away and sends NOTIFY in the caller's transaction, so every
+    worker, including the publishing one, evicts again once the change
+    is committed. A worker that loses its listening connection clears
+    its caches after reconnecting, since notifications may have been
+    missed in between.
+    """
+
+    def __init__(self, reconnect_delay: float = 5.0) -> None:
+        """Initialize the bus without subscribers.
+
+        Args:
+            reconnect_delay (float): Seconds to wait before reconnecting
+                the listening connection after an error.
+
+        """
+        self._handlers: defaultdict[str, list[Callable[[str], None]]] = (
+            defaultdict(list)
+        )
+        self._reset_handlers: list[Callable[[], None]] = []
+        self._reconnect_delay: float = reconnect_delay
+        self._task: asyncio.Task[None] | None = None
+
+    def subscribe(
+        self,
+        channel: str,
+        handler: Callable[[str], None],
+        on_reset: Callable[[], None] | None = None,
+    ) -> None:
+        """Register a handler for invalidations published on a channel.
+
+        Args:
+            channel (str): Notification channel name.
+            handler (Callable[[str], None]): Called with the invalidated
+                key.
+            on_reset (Callable[[], None] | None): Called when
+                notifications could have been missed and everything
+                must be dropped.
+
+        """
+        self._handlers[channel].append(handler)
+        if on_reset:
+            self._reset_handlers.append(on_reset)
+
+    async def publish(
+        self, session: AsyncSession, channel: str, key: str
+    ) -> None:
+        """Invalidate a key in this process and notify the other workers.
+
+        Args:
+            session (AsyncSession): Session of the transaction that
+                changes the data. Other workers are notified on commit.
+            channel (str): Notification channel name.
+            key (str): Invalidated cache key.
+
+        """
+        self._dispatch(channel, key)
+        await session.execute(select(func.pg_notify(channel, key)))
+
+    def _dispatch(self, channel: str, key: str) -> None:
+        for handler in self._handlers.get(channel, []):
+            handler(key)
+
+    def _reset(self) -> None:
+        for on_reset in self._reset_handlers:
+            on_reset()
+
+    def _on_notification(
+        self, _: Any, __: int, channel: str, payload: str
+    ) -> None:
+        self._dispatch(channel, payload)
+
+    async def _listen(self, engine: AsyncEngine) -> None:
+        while True:
+            try:
+                async with engine.connect() as connection:
+                    raw_connection = await connection.get_raw_connection()
+                    # asyncpg connection, LISTEN is not exposed by SQLAlchemy
+                    driver_connection: Any = raw_connection.driver_connection
+                    try:
+                        for channel in self._handlers:
+                            await driver_connection.add_listener(
+                                channel, self._on_notification
+                            )
+                        self._reset()
+                        while True:  # Keepalive to notice a dead connection
+                            await asyncio.sleep(self._reconnect_delay)
+                            await driver_connection.execute('SELECT 1')
+                    finally:
+                        # Never hand a connection with listeners back to
+                        # the pool.
+                        await connection.invalidate()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('Cache invalidation listener failed')
+                self._reset()
+                await asyncio.sleep(self._reconnect_delay)
+
+    def start(self, engine: AsyncEngine) -> None:
+        """Start listening for invalidations from other workers.
+
+        Args:
+            engine (AsyncEngine): Engine used for the listening connection.
+                The connection is held for the lifetime of the listener.
+
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(engine))
+
+    async def stop(self) -> None:
+        """Stop listening for invalidations."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+invalidation_bus = CacheInvalidationBus()
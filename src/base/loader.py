@@ -0,0 +1,168 @@
+import asyncio
+import uuid
+from typing import Any
+
+from prometheus_client import Histogram
+
+from src.base.dao import BaseDAO
+
+BATCH_LOADER_BATCH_SIZE = Histogram(
+    'batch_loader_batch_size',
+    'IDs fetched by one batch loader query.',
+    ['model'],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250),
+)
+
+# Keys of Session.info holding the loaders of a session and the lock
+# keeping their queries from running concurrently on it
+_LOADERS = 'batch_loaders'
+_LOADERS_LOCK = 'batch_loaders_lock'
+
+
+class BatchLoader[Model]:
+    """Load rows by ID, coalescing the loads of one event loop tick.
+
+    Every ``load`` made before the event loop gets back to the loader
+    is served by a single ``WHERE id = ANY(...)`` query. Results,
+    including missing rows, are memoized for the lifetime of the loader,
+    which is the session it belongs to, see ``get_batch_loader``.
+
+    The loader is not thread-safe; it is meant to be used from the event
+    loop of a single worker process.
+    """
+
+    def __init__(
+        self,
+        dao: BaseDAO[Model, Any],
+        relations: tuple[str, ...] = (),
+        **filters_by: Any,
+    ) -> None:
+        """Initialize a loader without any loaded row.
+
+        Args:
+            dao (BaseDAO): DAO of the model to load.
+            relations (tuple[str, ...]): Relations to eager load.
+            **filters_by (Any): Column filters every loaded row must match,
+                rows failing them load as None.
+
+        """
+        self._dao: BaseDAO[Model, Any] = dao
+        self._relations: tuple[str, ...] = relations
+        self._filters_by: dict[str, Any] = filters_by
+        self._memo: dict[uuid.UUID, asyncio.Future[Model | None]] = {}
+        self._pending: list[uuid.UUID] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, id_: uuid.UUID | str) -> Model | None:
+        """Return the row with the given ID, or None if there is none.
+
+        Args:
+            id_ (uuid.UUID | str): ID of the row.
+
+        Returns:
+            Model | None: The loaded row or None.
+
+        """
+        key = id_ if isinstance(id_, uuid.UUID) else uuid.UUID(id_)
+        future = self._memo.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._memo[key] = future
+            self._pending.append(key)
+            if len(self._pending) == 1:
+                loop.call_soon(self._dispatch)
+        # Shielded, a cancelled caller must not fail the other waiters
+        return await asyncio.shield(future)
+
+    async def load_many(self, ids: list[uuid.UUID | str]) -> list[Model | None]:
+        """Return the rows with the given IDs in one query.
+
+        Args:
+            ids (list[uuid.UUID | str]): IDs of the rows.
+
+        Returns:
+            list[Model | None]: Rows in the order of ids, None if missing.
+
+        """
+        return list(await asyncio.gather(*(self.load(id_) for id_ in ids)))
+
+    def clear(self, id_: uuid.UUID | str | None = None) -> None:
+        """Forget a loaded row, or every row, so it is loaded again.
+
+        Args:
+            id_ (uuid.UUID | str | None): ID of the row, None for all.
+
+        """
+        if id_ is None:
+            self._memo.clear()
+            return
+        key = id_ if isinstance(id_, uuid.UUID) else uuid.UUID(id_)
+        self._memo.pop(key, None)
+
+    def _dispatch(self) -> None:
+        batch = {key: self._memo[key] for key in self._pending}
+        self._pending = []
+        task = asyncio.get_running_loop().create_task(self._fetch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(
+        self, batch: dict[uuid.UUID, asyncio.Future[Model | None]]
+    ) -> None:
+        BATCH_LOADER_BATCH_SIZE.labels(self._dao.model.__name__).observe(
+            len(batch)
+        )
+        lock: asyncio.Lock = self._dao.session.info.setdefault(
+            _LOADERS_LOCK, asyncio.Lock()
+        )
+        try:
+            async with lock:
+                rows = await self._dao.get_by_ids(
+                    list(batch),
+                    relations=list(self._relations),
+                    **self._filters_by,
+                )
+        except Exception as exc:
+            for key, future in batch.items():
+                # Failed loads are not memoized, the next load retries
+                if self._memo.get(key) is future:
+                    del self._memo[key]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        by_id = {row.id: row for row in rows}  # type: ignore[attr-defined]
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(by_id.get(key))
+
+
+def get_batch_loader[Model](
+    dao: BaseDAO[Model, Any],
+    relations: tuple[str, ...] = (),
+    **filters_by: Any,
+) -> BatchLoader[Model]:
+    """Return the batch loader of a DAO session, creating it if needed.
+
+    Loaders live in ``Session.info``, so within a request, services and
+    permission dependencies share one loader, and its memo, per model,
+    relations and filters.
+
+    Args:
+        dao (BaseDAO): DAO of the model to load.
+        relations (tuple[str, ...]): Relations to eager load.
+        **filters_by (Any): Column filters every loaded row must match.
+
+    Returns:
+        BatchLoader: Loader bound to the DAO session.
+
+    """
+    loaders: dict[tuple[Any, ...], BatchLoader[Any]] = (
+        dao.session.info.setdefault(_LOADERS, {})
+    )
+    key = (dao.model, relations, tuple(sorted(filters_by.items())))
+    loader = loaders.get(key)
+    if loader is None:
+        loader = BatchLoader(dao, relations, **filters_by)
+        loaders[key] = loader
+    return loader
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, func
+from sqlalchemy import TIMESTAMP, Boolean, Float, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -33,3 +33,22 @@ class BaseTimeStampMixin(Base):
         server_default=func.now(),
         onupdate=func.now(),
     )
+
+
+class RateLimitBucket(Base):
+    """Token bucket state of the shared rate limit backend.
+
+    The table is UNLOGGED: it is written on every rate-limited request
+    and losing it on a crash only resets the limits.
+    """
+
+    __tablename__ = 'rate_limit_buckets'
+    __table_args__ = ({'prefixes': ['UNLOGGED']},)
+
+    key: Mapped[str] = mapped_column(String(320), primary_key=True)
+    tokens: Mapped[float] = mapped_column(Float, nullable=False)
+    allowed: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+    )
@@ -0,0 +1,119 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+from src.base.exceptions import InvalidCursorException
+from src.settings import PaginationSettings, Settings
+
+settings = Settings.load()
+
+# Truncated HMAC-SHA256, enough to make cursors unforgeable
+_SIGNATURE_SIZE = 16
+
+
+def _get_cursor_key(pagination_settings: PaginationSettings) -> bytes:
+    """Return the key signing cursors, failing at startup if it is unset.
+
+    Args:
+        pagination_settings (PaginationSettings): Pagination settings.
+
+    Returns:
+        bytes: HMAC key of the cursors.
+
+    Raises:
+        ValueError: If PAGINATION_CURSOR_SECRET is empty.
+
+    """
+    if not pagination_settings.CURSOR_SECRET:
+        msg = 'Keyset pagination requires PAGINATION_CURSOR_SECRET'
+        raise ValueError(msg)
+    return pagination_settings.CURSOR_SECRET.encode()
+
+
+_CURSOR_KEY = _get_cursor_key(settings.pagination_settings)
+
+
+@dataclass(frozen=True, slots=True)
+class Page[Model]:
+    """One page of a keyset-paginated query.
+
+    Attributes:
+        items (list[Model]): Rows of the page, in query order.
+        next_cursor (str | None): Cursor of the next page, None if this
+            is the last one.
+
+    """
+
+    items: list[Model]
+    next_cursor: str | None
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+def _sign(payload: str) -> bytes:
+    return hmac.new(
+        _CURSOR_KEY, f'cursor.{payload}'.encode(), hashlib.sha256
+    ).digest()[:_SIGNATURE_SIZE]
+
+
+def encode_cursor(order_by: Sequence[str], values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row of a page as a signed cursor.
+
+    The ordering is signed with the values, so a cursor is only accepted
+    by the query it was issued for.
+
+    Args:
+        order_by (Sequence[str]): Sort keys of the query.
+        values (Sequence[Any]): Values of the sort keys in the last row.
+
+    Returns:
+        str: Opaque URL-safe cursor.
+
+    """
+    payload = _b64encode(
+        json.dumps(
+            [list(order_by), to_jsonable_python(list(values))],
+            separators=(',', ':'),
+        ).encode()
+    )
+    return f'{payload}.{_b64encode(_sign(payload))}'
+
+
+def decode_cursor(cursor: str, order_by: Sequence[str]) -> list[Any]:
+    """Verify a cursor and return its sort key values, as JSON values.
+
+    Args:
+        cursor (str): Cursor from encode_cursor.
+        order_by (Sequence[str]): Sort keys of the query.
+
+    Returns:
+        list[Any]: Values of the sort keys.
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed, tampered or
+            was issued for another ordering.
+
+    """
+    payload, _, signature = cursor.partition('.')
+    try:
+        if not hmac.compare_digest(_b64decode(signature), _sign(payload)):
+            raise InvalidCursorException
+        cursor_order_by, values = json.loads(_b64decode(payload))
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise InvalidCursorException from exc
+    if cursor_order_by != list(order_by) or not isinstance(values, list):
+        raise InvalidCursorException
+    return values
@@ -4,6 +4,7 @@ from typing import TypedDict, Unpack
 
 from fastapi.requests import Request
 
+from src.auth.schemas import AuthorPrincipal, UserPrincipal
 from src.courses.models import Course
 from src.lessons.models import Lesson
 from src.users import Author, User
@@ -15,17 +16,19 @@ class PermissionKwargs(TypedDict, total=False):
     """TypedDict for keyword arguments passed to permission classes.
 
     Attributes:
-        user (User | None): The current authenticated user.
+        user (User | UserPrincipal | None): The current authenticated
+            user, or its identity from access token claims.
         target_user (User): Target user for permission checks.
-        author (Author | None): The current author.
+        author (Author | AuthorPrincipal | None): The current author, or
+            its identity from access token claims.
         course (Course): Target course for permission checks.
         lesson (Lesson): Target lesson for permission checks.
 
     """
 
-    user: User | None
+    user: User | UserPrincipal | None
     target_user: User
-    author: Author | None
+    author: Author | AuthorPrincipal | None
     course: Course
     lesson: Lesson
 
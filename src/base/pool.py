@@ -0,0 +1,74 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    QueuePool,
+)
+
+DB_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting for a database connection from the pool.',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_POOL_CHECKOUT_TIMEOUTS_TOTAL = Counter(
+    'db_pool_checkout_timeouts_total',
+    'Connection checkouts that gave up after the pool timeout.',
+)
+DB_POOL_SIZE = Gauge('db_pool_size', 'Configured size of the pool.')
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out', 'Connections currently checked out.'
+)
+DB_POOL_CHECKED_IN = Gauge(
+    'db_pool_checked_in', 'Idle connections kept in the pool.'
+)
+DB_POOL_OVERFLOW = Gauge(
+    'db_pool_overflow',
+    'Connections opened beyond the pool size, negative while the pool '
+    'has not been filled yet.',
+)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool reporting how long checkouts wait.
+
+    The wait includes opening a new connection when the pool has room
+    for one, so slow connects show up as well.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS_TOTAL.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+
+def register_pool_metrics(engine: AsyncEngine) -> None:
+    """Report the live state of the engine's pool in the pool gauges.
+
+    The gauges read the pool on every scrape, so a pool recreated after
+    ``dispose`` is reported as well.
+
+    Args:
+        engine (AsyncEngine): Engine with a QueuePool based pool.
+
+    """
+
+    def pool() -> QueuePool:
+        current_pool = engine.sync_engine.pool
+        if not isinstance(current_pool, QueuePool):
+            msg = f'{type(current_pool).__name__} has no pool statistics'
+            raise TypeError(msg)
+        return current_pool
+
+    DB_POOL_SIZE.set_function(lambda: pool().size())
+    DB_POOL_CHECKED_OUT.set_function(lambda: pool().checkedout())
+    DB_POOL_CHECKED_IN.set_function(lambda: pool().checkedin())
+    DB_POOL_OVERFLOW.set_function(lambda: pool().overflow())
@@ -0,0 +1,207 @@
+import logging
+import time
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.settings import QueryBudgetSettings
+
+logger = logging.getLogger(__name__)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    'db_queries_per_request',
+    'SQL statements executed while handling a request.',
+    ['method', 'route'],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 20, 30, 50, 100),
+)
+DB_SECONDS_PER_REQUEST = Histogram(
+    'db_seconds_per_request',
+    'Time spent executing SQL statements while handling a request.',
+    ['method', 'route'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_QUERY_BUDGET_EXCEEDED_TOTAL = Counter(
+    'db_query_budget_exceeded_total',
+    'Requests that exceeded the query budget.',
+    ['route', 'reason'],
+)
+
+# Key of Connection.info holding the start time of the running statement
+_STARTED_AT = 'query_budget_started_at'
+
+# Route label of requests not matching any route
+_UNMATCHED_ROUTE = '<unmatched>'
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """Raised when a request exceeds its query budget in raise mode."""
+
+
+@dataclass(slots=True)
+class RequestQueries:
+    """SQL statements executed while handling one request.
+
+    Attributes:
+        scope (Scope): ASGI scope of the request, routed once the
+            endpoint runs.
+        count (int): Executed statements.
+        seconds (float): Total execution time of the statements.
+        repeats (StatementCounter[str]): Executions of every statement,
+            by SQL text.
+        exceeded (set[str]): Budget limits already reported.
+
+    """
+
+    scope: Scope
+    count: int = 0
+    seconds: float = 0.0
+    repeats: StatementCounter[str] = field(default_factory=StatementCounter)
+    exceeded: set[str] = field(default_factory=set)
+
+    @property
+    def route(self) -> str:
+        """Path template of the matched route."""
+        route = self.scope.get('route')
+        return getattr(route, 'path', _UNMATCHED_ROUTE)
+
+
+_request_queries: ContextVar[RequestQueries | None] = ContextVar(
+    'request_queries', default=None
+)
+
+
+def get_request_route() -> str | None:
+    """Return the route template of the current request, if any."""
+    queries = _request_queries.get()
+    return queries.route if queries is not None else None
+
+
+class QueryBudget:
+    """Count the SQL statements of requests against a budget.
+
+    Statements are attributed to the request whose context executes
+    them, including the tasks it starts. Repeats are detected on the SQL
+    text, which is the same for every execution of a statement shape,
+    so an N+1 pattern shows up as one statement repeated N times.
+    """
+
+    def __init__(self, query_budget_settings: QueryBudgetSettings) -> None:
+        """Initialize the budget.
+
+        Args:
+            query_budget_settings (QueryBudgetSettings): Budget limits and
+                what to do when they are exceeded.
+
+        """
+        self._mode: str = query_budget_settings.MODE
+        self._max_queries: int = query_budget_settings.MAX_QUERIES
+        self._max_repeats: int = query_budget_settings.MAX_REPEATS
+
+    def register(self, engine: AsyncEngine) -> None:
+        """Count the statements executed through an engine.
+
+        Args:
+            engine (AsyncEngine): Engine to instrument.
+
+        """
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, 'before_cursor_execute', self._on_execute)
+        event.listen(sync_engine, 'after_cursor_execute', self._on_executed)
+
+    def _on_execute(
+        self, conn: Connection, _: Any, statement: str, *__: Any
+    ) -> None:
+        queries = _request_queries.get()
+        if queries is not None:
+            queries.count += 1
+            queries.repeats[statement] += 1
+            if self._mode != 'off':
+                self._check(queries, statement)
+        conn.info[_STARTED_AT] = time.perf_counter()
+
+    def _on_executed(self, conn: Connection, *_: Any) -> None:
+        started_at = conn.info.pop(_STARTED_AT, None)
+        queries = _request_queries.get()
+        if queries is not None and started_at is not None:
+            queries.seconds += time.perf_counter() - started_at
+
+    def _check(self, queries: RequestQueries, statement: str) -> None:
+        if self._max_queries and queries.count > self._max_queries:
+            self._exceed(
+                queries,
+                'queries',
+                f'{queries.count} SQL statements, the budget is '
+                f'{self._max_queries}',
+                statement,
+            )
+        repeats = queries.repeats[statement]
+        if self._max_repeats and repeats > self._max_repeats:
+            self._exceed(
+                queries,
+                'repeats',
+                f'the same SQL statement {repeats} times, the budget is '
+                f'{self._max_repeats}',
+                statement,
+            )
+
+    def _exceed(
+        self,
+        queries: RequestQueries,
+        reason: str,
+        message: str,
+        statement: str,
+    ) -> None:
+        if reason in queries.exceeded:
+            return
+        queries.exceeded.add(reason)
+        DB_QUERY_BUDGET_EXCEEDED_TOTAL.labels(queries.route, reason).inc()
+        message = (
+            f'{queries.scope["method"]} {queries.route} ran {message}, '
+            f'last statement: {statement}'
+        )
+        if self._mode == 'raise':
+            raise QueryBudgetExceededError(message)
+        logger.warning(message, stack_info=True)
+
+
+class QueryBudgetMiddleware:
+    """Record the SQL statements and database time of every request.
+
+    The counts are observed per route template once the response is
+    sent, so the body of streamed responses is included.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app (ASGIApp): Wrapped application.
+
+        """
+        self.app: ASGIApp = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Handle a request in a context collecting its statements."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        queries = RequestQueries(scope)
+        token = _request_queries.set(queries)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_queries.reset(token)
+            DB_QUERIES_PER_REQUEST.labels(
+                scope['method'], queries.route
+            ).observe(queries.count)
+            DB_SECONDS_PER_REQUEST.labels(
+                scope['method'], queries.route
+            ).observe(queries.seconds)
@@ -0,0 +1,193 @@
+import hashlib
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from prometheus_client import Counter
+from sqlalchemy import case, func, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.base.models import RateLimitBucket
+from src.database import async_db_session
+from src.settings import RateLimitSettings
+
+RATE_LIMIT_REJECTED_TOTAL = Counter(
+    'rate_limit_rejected_total',
+    'Requests rejected by a rate limiter.',
+    ['limiter'],
+)
+
+
+class RateLimitBackend(ABC):
+    """Storage of token buckets shared by rate limiters.
+
+    A bucket holds up to ``capacity`` tokens and refills at ``rate``
+    tokens per second. Every request takes one token; a request finding
+    less than one token is rejected and takes nothing.
+    """
+
+    @abstractmethod
+    async def consume(self, key: str, capacity: float, rate: float) -> float:
+        """Take one token from the bucket of a key.
+
+        Args:
+            key (str): Bucket key.
+            capacity (float): Maximum tokens in the bucket.
+            rate (float): Tokens refilled per second.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until the
+                next token is available.
+
+        """
+        ...
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Token buckets stored in the memory of a single worker process.
+
+    Limits are enforced per worker. Least recently used buckets are
+    dropped above ``max_keys``, which only makes those keys start over
+    with a full bucket.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        """Initialize an empty bucket store.
+
+        Args:
+            max_keys (int): Maximum number of stored buckets.
+
+        """
+        self._max_keys: int = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, capacity: float, rate: float) -> float:
+        """Take one token from the bucket of a key."""
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * rate)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class PostgresRateLimitBackend(RateLimitBackend):
+    """Token buckets shared by all workers in an UNLOGGED table.
+
+    Every check is a single upsert in its own short transaction, so the
+    bucket row is locked only for the duration of that statement.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        """Initialize the backend.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Factory of
+                sessions used for the bucket updates.
+
+        """
+        self._session_factory = session_factory
+
+    async def consume(self, key: str, capacity: float, rate: float) -> float:
+        """Take one token from the bucket of a key."""
+        elapsed = func.extract('epoch', func.now() - RateLimitBucket.updated_at)
+        refilled = func.least(
+            literal(capacity), RateLimitBucket.tokens + elapsed * literal(rate)
+        )
+        query = (
+            insert(RateLimitBucket)
+            .values(
+                key=key,
+                tokens=capacity - 1,
+                allowed=True,
+                updated_at=func.now(),
+            )
+            .on_conflict_do_update(
+                index_elements=[RateLimitBucket.key],
+                set_={
+                    'tokens': case(
+                        (refilled >= 1, refilled - 1), else_=refilled
+                    ),
+                    'allowed': refilled >= 1,
+                    'updated_at': func.now(),
+                },
+            )
+            .returning(RateLimitBucket.tokens, RateLimitBucket.allowed)
+        )
+        async with self._session_factory() as session, session.begin():
+            tokens: float
+            allowed: bool
+            tokens, allowed = (await session.execute(query)).tuples().one()
+        if allowed:
+            return 0.0
+        return (1 - tokens) / rate
+
+
+class TokenBucketLimiter:
+    """Rate limiter allowing bursts of ``capacity`` requests per key.
+
+    Tokens are refilled continuously at ``per_minute`` per minute.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        backend: RateLimitBackend,
+        capacity: int,
+        per_minute: float,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            name (str): Limiter name, used as bucket key prefix and metric
+                label.
+            backend (RateLimitBackend): Bucket storage.
+            capacity (int): Maximum burst of requests per key.
+            per_minute (float): Sustained requests per minute per key.
+
+        """
+        self._name: str = name
+        self._backend: RateLimitBackend = backend
+        self._capacity: float = float(capacity)
+        self._rate: float = per_minute / 60
+
+    async def check(self, key: str) -> int:
+        """Count a request for a key.
+
+        The identity is stored as a SHA-256 digest, so bucket keys have
+        a fixed length however long the client supplied value is.
+
+        Args:
+            key (str): Identity the limit applies to, e.g. an IP address.
+
+        Returns:
+            int: 0 if the request is allowed, otherwise whole seconds to
+                wait before retrying.
+
+        """
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        retry_after = await self._backend.consume(
+            f'{self._name}:{digest}', self._capacity, self._rate
+        )
+        if not retry_after:
+            return 0
+        RATE_LIMIT_REJECTED_TOTAL.labels(self._name).inc()
+        return max(math.ceil(retry_after), 1)
+
+
+def create_rate_limit_backend(
+    rate_limit_settings: RateLimitSettings,
+) -> RateLimitBackend:
+    """Create the rate limit backend selected in RateLimitSettings."""
+    if rate_limit_settings.BACKEND == 'postgres':
+        return PostgresRateLimitBackend(async_db_session)
+    return InMemoryRateLimitBackend(rate_limit_settings.MEMORY_MAX_KEYS)
@@ -0,0 +1,123 @@
+import asyncio
+import contextlib
+import itertools
+import logging
+
+from prometheus_client import Gauge
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+DB_REPLICA_LAG_SECONDS = Gauge(
+    'db_replica_lag_seconds',
+    'Replication lag of a read replica, +Inf while it is unreachable.',
+    ['replica'],
+)
+DB_REPLICA_HEALTHY = Gauge(
+    'db_replica_healthy',
+    'Whether reads are routed to the replica.',
+    ['replica'],
+)
+
+# 0 when the replica has replayed everything it received, so an idle
+# primary doesn't look like growing lag.
+REPLICATION_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()),
+            'Infinity'
+        )
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    """Chooses a healthy read replica for read-only units of work.
+
+    A background task measures the replication lag of every replica.
+    Replicas lagging more than ``max_lag`` or failing the check are
+    skipped until they catch up. When no replica is healthy, reads fall
+    back to the primary.
+    """
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        max_lag: float,
+        check_interval: float,
+    ) -> None:
+        """Initialize the router, every replica is unhealthy until checked.
+
+        Args:
+            engines (list[AsyncEngine]): Engines of the read replicas.
+            max_lag (float): Maximum tolerated lag in seconds.
+            check_interval (float): Seconds between lag checks.
+
+        """
+        self._engines: list[AsyncEngine] = engines
+        self._max_lag: float = max_lag
+        self._check_interval: float = check_interval
+        self._healthy: list[AsyncEngine] = []
+        self._next_index = itertools.count()
+        self._task: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def _label(engine: AsyncEngine) -> str:
+        return f'{engine.url.host}:{engine.url.port or 5432}'
+
+    def choose(self) -> AsyncEngine | None:
+        """Return the next healthy replica, or None to use the primary."""
+        healthy = self._healthy
+        if not healthy:
+            return None
+        return healthy[next(self._next_index) % len(healthy)]
+
+    async def _get_lag(self, engine: AsyncEngine) -> float:
+        try:
+            async with engine.connect() as connection:
+                lag = await connection.scalar(REPLICATION_LAG_QUERY)
+        except Exception:
+            logger.exception('Replica %s lag check failed', self._label(engine))
+            return float('inf')
+        return float(lag)
+
+    async def check(self) -> None:
+        """Measure the lag of every replica and update the healthy set."""
+        lags = await asyncio.gather(
+            *(self._get_lag(engine) for engine in self._engines)
+        )
+        healthy: list[AsyncEngine] = []
+        for engine, lag in zip(self._engines, lags, strict=True):
+            is_healthy = lag <= self._max_lag
+            DB_REPLICA_LAG_SECONDS.labels(self._label(engine)).set(lag)
+            DB_REPLICA_HEALTHY.labels(self._label(engine)).set(is_healthy)
+            if is_healthy:
+                healthy.append(engine)
+        self._healthy = healthy
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self._check_interval)
+
+    async def start(self) -> None:
+        """Check the replicas once and keep checking in the background."""
+        if self._engines and self._task is None:
+            await self.check()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop checking and close the replica connections."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._healthy = []
+        for engine in self._engines:
+            await engine.dispose()
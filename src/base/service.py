@@ -1,9 +1,16 @@
-from typing import final
+import secrets
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, final
 
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.base.dao import BaseDAO
+from src.database import read_only_transaction, transaction
 from src.users.exceptions import ForgottenParametersException
+from src.utils import make_slug
 
 
 class BaseService:
@@ -23,6 +30,52 @@ class BaseService:
         """Return the current AsyncSession."""
         return self._session
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Run a unit of work, joining the request transaction if any.
+
+        Use it instead of ``session.begin()``: inside a request, the
+        transaction is committed once per request by get_db.
+        """
+        async with transaction(self.session):
+            yield
+
+    @asynccontextmanager
+    async def read_only(self) -> AsyncIterator[None]:
+        """Begin a read-only transaction, served by a replica if possible.
+
+        Use it instead of ``transaction()`` for units of work that only
+        read and tolerate replication lag of a few seconds.
+        """
+        async with read_only_transaction(self.session):
+            yield
+
+    @staticmethod
+    async def _get_unique_slug(
+        dao: BaseDAO[Any, Any],
+        value: Any,
+        exclude_id: uuid.UUID | None = None,
+    ) -> str:
+        """Slugify a value, adding a random suffix if the slug is taken.
+
+        Call it inside the transaction that writes the slug.
+
+        Args:
+            dao (BaseDAO): DAO of the model owning the slug column.
+            value (Any): The value to be slugified.
+            exclude_id (uuid.UUID | None): ID of the record being updated,
+                whose own slug is not a collision.
+
+        Returns:
+            str: A slug no other record has.
+
+        """
+        slug = make_slug(value)
+        filters = [] if exclude_id is None else [dao.model.id != exclude_id]
+        if await dao.exists(*filters, slug=slug):
+            slug = f'{slug}-{secrets.token_hex(4)}'
+        return slug
+
     @staticmethod
     @final
     def _validate_schema_for_update_request(
@@ -0,0 +1,210 @@
+import asyncio
+import contextvars
+import datetime as dt
+import json
+import logging
+import random
+import time
+import uuid
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.base.query_budget import get_request_route
+from src.settings import SlowQuerySettings
+
+logger = logging.getLogger(__name__)
+
+# Key of Connection.info holding the start time of the running statement
+_STARTED_AT = 'slow_query_started_at'
+
+# Statements EXPLAIN accepts, by first keyword
+_EXPLAINABLE = frozenset({'select', 'insert', 'update', 'delete', 'with'})
+
+# Plans captured at the same time, each holding a pool connection
+_MAX_PENDING_PLANS = 4
+
+# Parameter types logged as is, values of any other type are redacted
+_PLAIN_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    Decimal,
+    uuid.UUID,
+    dt.date,
+    dt.time,
+    dt.timedelta,
+)
+
+
+@dataclass(slots=True)
+class SlowQuery:
+    """A statement that ran longer than the slow query threshold.
+
+    Attributes:
+        recorded_at (dt.datetime): When the statement completed.
+        route (str | None): Route template of the request running it,
+            None outside of requests.
+        statement (str): SQL text of the statement.
+        parameters (list[str]): Parameters, with values that may be
+            sensitive redacted.
+        duration_ms (float): Execution time of the statement.
+        plan (Any): JSON plan of the statement, None until captured or
+            if it couldn't be.
+
+    """
+
+    recorded_at: dt.datetime
+    route: str | None
+    statement: str
+    parameters: list[str]
+    duration_ms: float
+    plan: Any = None
+
+
+def _redact(parameters: Any) -> list[str]:
+    values = (
+        parameters.values() if isinstance(parameters, Mapping) else parameters
+    )
+    return [
+        repr(value) if isinstance(value, _PLAIN_TYPES) else '<redacted>'
+        for value in values or ()
+    ]
+
+
+class SlowQueryRecorder:
+    """Log slow statements with their plan and keep the latest ones.
+
+    Plans are captured by ``EXPLAIN`` on a connection of their own, after
+    the statement, so they don't delay the request or join its
+    transaction; a statement reading rows the request wrote but hasn't
+    committed is planned without them. Entries are kept in memory, per
+    worker process.
+    """
+
+    def __init__(self, slow_query_settings: SlowQuerySettings) -> None:
+        """Initialize a recorder without any entry.
+
+        Args:
+            slow_query_settings (SlowQuerySettings): Threshold, sampling
+                and buffer settings.
+
+        """
+        self._threshold_ms: float = slow_query_settings.THRESHOLD_MS
+        self._sample_rate: float = slow_query_settings.SAMPLE_RATE
+        self._explain: bool = slow_query_settings.EXPLAIN
+        self._entries: deque[SlowQuery] = deque(
+            maxlen=slow_query_settings.BUFFER_SIZE
+        )
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def register(self, engine: AsyncEngine) -> None:
+        """Time the statements executed through an engine.
+
+        Args:
+            engine (AsyncEngine): Engine to instrument, also used to
+                capture the plans of its statements.
+
+        """
+
+        def on_execute(conn: Connection, *_: Any) -> None:
+            conn.info[_STARTED_AT] = time.perf_counter()
+
+        def on_executed(
+            conn: Connection,
+            _: Any,
+            statement: str,
+            parameters: Any,
+            __: Any,
+            executemany: bool,  # noqa: FBT001
+        ) -> None:
+            started_at = conn.info.pop(_STARTED_AT, None)
+            if started_at is None:
+                return
+            duration_ms = (time.perf_counter() - started_at) * 1000
+            if duration_ms < self._threshold_ms:
+                return
+            if random.random() >= self._sample_rate:  # noqa: S311
+                return
+            if executemany:
+                parameters = parameters[0] if parameters else None
+            self._record(engine, statement, parameters, duration_ms)
+
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, 'before_cursor_execute', on_execute)
+        event.listen(sync_engine, 'after_cursor_execute', on_executed)
+
+    def recent(self) -> list[SlowQuery]:
+        """Return the recorded slow statements, most recent first."""
+        return list(reversed(self._entries))
+
+    def _record(
+        self,
+        engine: AsyncEngine,
+        statement: str,
+        parameters: Any,
+        duration_ms: float,
+    ) -> None:
+        entry = SlowQuery(
+            recorded_at=dt.datetime.now(dt.UTC),
+            route=get_request_route(),
+            statement=statement,
+            parameters=_redact(parameters),
+            duration_ms=round(duration_ms, 2),
+        )
+        self._entries.append(entry)
+        keyword = statement.lstrip().partition(' ')[0].lower()
+        if (
+            not self._explain
+            or keyword not in _EXPLAINABLE
+            or len(self._tasks) >= _MAX_PENDING_PLANS
+        ):
+            self._log(entry)
+            return
+        # A fresh context keeps EXPLAIN out of the request query budget
+        task = asyncio.get_running_loop().create_task(
+            self._capture_plan(engine, entry, statement, parameters),
+            context=contextvars.Context(),
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _capture_plan(
+        self,
+        engine: AsyncEngine,
+        entry: SlowQuery,
+        statement: str,
+        parameters: Any,
+    ) -> None:
+        try:
+            async with engine.connect() as conn:
+                result = await conn.exec_driver_sql(
+                    f'EXPLAIN (ANALYZE off, FORMAT JSON) {statement}',
+                    parameters,
+                )
+                plan = result.scalar_one()
+            entry.plan = json.loads(plan) if isinstance(plan, str) else plan
+        except Exception as exc:
+            # Not logged with the traceback, which shows the parameters
+            logger.warning(
+                'Failed to capture the plan of a slow query: %s',
+                type(exc).__name__,
+            )
+        self._log(entry)
+
+    @staticmethod
+    def _log(entry: SlowQuery) -> None:
+        logger.warning(
+            'Slow query on %s took %.2f ms: %s, parameters %s, plan %s',
+            entry.route,
+            entry.duration_ms,
+            entry.statement,
+            entry.parameters,
+            json.dumps(entry.plan),
+        )
@@ -0,0 +1,108 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Callable
+from enum import StrEnum
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.base.service import BaseService
+from src.database import async_db_session
+
+# Encoded rows are sent in chunks of about this many bytes
+_CHUNK_SIZE = 64 * 1024
+
+
+class ExportFormat(StrEnum):
+    """Formats of streamed exports."""
+
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
+_MEDIA_TYPES = {
+    ExportFormat.NDJSON: 'application/x-ndjson',
+    ExportFormat.CSV: 'text/csv',
+}
+
+
+async def _encode_ndjson(rows: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    async for row in rows:
+        yield row.model_dump_json() + '\n'
+
+
+async def _encode_csv(
+    rows: AsyncIterator[BaseModel], schema: type[BaseModel]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(schema.model_fields))
+    writer.writeheader()
+    async for row in rows:
+        writer.writerow(row.model_dump(mode='json'))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def _chunked(lines: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    chunk: list[str] = []
+    size = 0
+    async for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= _CHUNK_SIZE:
+            yield ''.join(chunk).encode()
+            chunk, size = [], 0
+    if chunk:
+        yield ''.join(chunk).encode()
+
+
+def stream_export[Service: BaseService](
+    service_type: type[Service],
+    export: Callable[[Service], AsyncIterator[BaseModel]],
+    schema: type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Stream the rows of a service export as NDJSON or CSV.
+
+    The body is produced while it is sent, so memory use doesn't grow
+    with the size of the export. It outlives the request unit of work,
+    which is committed before the response starts, so the export runs
+    on a session of its own, given to a new service instance.
+
+    Args:
+        service_type (type[Service]): Service class running the export.
+        export (Callable): Returns the rows to export for a service,
+            typically an async generator method of the service.
+        schema (type[BaseModel]): Schema of the rows, whose fields are
+            the CSV columns.
+        export_format (ExportFormat): Format of the response body.
+        filename (str): Name of the downloaded file, without extension.
+
+    Returns:
+        StreamingResponse: Response streaming the encoded rows.
+
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        async with async_db_session() as session:
+            rows = export(service_type(db_session=session))
+            lines = (
+                _encode_csv(rows, schema)
+                if export_format is ExportFormat.CSV
+                else _encode_ndjson(rows)
+            )
+            async for chunk in _chunked(lines):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=_MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="{filename}.{export_format}"'
+            )
+        },
+    )
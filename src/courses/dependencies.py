@@ -5,6 +5,7 @@ from typing import Annotated, Literal
 from fastapi import Depends
 from fastapi.requests import Request
 
+from src.auth.schemas import AuthorPrincipal
 from src.base.dependencies import BasePermissionDependency, get_service
 from src.courses.models import Course
 from src.courses.permissions import BaseCoursePermission
@@ -61,7 +62,8 @@ class CoursePermissionDependency(BasePermissionDependency):
         self,
         request: Request,
         author: Annotated[
-            Author | None, Depends(_get_optional_author_from_jwt)
+            Author | AuthorPrincipal | None,
+            Depends(_get_optional_author_from_jwt),
         ],
         course: Annotated[Course, Depends(_get_course_by_id)],
     ) -> Course:
@@ -73,7 +75,8 @@ class CoursePermissionDependency(BasePermissionDependency):
 
         Args:
             request (Request): The current HTTP request.
-            author (Author | None): The author extracted from the JWT, if any.
+            author (Author | AuthorPrincipal | None): The author extracted
+                from the JWT, if any.
             course (Course): The course retrieved from the request context.
 
         Returns:
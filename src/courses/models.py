@@ -6,6 +6,7 @@ from sqlalchemy import (
     Boolean,
     Enum,
     ForeignKey,
+    Index,
     Numeric,
     SmallInteger,
     String,
@@ -104,3 +105,13 @@ class Course(BaseUUIDMixin, BaseTimeStampMixin):
         nullable=False,
         comment='Course available languages',
     )
+
+
+# Serves the course catalog page by page, see CourseService.get_all_courses
+Index(
+    'ix_courses_active_catalog',
+    Course.rating.desc(),
+    Course.created_at.desc(),
+    Course.id.desc(),
+    postgresql_where=Course.is_active,
+)
@@ -1,12 +1,12 @@
-import datetime as dt
-import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Query, Response, Security
 
 from src.auth.dependencies import UserPermissionDependency
 from src.auth.permissions import IsAuthenticated
+from src.auth.schemas import AuthorPrincipal, UserPrincipal
 from src.base.dependencies import get_service
+from src.base.pagination import Page
 from src.courses.dependencies import (
     CoursePermissionDependency,
 )
@@ -18,46 +18,57 @@ from src.courses.schemas import (
     UpdateCourseRequestSchema,
 )
 from src.courses.service import CourseService
+from src.settings import Settings
 from src.users import User
 from src.users.dependencies.author import AuthorPermissionDependency
 from src.users.models import Author
 from src.users.permissions import IsAuthorPermission
 
+settings = Settings.load()
 course_router = APIRouter()
 
 
 @course_router.get('/all', response_model=list[BaseCourseResponseSchema])
 async def get_all_courses(
+    response: Response,
     service: Annotated[CourseService, Depends(get_service(CourseService))],
-    created_at: dt.datetime | None = None,
-    last_id: uuid.UUID | None = None,
-    limit: int | None = None,
-) -> list[BaseCourseResponseSchema] | None:
-    """Retrieve a list of all available courses with optional filtering.
+    cursor: str | None = None,
+    limit: Annotated[
+        int, Query(ge=1, le=settings.pagination_settings.MAX_LIMIT)
+    ] = settings.pagination_settings.DEFAULT_LIMIT,
+) -> list[BaseCourseResponseSchema]:
+    """Retrieve one page of the available courses, best rated first.
+
+    The cursor of the next page is returned in the ``X-Next-Cursor``
+    header, which is missing on the last page.
 
     Args:
+        response (Response): Response to set the cursor header on.
         service (CourseService): Service for course operations.
-        created_at (datetime, optional): Filter courses created after this
-            timestamp.
-        last_id (UUID, optional): Get courses after this course ID.
+        cursor (str, optional): Cursor of the page to return, from the
+            ``X-Next-Cursor`` header of the previous page.
         limit (int, optional): Maximum number of courses to return.
 
     Returns:
-        list[BaseCourseResponseSchema] | None: List of course schemas or None
-            if no courses exist.
+        list[BaseCourseResponseSchema]: Course schemas of the page.
 
     """
-    courses: list[Course] = await service.get_all_courses(
-        created_at, last_id, limit
+    page: Page[BaseCourseResponseSchema] = await service.get_all_courses(
+        limit, cursor
     )
-    return [BaseCourseResponseSchema.model_validate(c) for c in courses]
+    if page.next_cursor:
+        response.headers['X-Next-Cursor'] = page.next_cursor
+    return page.items
 
 
 @course_router.post('/', response_model=BaseCourseResponseSchema)
 async def create_course(
     course_schema: BaseCreateCourseRequestSchema,
     author: Annotated[
-        Author, Security(AuthorPermissionDependency([IsAuthorPermission]))
+        Author | AuthorPrincipal,
+        Security(
+            AuthorPermissionDependency([IsAuthorPermission], load_author=False)
+        ),
     ],
     service: Annotated[CourseService, Depends(get_service(CourseService))],
 ) -> BaseCourseResponseSchema:
@@ -67,7 +78,8 @@ async def create_course(
 
     Args:
         course_schema (BaseCreateCourseRequestSchema): Schema with course data.
-        author (Author): Authenticated author creating the course.
+        author (Author | AuthorPrincipal): Authenticated author creating
+            the course.
         service (CourseService): Service for course operations.
 
     Returns:
@@ -168,7 +180,8 @@ async def deactivate_course_by_id(
 @course_router.post('/purchase/{course_id}', status_code=201)
 async def purchase_course_by_id(
     user: Annotated[
-        User, Security(UserPermissionDependency([IsAuthenticated]))
+        User | UserPrincipal,
+        Security(UserPermissionDependency([IsAuthenticated], load_user=False)),
     ],
     course: Annotated[
         Course,
@@ -187,7 +200,8 @@ async def purchase_course_by_id(
     The user must be authenticated. The course must be active.
 
     Args:
-        user (User): Authenticated user purchasing the course.
+        user (User | UserPrincipal): Authenticated user purchasing the
+            course.
         course (Course): Course instance retrieved via permission dependency.
         service (CourseService): Service for course operations.
 
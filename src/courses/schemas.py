@@ -53,3 +53,12 @@ class UpdateCourseRequestSchema(BaseModel):
     currency: CurrencyEnum | None = None
     language: AvailableLanguagesEnum | None = None
     discount: int | None = None
+
+
+class PurchaseResponseSchema(BaseSchema):
+    """Purchase of a course by a user."""
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    course_id: uuid.UUID
+    created_at: datetime
@@ -1,10 +1,13 @@
-import datetime as dt
 import uuid
+from collections.abc import AsyncIterator
 from typing import ClassVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.schemas import AuthorPrincipal, UserPrincipal
 from src.base.dao import BaseDAO
+from src.base.loader import get_batch_loader
+from src.base.pagination import Page
 from src.base.service import BaseService
 from src.courses.dao import CourseDAO
 from src.courses.exceptions import (
@@ -13,12 +16,13 @@ from src.courses.exceptions import (
 )
 from src.courses.models import Course
 from src.courses.schemas import (
+    BaseCourseResponseSchema,
     BaseCreateCourseRequestSchema,
+    PurchaseResponseSchema,
     UpdateCourseRequestSchema,
 )
 from src.users import User
 from src.users.models import Author, UserCourses
-from src.utils import make_slug
 
 type UserCourseDAO = BaseDAO[UserCourses]
 
@@ -32,6 +36,12 @@ class CourseService(BaseService):
     """
 
     _DEACTIVATE_COURSE_UPDATE: ClassVar[dict[str, bool]] = {'is_active': False}
+    # Matches the ix_courses_active_catalog index
+    _CATALOG_ORDER: ClassVar[tuple[str, ...]] = (
+        '-rating',
+        '-created_at',
+        '-id',
+    )
 
     def __init__(
         self,
@@ -60,12 +70,14 @@ class CourseService(BaseService):
         ](db_session, model=UserCourses)
 
     async def create_course(
-        self, author: Author, course_schema: BaseCreateCourseRequestSchema
+        self,
+        author: Author | AuthorPrincipal,
+        course_schema: BaseCreateCourseRequestSchema,
     ) -> Course:
         """Create a new course for a specific author.
 
         Args:
-            author (Author): The author creating the course.
+            author (Author | AuthorPrincipal): The author creating the course.
             course_schema (BaseCreateCourseRequestSchema): Schema with course
                 details.
 
@@ -75,8 +87,10 @@ class CourseService(BaseService):
         """
         course_data = course_schema.model_dump()
         course_data['author_id'] = author.id
-        course_data['slug'] = make_slug(course_data.get('title'))
-        async with self.session.begin():
+        async with self.transaction():
+            course_data['slug'] = await self._get_unique_slug(
+                self._course_dao, course_data.get('title')
+            )
             course: Course = await self._course_dao.create(course_data)
         return course
 
@@ -99,16 +113,11 @@ class CourseService(BaseService):
             Course: The retrieved course instance with lessons loaded.
 
         """
-        filters = {'id': course_id}
-        if author:
-            filters['author_id'] = author.id
-        async with self.session.begin():
-            course: (
-                Course | None
-            ) = await self._course_dao.get_course_with_lessons(
-                **filters,
-            )
-        if not course:
+        async with self.read_only():
+            course: Course | None = await get_batch_loader(
+                self._course_dao, ('lessons',)
+            ).load(course_id)
+        if not course or (author and course.author_id != author.id):
             raise CourseNotFoundByIdException
         return course
 
@@ -133,11 +142,13 @@ class CourseService(BaseService):
         filtered_course_fields: dict[str, str] = (
             self._validate_schema_for_update_request(course_fields)
         )
-        if course_fields.title:
-            filtered_course_fields['slug'] = make_slug(
-                filtered_course_fields.get('title')
-            )
-        async with self.session.begin():
+        async with self.transaction():
+            if course_fields.title:
+                filtered_course_fields['slug'] = await self._get_unique_slug(
+                    self._course_dao,
+                    filtered_course_fields.get('title'),
+                    exclude_id=course.id,
+                )
             updated_course: Course | None = await self._course_dao.update(
                 filtered_course_fields,
                 id=course.id,
@@ -148,31 +159,60 @@ class CourseService(BaseService):
 
     async def get_all_courses(
         self,
-        created_at: dt.datetime | None = None,
-        last_id: uuid.UUID | None = None,
-        limit: int | None = None,
-    ) -> list[Course]:
-        """Retrieve all active courses with optional filtering and pagination.
+        limit: int,
+        cursor: str | None = None,
+    ) -> Page[BaseCourseResponseSchema]:
+        """Retrieve one page of the active courses, best rated first.
+
+        Only the columns of the response schema are selected.
 
         Args:
-            created_at (dt.datetime | None, optional): Filter courses created
-                after this timestamp.
-            last_id (uuid.UUID | None, optional): Last course ID for pagination.
-            limit (int | None, optional): Maximum number of courses to return.
+            limit (int): Maximum number of courses to return.
+            cursor (str | None, optional): Cursor of the page to return,
+                None for the first page.
 
         Returns:
-            list[Course]: List of active courses. Empty if no courses exist.
+            Page[BaseCourseResponseSchema]: Active courses and the cursor
+                of the next page.
+
+        Raises:
+            InvalidCursorException: If the cursor is invalid.
 
         """
-        async with self.session.begin():
-            courses: list[Course] | None = await self._course_dao.get_all(
-                created_at=created_at,
-                last_id=last_id,
+        async with self.read_only():
+            return await self._course_dao.get_page_projected(
+                BaseCourseResponseSchema,
+                order_by=self._CATALOG_ORDER,
                 limit=limit,
-                order_by=['rating'],
+                cursor=cursor,
                 is_active=True,
             )
-        return courses if courses else []
+
+    async def export_courses(self) -> AsyncIterator[BaseCourseResponseSchema]:
+        """Stream every course, active or not, for an admin export.
+
+        Yields:
+            BaseCourseResponseSchema: The courses, in no particular order.
+
+        """
+        async with self.read_only():
+            async for course in self._course_dao.stream_projected(
+                BaseCourseResponseSchema
+            ):
+                yield course
+
+    async def export_purchases(self) -> AsyncIterator[PurchaseResponseSchema]:
+        """Stream every course purchase for an admin export.
+
+        Yields:
+            PurchaseResponseSchema: The purchases, in no particular order.
+
+        """
+        async with self.read_only():
+            async for purchase in self._user_courses_dao.stream_projected(
+                PurchaseResponseSchema
+            ):
+                yield purchase
 
     async def deactivate_course(
         self,
@@ -187,7 +227,7 @@ class CourseService(BaseService):
             CourseNotFoundByIdException: If the course does not exist.
 
         """
-        async with self.session.begin():
+        async with self.transaction():
             deleted_course: Course | None = await self._course_dao.update(
                 self._DEACTIVATE_COURSE_UPDATE,
                 id=course.id,
@@ -198,23 +238,28 @@ class CourseService(BaseService):
     async def purchase_course(
         self,
         course: Course,
-        user: User,
+        user: User | UserPrincipal,
     ) -> None:
         """Record a purchase of a course by a user.
 
+        The purchase is a single INSERT ... ON CONFLICT DO NOTHING, so a
+        repeated purchase doesn't hit the unique constraint.
+
         Args:
             course (Course): The course being purchased.
-            user (User): The user purchasing the course.
+            user (User | UserPrincipal): The user purchasing the course.
 
         Raises:
-            CourseWasNotBoughtException: If the purchase could not be recorded.
+            CourseWasNotBoughtException: If the purchase could not be
+                recorded, e.g. because the user already owns the course.
 
         """
-        async with self.session.begin():
-            bought_course: (
-                UserCourses | None
-            ) = await self._user_courses_dao.create(
-                {'user_id': user.id, 'course_id': course.id}
+        async with self.transaction():
+            bought_courses: list[
+                UserCourses
+            ] = await self._user_courses_dao.upsert(
+                [{'user_id': user.id, 'course_id': course.id}],
+                conflict_columns=['user_id', 'course_id'],
             )
-        if not bought_course:
+        if not bought_courses:
             raise CourseWasNotBoughtException
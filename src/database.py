@@ -1,13 +1,25 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
+from sqlalchemy import Connection, Engine, Select, event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session, SessionTransaction
+from sqlalchemy.sql import ClauseElement
 
-from src.settings import Settings
+from src.base.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    register_pool_metrics,
+)
+from src.base.query_budget import QueryBudget
+from src.base.replica import ReplicaRouter
+from src.base.slow_query import SlowQueryRecorder
+from src.settings import DatabaseSettings, Settings
 
 settings = Settings.load()
 
@@ -26,33 +38,173 @@ class Base(DeclarativeBase):
     """
 
 
+def get_engine_options(database_settings: DatabaseSettings) -> dict[str, Any]:
+    """Build create_async_engine keyword arguments from DatabaseSettings.
+
+    Server-side timeouts are set once per connection through asyncpg
+    ``server_settings``, so they cost no extra round trip per request.
+    """
+    server_settings: dict[str, str] = {}
+    if database_settings.STATEMENT_TIMEOUT_MS:
+        server_settings['statement_timeout'] = str(
+            database_settings.STATEMENT_TIMEOUT_MS
+        )
+    if database_settings.IDLE_IN_TRANSACTION_TIMEOUT_MS:
+        server_settings['idle_in_transaction_session_timeout'] = str(
+            database_settings.IDLE_IN_TRANSACTION_TIMEOUT_MS
+        )
+    return {
+        'echo': database_settings.ECHO,
+        'poolclass': InstrumentedAsyncAdaptedQueuePool,
+        'pool_size': database_settings.POOL_SIZE,
+        'max_overflow': database_settings.MAX_OVERFLOW,
+        'pool_timeout': database_settings.POOL_TIMEOUT_SECONDS,
+        'pool_recycle': database_settings.POOL_RECYCLE_SECONDS,
+        'pool_pre_ping': database_settings.POOL_PRE_PING,
+        'connect_args': {
+            # SQLAlchemy's cache of prepared statements
+            'prepared_statement_cache_size': (
+                database_settings.STATEMENT_CACHE_SIZE
+            ),
+            # asyncpg's own cache, used by its non-prepared API
+            'statement_cache_size': database_settings.STATEMENT_CACHE_SIZE,
+            'server_settings': server_settings,
+        },
+    }
+
+
 engine = create_async_engine(
-    settings.database_settings.DATABASE_URL, future=True, echo=True
+    settings.database_settings.DATABASE_URL,
+    **get_engine_options(settings.database_settings),
+)
+register_pool_metrics(engine)
+replica_engines = [
+    create_async_engine(url, **get_engine_options(settings.database_settings))
+    for url in settings.database_settings.REPLICA_URLS
+]
+replica_router = ReplicaRouter(
+    replica_engines,
+    max_lag=settings.database_settings.REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.database_settings.REPLICA_CHECK_INTERVAL_SECONDS,
 )
+query_budget = QueryBudget(settings.query_budget_settings)
+slow_query_recorder = SlowQueryRecorder(settings.slow_query_settings)
+for instrumented_engine in (engine, *replica_engines):
+    query_budget.register(instrumented_engine)
+    if settings.slow_query_settings.ENABLED:
+        slow_query_recorder.register(instrumented_engine)
+
+# Keys of Session.info used for routing
+_READ_ONLY = 'read_only'
+_REPLICA = 'replica'
+_HAS_WRITTEN = 'has_written'
+_UNIT_OF_WORK = 'unit_of_work'
+
+
+class RoutingSession(Session):
+    """Session sending SELECTs of read-only units of work to a replica.
+
+    Everything else goes to the primary. Once a session has written,
+    its later reads go to the primary too, so a request always reads its
+    own writes. A read-only unit of work sticks to one replica.
+    """
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        clause: ClauseElement | None = None,
+        **kw: Any,
+    ) -> Engine | Connection:
+        """Return the primary or a replica engine for a statement."""
+        is_read = isinstance(clause, Select) and not self._flushing
+        if not is_read:
+            self.info[_HAS_WRITTEN] = True
+        elif self.info.get(_READ_ONLY) and not self.info.get(_HAS_WRITTEN):
+            replica: AsyncEngine | None = self.info.get(_REPLICA)
+            if replica is None:
+                replica = replica_router.choose()
+            if replica is not None:
+                self.info[_REPLICA] = replica
+                return replica.sync_engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, 'after_transaction_end')
+def _release_replica(
+    session: Session,
+    transaction: SessionTransaction,
+) -> None:
+    """Unpin the replica once the outermost transaction is over."""
+    if transaction.parent is None:
+        session.info.pop(_REPLICA, None)
+
 
 async_db_session = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
 )
 
 
+@asynccontextmanager
+async def transaction(session: AsyncSession) -> AsyncIterator[None]:
+    """Run a block of work in a transaction.
+
+    Inside a request the session belongs to a unit of work opened by
+    get_db, so the block joins the request transaction: pending changes
+    are flushed when it exits and committed once the request is handled.
+    Elsewhere the block begins and commits its own transaction.
+
+    Args:
+        session (AsyncSession): Session created by async_db_session.
+
+    """
+    if not session.info.get(_UNIT_OF_WORK):
+        async with session.begin():
+            yield
+        return
+    yield
+    await session.flush()
+
+
+@asynccontextmanager
+async def read_only_transaction(session: AsyncSession) -> AsyncIterator[None]:
+    """Run a transaction whose reads may be served by a read replica.
+
+    Falls back to the primary when no replica is healthy or the session
+    has already written.
+
+    Args:
+        session (AsyncSession): Session created by async_db_session.
+
+    """
+    session.info[_READ_ONLY] = True
+    try:
+        async with transaction(session):
+            yield
+    finally:
+        session.info.pop(_READ_ONLY, None)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession]:
-    """Provide an async database session generator.
+    """Provide a database session holding the unit of work of a request.
 
-    This dependency will create a new SQLAlchemy AsyncSession
-    that can be used
-    for database operations. The session is automatically
-    closed when the request
-    is finished.
+    Every service call made while handling the request shares one
+    transaction. It is committed once the endpoint returns, before the
+    response is sent, and rolled back if anything raises. The session is
+    closed afterwards. FastAPI runs the code after ``yield`` before
+    sending the response up to 0.117 only, hence the version cap.
 
     Yields:
         AsyncSession: A SQLAlchemy async database session.
 
     """
     session: AsyncSession = async_db_session()
+    session.info[_UNIT_OF_WORK] = True
     try:
         yield session
+        await session.commit()
     except Exception:
         await session.rollback()
         raise
@@ -5,6 +5,7 @@ from typing import Annotated, Literal
 from fastapi import Depends
 from fastapi.requests import Request
 
+from src.auth.schemas import AuthorPrincipal
 from src.base.dependencies import BasePermissionDependency, get_service
 from src.lessons.models import Lesson
 from src.lessons.permissions import BaseLessonPermission
@@ -48,7 +49,8 @@ class LessonPermissionDependency(BasePermissionDependency):
         self,
         request: Request,
         author: Annotated[
-            Author | None, Depends(_get_optional_author_from_jwt)
+            Author | AuthorPrincipal | None,
+            Depends(_get_optional_author_from_jwt),
         ],
         lesson: Annotated[Lesson, Depends(_get_lesson_by_id)],
     ) -> Lesson:
@@ -59,7 +61,8 @@ class LessonPermissionDependency(BasePermissionDependency):
 
         Args:
             request (Request): The incoming HTTP request.
-            author (Author | None): The author extracted from the JWT, if any.
+            author (Author | AuthorPrincipal | None): The author extracted
+                from the JWT, if any.
             lesson (Lesson): The lesson retrieved from the request context.
 
         Returns:
@@ -3,6 +3,7 @@ from typing import ClassVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.base.loader import get_batch_loader
 from src.base.service import BaseService
 from src.courses.models import Course
 from src.lessons.dao import LessonDAO
@@ -15,7 +16,6 @@ from src.lessons.schemas import (
     CreateLessonRequestSchema,
     UpdateLessonRequestSchema,
 )
-from src.utils import make_slug
 
 
 class LessonService(BaseService):
@@ -70,8 +70,10 @@ class LessonService(BaseService):
         """
         lesson_data = lesson_schema.model_dump()
         lesson_data['course_id'] = course.id
-        lesson_data['slug'] = make_slug(lesson_data.get('title'))
-        async with self.session.begin():
+        async with self.transaction():
+            lesson_data['slug'] = await self._get_unique_slug(
+                self._dao, lesson_data.get('title')
+            )
             lesson: Lesson = await self._dao.create(lesson_data)
         return lesson
 
@@ -92,10 +94,10 @@ class LessonService(BaseService):
                 not published.
 
         """
-        async with self.session.begin():
-            lesson: Lesson | None = await self._dao.get_lesson_with_course(
-                id=lesson_id
-            )
+        async with self.read_only():
+            lesson: Lesson | None = await get_batch_loader(
+                self._dao, ('course',)
+            ).load(lesson_id)
         if not lesson:
             raise LessonIsNotPublishedException
         return lesson
@@ -113,7 +115,7 @@ class LessonService(BaseService):
             LessonNotFoundByIdException: If the lesson cannot be found.
 
         """
-        async with self.session.begin():
+        async with self.transaction():
             updated_lesson: Lesson | None = await self._dao.update(
                 self._DEACTIVATE_LESSON_UPDATE,
                 id=lesson.id,
@@ -146,9 +148,11 @@ class LessonService(BaseService):
             self._validate_schema_for_update_request(lesson_fields)
         )
         lesson_title = filtered_lesson_fields.get('title')
-        if lesson_title:  # If title changed - change slug
-            filtered_lesson_fields['slug'] = make_slug(lesson_title)
-        async with self.session.begin():
+        async with self.transaction():
+            if lesson_title:  # If title changed - change slug
+                filtered_lesson_fields['slug'] = await self._get_unique_slug(
+                    self._dao, lesson_title, exclude_id=lesson.id
+                )
             updated_lesson: Lesson | None = await self._dao.update(
                 filtered_lesson_fields,
                 id=lesson.id,
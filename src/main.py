@@ -1,14 +1,20 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import sentry_sdk
 from fastapi import APIRouter, FastAPI
 from sqladmin import Admin
 from starlette_exporter import PrometheusMiddleware, handle_metrics
 
+from src.auth.reaper import refresh_token_reaper
 from src.auth.router import auth_router
+from src.auth.services import Hasher
+from src.base.invalidation import invalidation_bus
+from src.base.query_budget import QueryBudgetMiddleware
 from src.courses.admin import CourseAdmin
 from src.courses.router import course_router
-from src.database import engine
+from src.database import engine, replica_router
 from src.lessons.router import lesson_router
 from src.logger import configure_logging
 from src.settings import Settings
@@ -25,7 +31,23 @@ sentry_sdk.init(
     dsn=settings.logging_settings.SENTRY_URL,
     send_default_pii=True,
 )
-app = FastAPI(title='EducationPlatform')
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Start and stop application-wide background resources."""
+    await Hasher.configure_from_settings(settings.hasher_settings)
+    await replica_router.start()
+    invalidation_bus.start(engine)
+    refresh_token_reaper.start()
+    yield
+    await refresh_token_reaper.stop()
+    await invalidation_bus.stop()
+    await replica_router.stop()
+    Hasher.shutdown_pool()
+
+
+app = FastAPI(title='EducationPlatform', lifespan=lifespan)
 admin = Admin(app, engine)
 
 admin.add_view(UserAdmin)
@@ -33,6 +55,7 @@ admin.add_view(AuthorAdmin)
 admin.add_view(CourseAdmin)
 
 app.add_middleware(PrometheusMiddleware)
+app.add_middleware(QueryBudgetMiddleware)
 app.add_route('/metrics', handle_metrics)
 main_api_router = APIRouter(prefix='/api/v1')
 main_api_router.include_router(user_router, prefix='/user', tags=['user'])
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -15,18 +16,149 @@ class TokenSettings(BaseSettings):
 
     SECRET_KEY: str = ''
     ALGORITHM: str = 'HS256'
+    SIGNING_KEY_ID: str = ''
+    SIGNING_KEY_FILE: Path | None = None
+    RETIRED_KEYS_DIR: Path | None = None
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    CLAIMS_CACHE_SIZE: int = 10000
+    CLAIMS_AUTH: bool = False
+    REAPER_INTERVAL_SECONDS: float = 600.0
+    REAPER_BATCH_SIZE: int = 1000
+    INTROSPECTION_SECRET: str = ''
+    INTROSPECTION_MAX_TOKENS: int = 100
+    REVOCATION_FILTER_CAPACITY: int = 100000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    REVOCATION_REBUILD_SECONDS: float = 900.0
+
+
+class HasherSettings(BaseSettings):
+    """Password hashing pool and bcrypt cost settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix='HASHER_', env_file=BASE_DIR / '.env', extra='ignore'
+    )
+
+    POOL_SIZE: int = 2
+    QUEUE_DEPTH: int = 32
+    TIMEOUT_SECONDS: float = 5.0
+    # Fixed bcrypt cost; when unset it is calibrated on startup if enabled
+    ROUNDS: int | None = None
+    CALIBRATE_ON_STARTUP: bool = False
+    TARGET_HASH_MS: float = 250.0
+    MIN_ROUNDS: int = 10
+    MAX_ROUNDS: int = 16
+
+
+class CacheSettings(BaseSettings):
+    """In-process cache settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix='CACHE_', env_file=BASE_DIR / '.env', extra='ignore'
+    )
+
+    IDENTITY_TTL_SECONDS: float = 30.0
+    IDENTITY_MAX_SIZE: int = 10000
+
+
+class RateLimitSettings(BaseSettings):
+    """Rate limiting settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix='RATE_LIMIT_', env_file=BASE_DIR / '.env', extra='ignore'
+    )
+
+    BACKEND: Literal['memory', 'postgres'] = 'memory'
+    MEMORY_MAX_KEYS: int = 100000
+    LOGIN_IP_BURST: int = 20
+    LOGIN_IP_PER_MINUTE: float = 30.0
+    LOGIN_EMAIL_BURST: int = 5
+    LOGIN_EMAIL_PER_MINUTE: float = 5.0
 
 
 class DatabaseSettings(BaseSettings):
-    """Database-related settings."""
+    """Database-related settings.
+
+    Timeouts of 0 are disabled. A statement cache size of 0 disables
+    prepared statement caching, which is required behind PgBouncer in
+    transaction pooling mode. Read replicas are optional and share the
+    engine settings of the primary. Bulk DAO operations send at most
+    BULK_CHUNK_SIZE rows per statement, streams fetch STREAM_FETCH_SIZE
+    rows at a time from a server-side cursor.
+    """
 
     model_config = SettingsConfigDict(
         env_prefix='DB_', env_file=BASE_DIR / '.env', extra='ignore'
     )
 
     DATABASE_URL: str = ''
+    ECHO: bool = False
+    POOL_SIZE: int = 10
+    MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT_SECONDS: float = 30.0
+    POOL_RECYCLE_SECONDS: int = 1800
+    POOL_PRE_PING: bool = True
+    STATEMENT_CACHE_SIZE: int = 100
+    STATEMENT_TIMEOUT_MS: int = 0
+    IDLE_IN_TRANSACTION_TIMEOUT_MS: int = 0
+    REPLICA_URLS: list[str] = []
+    REPLICA_MAX_LAG_SECONDS: float = 2.0
+    REPLICA_CHECK_INTERVAL_SECONDS: float = 1.0
+    BULK_CHUNK_SIZE: int = 1000
+    STREAM_FETCH_SIZE: int = 1000
+
+
+class PaginationSettings(BaseSettings):
+    """Keyset pagination settings.
+
+    Cursors are signed with CURSOR_SECRET, which is required: an empty
+    key would let clients forge cursors.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix='PAGINATION_', env_file=BASE_DIR / '.env', extra='ignore'
+    )
+
+    CURSOR_SECRET: str = ''
+    DEFAULT_LIMIT: int = 20
+    MAX_LIMIT: int = 100
+
+
+class QueryBudgetSettings(BaseSettings):
+    """Per-request SQL statement budget settings.
+
+    Statement counts and database time are always recorded. In the log
+    and raise modes, meant for development and tests, a request running
+    more than MAX_QUERIES statements, or the same statement more than
+    MAX_REPEATS times, is logged or fails. A limit of 0 is disabled.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix='QUERY_BUDGET_', env_file=BASE_DIR / '.env', extra='ignore'
+    )
+
+    MODE: Literal['off', 'log', 'raise'] = 'off'
+    MAX_QUERIES: int = 20
+    MAX_REPEATS: int = 5
+
+
+class SlowQuerySettings(BaseSettings):
+    """Slow query log settings.
+
+    When enabled, SAMPLE_RATE of the statements running longer than
+    THRESHOLD_MS are logged, with their plan if EXPLAIN is set, and the
+    last BUFFER_SIZE of them are kept for the admin API.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix='SLOW_QUERY_', env_file=BASE_DIR / '.env', extra='ignore'
+    )
+
+    ENABLED: bool = False
+    THRESHOLD_MS: float = 200.0
+    SAMPLE_RATE: float = 1.0
+    EXPLAIN: bool = True
+    BUFFER_SIZE: int = 100
 
 
 class LoggingSettings(BaseSettings):
@@ -53,9 +185,23 @@ class Settings(BaseSettings):
 
     # Nested settings
     token_settings: TokenSettings = Field(default_factory=TokenSettings)
+    hasher_settings: HasherSettings = Field(default_factory=HasherSettings)
+    cache_settings: CacheSettings = Field(default_factory=CacheSettings)
+    rate_limit_settings: RateLimitSettings = Field(
+        default_factory=RateLimitSettings
+    )
     database_settings: DatabaseSettings = Field(
         default_factory=DatabaseSettings
     )
+    pagination_settings: PaginationSettings = Field(
+        default_factory=PaginationSettings
+    )
+    query_budget_settings: QueryBudgetSettings = Field(
+        default_factory=QueryBudgetSettings
+    )
+    slow_query_settings: SlowQuerySettings = Field(
+        default_factory=SlowQuerySettings
+    )
     logging_settings: LoggingSettings = Field(default_factory=LoggingSettings)
 
     @classmethod
@@ -0,0 +1,141 @@
+import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.base.cache import TTLCache
+from src.base.invalidation import invalidation_bus
+from src.database import Base
+from src.settings import Settings
+from src.users.models import Author, User
+
+settings = Settings.load()
+
+# Column values of a loaded instance, by attribute name
+type Snapshot = Mapping[str, Any]
+
+
+def _snapshot(instance: Base) -> Snapshot:
+    state = inspect(instance)
+    return MappingProxyType(
+        {
+            column.key: state.dict[column.key]
+            for column in state.mapper.column_attrs
+            if column.key in state.dict
+        }
+    )
+
+
+async def _restore[Model: Base](
+    session: AsyncSession, model: type[Model], snapshot: Snapshot
+) -> Model:
+    instance = model(**snapshot)
+    make_transient_to_detached(instance)
+    return await session.merge(instance, load=False)
+
+
+class IdentityCache:
+    """Short-TTL cache of the identity behind an access token.
+
+    Holds the User, the Author and the token version of a user, keyed by
+    user ID. Services that change a user's account,
+    role or author profile must call ``invalidate`` inside their
+    transaction, which evicts the entries in every worker process.
+    Only the column values are cached. Every hit builds a new instance
+    in the session of the caller without querying, so requests never
+    share an instance and relations are loaded as usual.
+    """
+
+    CHANNEL: ClassVar[str] = 'identity_invalidation'
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initialize empty user and author caches.
+
+        Args:
+            max_size (int): Maximum entries in each cache.
+            ttl (float): Seconds an entry is trusted without invalidation.
+
+        """
+        self._users: TTLCache[str, Snapshot] = TTLCache(
+            'user_identity', max_size=max_size, ttl=ttl
+        )
+        self._authors: TTLCache[str, Snapshot] = TTLCache(
+            'author_identity', max_size=max_size, ttl=ttl
+        )
+        self._token_versions: TTLCache[str, int] = TTLCache(
+            'token_version', max_size=max_size, ttl=ttl
+        )
+
+    async def get_user(
+        self, session: AsyncSession, user_id: uuid.UUID | str
+    ) -> User | None:
+        """Return the cached User, attached to a session, or None."""
+        snapshot = self._users.get(str(user_id))
+        if snapshot is None:
+            return None
+        return await _restore(session, User, snapshot)
+
+    def set_user(self, user: User) -> None:
+        """Cache the column values of a loaded User under its ID."""
+        self._users.set(str(user.id), _snapshot(user))
+
+    async def get_author(
+        self, session: AsyncSession, user_id: uuid.UUID | str
+    ) -> Author | None:
+        """Return the cached Author of a user, attached to a session."""
+        snapshot = self._authors.get(str(user_id))
+        if snapshot is None:
+            return None
+        return await _restore(session, Author, snapshot)
+
+    def set_author(self, author: Author) -> None:
+        """Cache the column values of a loaded Author under its user's ID."""
+        self._authors.set(str(author.user_id), _snapshot(author))
+
+    def get_token_version(self, user_id: uuid.UUID | str) -> int | None:
+        """Return the cached token version of an active user or None."""
+        return self._token_versions.get(str(user_id))
+
+    def set_token_version(
+        self, user_id: uuid.UUID | str, token_version: int
+    ) -> None:
+        """Cache the token version of an active user."""
+        self._token_versions.set(str(user_id), token_version)
+
+    def evict(self, user_id: str) -> None:
+        """Drop the cached identity of a user in this process."""
+        self._users.pop(user_id)
+        self._authors.pop(user_id)
+        self._token_versions.pop(user_id)
+
+    def clear(self) -> None:
+        """Drop every cached identity in this process."""
+        self._users.clear()
+        self._authors.clear()
+        self._token_versions.clear()
+
+    async def invalidate(
+        self, session: AsyncSession, user_id: uuid.UUID | str
+    ) -> None:
+        """Evict a user's identity in every worker process.
+
+        Args:
+            session (AsyncSession): Session of the transaction that changes
+                the user. Other workers evict once it is committed.
+            user_id (uuid.UUID | str): ID of the changed user.
+
+        """
+        await invalidation_bus.publish(session, self.CHANNEL, str(user_id))
+
+
+identity_cache = IdentityCache(
+    max_size=settings.cache_settings.IDENTITY_MAX_SIZE,
+    ttl=settings.cache_settings.IDENTITY_TTL_SECONDS,
+)
+invalidation_bus.subscribe(
+    IdentityCache.CHANNEL, identity_cache.evict, identity_cache.clear
+)
@@ -1,3 +1,4 @@
 from .author import AuthorDAO
+from .user import UserDAO
 
-__all__ = ['AuthorDAO']
+__all__ = ['AuthorDAO', 'UserDAO']
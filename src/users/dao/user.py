@@ -0,0 +1,46 @@
+import uuid
+
+from sqlalchemy import select, update
+
+from src.base.dao import BaseDAO
+from src.users import User
+from src.users.schemas import CreateUserRequestSchema
+
+
+class UserDAO(BaseDAO[User, CreateUserRequestSchema]):
+    """Data Access Object for User model.
+
+    Adds queries on the token version used to reject access tokens with
+    outdated authorization claims.
+    """
+
+    async def get_token_version(self, user_id: uuid.UUID | str) -> int | None:
+        """Return the token version of an active user.
+
+        Args:
+            user_id (uuid.UUID | str): ID of the user.
+
+        Returns:
+            int | None: Current token version, or None if there is no
+                active user with this ID.
+
+        """
+        query = select(User.token_version).where(
+            User.id == user_id, User.is_active.is_(True)
+        )
+        token_version: int | None = await self.session.scalar(query)
+        return token_version
+
+    async def bump_token_version(self, user_id: uuid.UUID | str) -> None:
+        """Increment the token version so issued access tokens are rejected.
+
+        Args:
+            user_id (uuid.UUID | str): ID of the user.
+
+        """
+        query = (
+            update(User)
+            .where(User.id == user_id)
+            .values(token_version=User.token_version + 1)
+        )
+        await self.session.execute(query)
@@ -1,39 +1,62 @@
 from collections.abc import Sequence
 from typing import Annotated, Literal
 
-from fastapi import Depends, Security
+from fastapi import Depends
 from fastapi.requests import Request
 
-from src.auth.dependencies import oauth_scheme
+from src.auth.dependencies import (
+    _get_optional_claims_from_jwt,
+    _get_principal_from_claims,
+    _has_authorization_claims,
+)
+from src.auth.schemas import AuthorPrincipal
 from src.auth.services import AuthService
 from src.base.dependencies import BasePermissionDependency, get_service
 from src.users.exceptions import UserIsNotAuthorException
 from src.users.models import Author
 from src.users.permissions import BaseAuthorPermission
-from src.users.services import AuthorService
+from src.users.services import AuthorService, UserService
 
 
 async def _get_optional_author_from_jwt(
-    token: Annotated[str, Security(oauth_scheme)],
-    auth_service: Annotated[AuthService, Depends(get_service(AuthService))],
+    claims: Annotated[
+        dict[str, str | int] | None, Depends(_get_optional_claims_from_jwt)
+    ],
     author_service: Annotated[
         AuthorService, Depends(get_service(AuthorService))
     ],
-) -> Author | None:
+    user_service: Annotated[UserService, Depends(get_service(UserService))],
+) -> Author | AuthorPrincipal | None:
     """Retrieve an Author from JWT token if present.
 
+    In claims authorization mode the author is built from the token
+    claims once the token version is checked, without loading it.
+
     Args:
-        token (str): JWT token from the request.
-        auth_service (AuthService): Service for token validation.
+        claims (dict[str, str | int] | None): Verified JWT claims, shared
+            with other dependencies of the request.
         author_service (AuthorService): Service for author operations.
+        user_service (UserService): Service for the token version check.
 
     Returns:
-        Author | None: Returns Author if token is valid, else None.
+        Author | AuthorPrincipal | None: Returns the author if token is
+            valid, else None.
+
+    Raises:
+        UserIsNotAuthorException: If the user is not a verified author.
 
     """
-    if not token:
+    if not claims:
         return None
-    potential_author_id = await auth_service.validate_token_for_user(token)
+    if _has_authorization_claims(claims):
+        await _get_principal_from_claims(claims, user_service)
+        if 'author_id' not in claims:
+            raise UserIsNotAuthorException
+        author = AuthorPrincipal.from_claims(claims)
+        if not author.is_verified:
+            raise UserIsNotAuthorException
+        return author
+    potential_author_id = AuthService.get_user_id_from_jwt(claims)
     return await author_service.get_author_by_user_id(potential_author_id)
 
 
@@ -43,12 +66,18 @@ class AuthorPermissionDependency(BasePermissionDependency):
     Applies a list of BaseAuthorPermission classes to an Author
     retrieved optionally from JWT. If no author is found or
     permissions fail, raises UserIsNotAuthorException.
+
+    With load_author=False the author used for the permission checks is
+    returned as is, which is an AuthorPrincipal in claims authorization
+    mode.
     """
 
     def __init__(
         self,
         permissions: Sequence[type[BaseAuthorPermission]],
         logic: Literal['AND', 'OR'] = BasePermissionDependency.LOGIC_AND,
+        *,
+        load_author: bool = True,
     ):
         """Initialize AuthorPermissionDependency.
 
@@ -57,25 +86,34 @@ class AuthorPermissionDependency(BasePermissionDependency):
                 permission classes to enforce.
             logic (Literal['AND', 'OR'], optional): Logic for combining
                 permissions. Defaults to 'AND'.
+            load_author (bool, optional): Return the Author model instead
+                of the token identity. Defaults to True.
 
         """
         super().__init__(permissions, logic)
+        self.load_author = load_author
 
     async def __call__(
         self,
         request: Request,
         author: Annotated[
-            Author | None, Depends(_get_optional_author_from_jwt)
+            Author | AuthorPrincipal | None,
+            Depends(_get_optional_author_from_jwt),
+        ],
+        author_service: Annotated[
+            AuthorService, Depends(get_service(AuthorService))
         ],
-    ) -> Author:
+    ) -> Author | AuthorPrincipal:
         """Validate author permissions and return the Author.
 
         Args:
             request (Request): Current HTTP request.
-            author (Author | None): Optional author from JWT token.
+            author (Author | AuthorPrincipal | None): Optional author from
+                JWT token.
+            author_service (AuthorService): Service to load the Author.
 
         Returns:
-            Author: Validated author object.
+            Author | AuthorPrincipal: Validated author object.
 
         Raises:
             UserIsNotAuthorException: If author is missing or invalid.
@@ -87,4 +125,6 @@ class AuthorPermissionDependency(BasePermissionDependency):
         )
         if not author:
             raise UserIsNotAuthorException
+        if self.load_author and isinstance(author, AuthorPrincipal):
+            return await author_service.get_author_by_user_id(author.user_id)
         return author
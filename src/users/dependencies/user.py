@@ -5,7 +5,8 @@ from typing import Annotated, Literal
 from fastapi import Depends
 from fastapi.requests import Request
 
-from src.auth.dependencies import _get_optional_user_from_jwt
+from src.auth.dependencies import _get_optional_principal_from_jwt
+from src.auth.schemas import UserPrincipal
 from src.base.dependencies import BasePermissionDependency, get_service
 from src.users.models import User
 from src.users.permissions.user import TargetUserAdminPermission
@@ -73,7 +74,8 @@ class AdminPermissionDependency(BasePermissionDependency):
         request: Request,
         target_user: Annotated[User, Depends(_get_user_by_uuid)],
         source_user: Annotated[
-            User | None, Depends(_get_optional_user_from_jwt)
+            User | UserPrincipal | None,
+            Depends(_get_optional_principal_from_jwt),
         ],
     ) -> User:
         """Validate permissions for the target user.
@@ -81,7 +83,8 @@ class AdminPermissionDependency(BasePermissionDependency):
         Args:
             request (Request): Current HTTP request.
             target_user (User): Target user for the operation.
-            source_user (User | None): Authenticated source user.
+            source_user (User | UserPrincipal | None): Authenticated
+                source user.
 
         Returns:
             User: The target user if all permissions pass.
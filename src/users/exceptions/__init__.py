@@ -1,4 +1,8 @@
-from .author import AdminCannotBeAuthorException, UserIsNotAuthorException
+from .author import (
+    AdminCannotBeAuthorException,
+    UserIsAlreadyAuthorException,
+    UserIsNotAuthorException,
+)
 from .user import (
     BadEmailSchemaException,
     BadPasswordSchemaException,
@@ -13,6 +17,7 @@ __all__ = [
     'BadEmailSchemaException',
     'BadPasswordSchemaException',
     'ForgottenParametersException',
+    'UserIsAlreadyAuthorException',
     'UserIsNotAuthorException',
     'UserNotAuthorizedException',
     'UserNotFoundByIdException',
@@ -12,6 +12,17 @@ class AdminCannotBeAuthorException(HTTPException):
         )
 
 
+class UserIsAlreadyAuthorException(HTTPException):
+    """User already has an author profile."""
+
+    def __init__(self) -> None:
+        """Initialize the UserIsAlreadyAuthorException with status 409."""
+        super().__init__(
+            status_code=409,
+            detail='User already has an author profile.',
+        )
+
+
 class UserIsNotAuthorException(HTTPException):
     """User is not an author."""
 
@@ -22,6 +22,8 @@ class User(BaseUUIDMixin, BaseTimeStampMixin):
         password (str): Hashed password for user authentication.
         roles (List[str]): List of roles assigned to the user.
         is_active (bool): Flag indicating if the user account is active.
+        token_version (int): Version of the authorization claims, bumped
+         to reject access tokens issued before a role or account change.
 
     Properties:
         is_user_admin (bool): Check if the user has an admin role.
@@ -61,6 +63,11 @@ class User(BaseUUIDMixin, BaseTimeStampMixin):
     is_active: Mapped[bool] = mapped_column(
         default=True,
     )
+    token_version: Mapped[int] = mapped_column(
+        default=0,
+        server_default='0',
+        nullable=False,
+    )
     purchased_courses: Mapped[list['Course']] = relationship(
         'Course', secondary='user_courses', back_populates='users'
     )
@@ -1,8 +1,13 @@
 from .author import BaseAuthorPermission, IsAuthorPermission
-from .user import TargetUserAdminPermission, TargetUserSuperadminPermission
+from .user import (
+    IsAdminPermission,
+    TargetUserAdminPermission,
+    TargetUserSuperadminPermission,
+)
 
 __all__ = [
     'BaseAuthorPermission',
+    'IsAdminPermission',
     'IsAuthorPermission',
     'TargetUserAdminPermission',
     'TargetUserSuperadminPermission',
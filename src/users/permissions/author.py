@@ -3,6 +3,7 @@ from typing import Unpack
 
 from fastapi.requests import Request
 
+from src.auth.schemas import AuthorPrincipal
 from src.base.permission import BasePermission, PermissionKwargs
 from src.users import Author
 from src.users.exceptions import (
@@ -31,16 +32,16 @@ class BaseAuthorPermission(BasePermission, ABC):
 
         """
         super().__init__(request, **kwargs)
-        self.author: Author | None = kwargs.get('author')
+        self.author: Author | AuthorPrincipal | None = kwargs.get('author')
 
-    def _is_author_authorized(self) -> Author:
+    def _is_author_authorized(self) -> Author | AuthorPrincipal:
         """Check if an author is authorized.
 
         Raises:
             UserPermissionException: If the author is not provided.
 
         Returns:
-            Author: The authenticated author.
+            Author | AuthorPrincipal: The authenticated author.
 
         """
         if not self.author:
@@ -3,6 +3,7 @@ from typing import Unpack
 
 from fastapi.requests import Request
 
+from src.auth.schemas import UserPrincipal
 from src.base.permission import BasePermission, PermissionKwargs
 from src.users import User
 from src.users.exceptions import (
@@ -32,16 +33,16 @@ class BaseUserPermission(BasePermission, ABC):
 
         """
         super().__init__(request, **kwargs)
-        self.user: User | None = kwargs.get('user')
+        self.user: User | UserPrincipal | None = kwargs.get('user')
 
-    def _is_user_authorized(self) -> User:
+    def _is_user_authorized(self) -> User | UserPrincipal:
         """Check if a user is authorized.
 
         Raises:
             UserNotAuthorizedException: If the user is not provided.
 
         Returns:
-            User: The authenticated user.
+            User | UserPrincipal: The authenticated user.
 
         """
         if not self.user:
@@ -49,6 +50,23 @@ class BaseUserPermission(BasePermission, ABC):
         return self.user
 
 
+class IsAdminPermission(BaseUserPermission):
+    """Permission class to validate that the current user is an admin.
+
+    Superadmins are admins too.
+    """
+
+    async def validate_permission(self) -> None:
+        """Validate that the current user has admin permissions.
+
+        Raises:
+            UserPermissionException: If the user is not an admin.
+
+        """
+        if not self._is_user_authorized().is_user_in_admin_group:
+            raise UserPermissionException
+
+
 class TargetUserAdminPermission(BaseUserPermission):
     """Permission class to validate admin access on a target user.
 
@@ -78,7 +96,7 @@ class TargetUserAdminPermission(BaseUserPermission):
             UserPermissionException: If the user does not have permission.
 
         """
-        auth_user: User = self._is_user_authorized()
+        auth_user: User | UserPrincipal = self._is_user_authorized()
         if (
             not auth_user.is_user_admin
             or (
@@ -105,7 +123,7 @@ class TargetUserSuperadminPermission(TargetUserAdminPermission):
             UserPermissionException: If the user does not have permission.
 
         """
-        auth_user: User = self._is_user_authorized()
+        auth_user: User | UserPrincipal = self._is_user_authorized()
         if (
             not auth_user.is_user_superadmin
             or self.target_user.is_user_superadmin
@@ -1,18 +1,81 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Query, Security
+from fastapi.responses import StreamingResponse
 
+from src.auth.dependencies import UserPermissionDependency
 from src.base.dependencies import get_service
+from src.base.streaming import ExportFormat, stream_export
+from src.courses.schemas import (
+    BaseCourseResponseSchema,
+    PurchaseResponseSchema,
+)
+from src.courses.service import CourseService
+from src.database import slow_query_recorder
 from src.users import User
 from src.users.dependencies import AdminPermissionDependency
 from src.users.permissions import (
+    IsAdminPermission,
     TargetUserAdminPermission,
     TargetUserSuperadminPermission,
 )
-from src.users.schemas import UserResponseShema
+from src.users.schemas import (
+    PlatformStatsResponseSchema,
+    SlowQueryResponseSchema,
+    UserResponseShema,
+)
 from src.users.services import UserService
 
 admin_router = APIRouter()
+_admin_only = Security(
+    UserPermissionDependency([IsAdminPermission], load_user=False)
+)
+
+
+@admin_router.get(
+    '/stats',
+    description='Get platform totals',
+    dependencies=[_admin_only],
+)
+async def get_platform_stats(
+    service: Annotated[UserService, Depends(get_service(UserService))],
+) -> PlatformStatsResponseSchema:
+    """Get the totals of users, courses and purchases.
+
+    Args:
+        service (UserService): Service for user operations
+
+    Returns:
+        PlatformStatsResponseSchema: Platform totals, mostly estimates
+
+    Raises:
+        UserPermissionException: If the caller is not an admin.
+
+    """
+    return await service.get_platform_stats()
+
+
+@admin_router.get(
+    '/slow_queries',
+    description='Get the latest slow queries with their plans',
+    dependencies=[_admin_only],
+)
+async def get_slow_queries() -> list[SlowQueryResponseSchema]:
+    """Get the slow statements recorded by this worker, newest first.
+
+    The list is empty unless the slow query log is enabled.
+
+    Returns:
+        list[SlowQueryResponseSchema]: Recorded slow statements
+
+    Raises:
+        UserPermissionException: If the caller is not an admin.
+
+    """
+    return [
+        SlowQueryResponseSchema.model_validate(entry)
+        for entry in slow_query_recorder.recent()
+    ]
 
 
 @admin_router.get('/{user_id}')
@@ -129,3 +192,99 @@ async def revoke_admin_privilege(
     """
     updated_user = await service.revoke_admin_privilege(target_user=target_user)
     return UserResponseShema.model_validate(updated_user)
+
+
+@admin_router.get(
+    '/export/users',
+    description='Export all users as NDJSON or CSV',
+    response_class=StreamingResponse,
+    dependencies=[_admin_only],
+)
+async def export_users(
+    export_format: Annotated[ExportFormat, Query(alias='format')] = (
+        ExportFormat.NDJSON
+    ),
+) -> StreamingResponse:
+    """Stream every user, in constant memory.
+
+    Args:
+        export_format (ExportFormat): Format of the export.
+
+    Returns:
+        StreamingResponse: The users, one row or line each.
+
+    Raises:
+        UserPermissionException: If the caller is not an admin.
+
+    """
+    return stream_export(
+        UserService,
+        UserService.export_users,
+        UserResponseShema,
+        export_format,
+        'users',
+    )
+
+
+@admin_router.get(
+    '/export/purchases',
+    description='Export all course purchases as NDJSON or CSV',
+    response_class=StreamingResponse,
+    dependencies=[_admin_only],
+)
+async def export_purchases(
+    export_format: Annotated[ExportFormat, Query(alias='format')] = (
+        ExportFormat.NDJSON
+    ),
+) -> StreamingResponse:
+    """Stream every course purchase, in constant memory.
+
+    Args:
+        export_format (ExportFormat): Format of the export.
+
+    Returns:
+        StreamingResponse: The purchases, one row or line each.
+
+    Raises:
+        UserPermissionException: If the caller is not an admin.
+
+    """
+    return stream_export(
+        CourseService,
+        CourseService.export_purchases,
+        PurchaseResponseSchema,
+        export_format,
+        'purchases',
+    )
+
+
+@admin_router.get(
+    '/export/courses',
+    description='Export all courses as NDJSON or CSV',
+    response_class=StreamingResponse,
+    dependencies=[_admin_only],
+)
+async def export_courses(
+    export_format: Annotated[ExportFormat, Query(alias='format')] = (
+        ExportFormat.NDJSON
+    ),
+) -> StreamingResponse:
+    """Stream every course, in constant memory.
+
+    Args:
+        export_format (ExportFormat): Format of the export.
+
+    Returns:
+        StreamingResponse: The courses, one row or line each.
+
+    Raises:
+        UserPermissionException: If the caller is not an admin.
+
+    """
+    return stream_export(
+        CourseService,
+        CourseService.export_courses,
+        BaseCourseResponseSchema,
+        export_format,
+        'courses',
+    )
@@ -82,5 +82,4 @@ async def get_author_by_id(
         AuthorResponseSchema: The author data for the specified ID.
 
     """
-    author = await service.get_author_by_id(author_id)
-    return AuthorResponseSchema.model_validate(author)
+    return await service.get_author_profile(author_id)
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, Security
 
 from src.auth.dependencies import UserPermissionDependency
 from src.auth.permissions import IsAuthenticated
+from src.auth.schemas import UserPrincipal
 from src.base.dependencies import get_service
 from src.users.models import User
 from src.users.schemas import (
@@ -67,7 +68,8 @@ async def create_user(
 )
 async def update_user(
     user: Annotated[
-        User, Security(UserPermissionDependency([IsAuthenticated]))
+        User | UserPrincipal,
+        Security(UserPermissionDependency([IsAuthenticated], load_user=False)),
     ],
     user_fields: UpdateUserRequestSchema,
     service: Annotated[UserService, Depends(get_service(UserService))],
@@ -75,7 +77,8 @@ async def update_user(
     """Update the currently authenticated user's information.
 
     Args:
-        user (User): The authenticated user retrieved via security dependency.
+        user (User | UserPrincipal): The authenticated user retrieved via
+            security dependency.
         user_fields (UpdateUserRequestSchema): Schema with fields to update.
         service (UserService): Service for user-related operations.
 
@@ -92,14 +95,16 @@ async def update_user(
 @user_router.delete('/me', status_code=204)
 async def deactivate_user(
     user: Annotated[
-        User, Security(UserPermissionDependency([IsAuthenticated]))
+        User | UserPrincipal,
+        Security(UserPermissionDependency([IsAuthenticated], load_user=False)),
     ],
     service: Annotated[UserService, Depends(get_service(UserService))],
 ) -> None:
     """Deactivate the currently authenticated user's account.
 
     Args:
-        user (User): The authenticated user retrieved via security dependency.
+        user (User | UserPrincipal): The authenticated user retrieved via
+            security dependency.
         service (UserService): Service for user-related operations.
 
     Returns:
@@ -1,3 +1,4 @@
+from .admin import PlatformStatsResponseSchema, SlowQueryResponseSchema
 from .author import AuthorResponseSchema, CreateAuthorRequestSchema
 from .user import (
     CreateUserRequestSchema,
@@ -12,6 +13,8 @@ __all__ = [
     'CreateAuthorRequestSchema',
     'CreateUserRequestSchema',
     'DeleteUserResponseSchema',
+    'PlatformStatsResponseSchema',
+    'SlowQueryResponseSchema',
     'UpdateUserRequestSchema',
     'UpdateUserResponseSchema',
     'UserResponseShema',
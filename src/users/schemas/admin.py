@@ -0,0 +1,34 @@
+import datetime as dt
+from typing import Any
+
+from pydantic import BaseModel
+
+from src.base.schemas import BaseSchema
+
+
+class PlatformStatsResponseSchema(BaseModel):
+    """Totals of the platform shown to admins.
+
+    Totals of whole tables are planner estimates, which may lag behind
+    by the rows changed since the table was last analyzed.
+    """
+
+    users: int
+    courses: int
+    active_courses: int
+    purchases: int
+
+
+class SlowQueryResponseSchema(BaseSchema):
+    """A slow statement recorded by the slow query log.
+
+    Parameters that may be sensitive are redacted. The plan is the
+    ``EXPLAIN (FORMAT JSON)`` output, null when it wasn't captured.
+    """
+
+    recorded_at: dt.datetime
+    route: str | None
+    statement: str
+    parameters: list[str]
+    duration_ms: float
+    plan: Any
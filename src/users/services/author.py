@@ -3,16 +3,18 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.base.loader import get_batch_loader
 from src.base.service import BaseService
 from src.users import User
-from src.users.dao import AuthorDAO
+from src.users.cache import identity_cache
+from src.users.dao import AuthorDAO, UserDAO
 from src.users.exceptions.author import (
     AdminCannotBeAuthorException,
+    UserIsAlreadyAuthorException,
     UserIsNotAuthorException,
 )
 from src.users.models import Author
-from src.users.schemas import CreateAuthorRequestSchema
-from src.utils import make_slug
+from src.users.schemas import AuthorResponseSchema, CreateAuthorRequestSchema
 
 
 class AuthorService(BaseService):
@@ -28,6 +30,7 @@ class AuthorService(BaseService):
         self,
         db_session: AsyncSession,
         dao: AuthorDAO | None = None,
+        user_dao: UserDAO | None = None,
     ) -> None:
         """Initialize a new UserService instance.
 
@@ -37,16 +40,23 @@ class AuthorService(BaseService):
              for user operations.
                 If None, creates a new UserDAO instance.
                 Defaults to None.
+            user_dao (UserDAO | None, optional): Data Access Object
+             for the authors' users. Defaults to None.
 
         """
         super().__init__(db_session)
         self._dao: AuthorDAO = dao or AuthorDAO(
             session=db_session, model=Author
         )
+        self._user_dao: UserDAO = user_dao or UserDAO(
+            session=db_session, model=User
+        )
 
     async def get_author_by_user_id(self, user_id: uuid.UUID | str) -> Author:
         """Check if a user is a verified author.
 
+        Verified authors are served from the identity cache when possible.
+
         Args:
             user_id (uuid.UUID | str): The ID of the user to check.
 
@@ -57,12 +67,18 @@ class AuthorService(BaseService):
             UserIsNotAuthorException: If the user is not a verified author.
 
         """
-        async with self.session.begin():
+        cached_author: Author | None = await identity_cache.get_author(
+            self.session, user_id
+        )
+        if cached_author:
+            return cached_author
+        async with self.transaction():
             author: Author | None = await self._dao.get_author(
                 user_id=user_id, is_verified=True
             )
         if not author:
             raise UserIsNotAuthorException
+        identity_cache.set_author(author)
         return author
 
     async def get_author_by_id(self, author_id: uuid.UUID | str) -> Author:
@@ -78,9 +94,37 @@ class AuthorService(BaseService):
             UserIsNotAuthorException: If no verified author is found with ID.
 
         """
-        async with self.session.begin():
-            author: Author | None = await self._dao.get_one(
-                id=author_id, is_verified=True
+        async with self.read_only():
+            author: Author | None = await get_batch_loader(
+                self._dao, is_verified=True
+            ).load(author_id)
+        if not author:
+            raise UserIsNotAuthorException
+        return author
+
+    async def get_author_profile(
+        self, author_id: uuid.UUID | str
+    ) -> AuthorResponseSchema:
+        """Retrieve the public profile of a verified author by their ID.
+
+        Only the columns of the response schema are selected, without
+        building an Author instance.
+
+        Args:
+            author_id (uuid.UUID | str): The ID of the author to retrieve.
+
+        Returns:
+            AuthorResponseSchema: Profile of the verified author.
+
+        Raises:
+            UserIsNotAuthorException: If no verified author is found with ID.
+
+        """
+        async with self.read_only():
+            author: (
+                AuthorResponseSchema | None
+            ) = await self._dao.get_one_projected(
+                AuthorResponseSchema, id=author_id, is_verified=True
             )
         if not author:
             raise UserIsNotAuthorException
@@ -100,13 +144,21 @@ class AuthorService(BaseService):
 
         Raises:
             AdminCannotBeAuthorException: If the user is an admin or superadmin.
+            UserIsAlreadyAuthorException: If the user has an author profile.
 
         """
         if user.is_user_in_admin_group:
             raise AdminCannotBeAuthorException
         user_data: dict[str, Any] = author_schema.model_dump(mode='json')
         user_data['user_id'] = user.id
-        user_data['slug'] = make_slug(user.name or user.surname)
-        async with self.session.begin():
+        async with self.transaction():
+            if await self._dao.exists(user_id=user.id):
+                raise UserIsAlreadyAuthorException
+            user_data['slug'] = await self._get_unique_slug(
+                self._dao, user.name or user.surname
+            )
             new_author: Author = await self._dao.create(user_data)
+            # Access tokens issued before carry no author claims
+            await self._user_dao.bump_token_version(user.id)
+            await identity_cache.invalidate(self.session, user.id)
         return new_author
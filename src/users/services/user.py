@@ -1,26 +1,33 @@
 import uuid
-from typing import ClassVar
+from collections.abc import AsyncIterator
+from typing import Any, ClassVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.revocation import revocation_list
+from src.auth.schemas import UserPrincipal
 from src.auth.services.hasher import Hasher
 from src.base.dao import BaseDAO
+from src.base.loader import get_batch_loader
 from src.base.service import BaseService
+from src.courses.models import Course
+from src.users.cache import identity_cache
+from src.users.dao import UserDAO
+from src.users.enums import UserRole
 from src.users.exceptions import (
     ForgottenParametersException,
     UserNotFoundByIdException,
 )
-from src.users.models import User
+from src.users.models import User, UserCourses
 from src.users.schemas import (
     CreateUserRequestSchema,
     DeleteUserResponseSchema,
+    PlatformStatsResponseSchema,
     UpdateUserRequestSchema,
     UpdateUserResponseSchema,
     UserResponseShema,
 )
 
-type UserDAO = BaseDAO[User, CreateUserRequestSchema]
-
 
 class UserService(BaseService):
     """Service class for handling user-related business logic and operations.
@@ -43,9 +50,22 @@ class UserService(BaseService):
 
     """
 
-    _DEACTIVATE_USER_UPDATE: ClassVar[dict[str, bool]] = {'is_active': False}
-    _REVOKE_ADMIN_UPDATE: ClassVar[dict[str, list[str]]] = {'roles': ['user']}
-    _SET_ADMIN_UPDATE: ClassVar[dict[str, list[str]]] = {'roles': ['admin']}
+    # Updates changing authorization claims also bump the token version
+    _BUMP_TOKEN_VERSION: ClassVar[dict[str, Any]] = {
+        'token_version': User.token_version + 1
+    }
+    _DEACTIVATE_USER_UPDATE: ClassVar[dict[str, Any]] = {
+        'is_active': False,
+        **_BUMP_TOKEN_VERSION,
+    }
+    _REVOKE_ADMIN_UPDATE: ClassVar[dict[str, Any]] = {
+        'role': UserRole.USER,
+        **_BUMP_TOKEN_VERSION,
+    }
+    _SET_ADMIN_UPDATE: ClassVar[dict[str, Any]] = {
+        'role': UserRole.ADMIN,
+        **_BUMP_TOKEN_VERSION,
+    }
 
     def __init__(
         self,
@@ -63,10 +83,7 @@ class UserService(BaseService):
 
         """
         super().__init__(db_session)
-        self._dao: UserDAO = dao or BaseDAO[
-            User,
-            CreateUserRequestSchema,
-        ](session=db_session, model=User)
+        self._dao: UserDAO = dao or UserDAO(session=db_session, model=User)
 
     @property
     def dao(self) -> UserDAO:
@@ -93,12 +110,101 @@ class UserService(BaseService):
             is found with the given ID
 
         """
-        async with self.session.begin():
+        async with self.transaction():
             user: User | None = await self.dao.get_one(id=user_id)
         if not user:
             raise UserNotFoundByIdException
         return user
 
+    async def get_current_user(self, user_id: uuid.UUID | str) -> User:
+        """Retrieve the active user behind an access token.
+
+        The result is served from the identity cache when possible.
+        Services changing a user invalidate it, so deactivation and role
+        changes are visible on the next request.
+
+        Args:
+            user_id (uuid.UUID | str): ID from the access token.
+
+        Returns:
+            User: The active user.
+
+        Raises:
+            UserNotFoundByIdException: If no active user has this ID.
+
+        """
+        cached_user: User | None = await identity_cache.get_user(
+            self.session, user_id
+        )
+        if cached_user:
+            return cached_user
+        async with self.transaction():
+            user: User | None = await get_batch_loader(
+                self.dao, is_active=True
+            ).load(user_id)
+        if not user:
+            raise UserNotFoundByIdException
+        identity_cache.set_user(user)
+        return user
+
+    async def get_platform_stats(self) -> PlatformStatsResponseSchema:
+        """Return the totals of the platform for admins.
+
+        Whole tables are counted from planner estimates, so the totals
+        stay cheap however large the tables grow. Active courses are
+        counted exactly through the partial catalog index.
+
+        Returns:
+            PlatformStatsResponseSchema: Totals of users, courses and
+                purchases.
+
+        """
+        course_dao = BaseDAO[Course](self.session, Course)
+        async with self.read_only():
+            return PlatformStatsResponseSchema(
+                users=await self.dao.estimated_count(),
+                courses=await course_dao.estimated_count(),
+                active_courses=await course_dao.count(is_active=True),
+                purchases=await BaseDAO[UserCourses](
+                    self.session, UserCourses
+                ).estimated_count(),
+            )
+
+    async def export_users(self) -> AsyncIterator[UserResponseShema]:
+        """Stream every user, active or not, for an admin export.
+
+        Yields:
+            UserResponseShema: The users, in no particular order.
+
+        """
+        async with self.read_only():
+            async for user in self.dao.stream_projected(UserResponseShema):
+                yield user
+
+    async def get_token_version(self, user_id: uuid.UUID | str) -> int | None:
+        """Return the current token version of an active user.
+
+        Access tokens carrying a different version are outdated. The
+        value is served from the identity cache when possible and is
+        invalidated together with the cached user.
+
+        Args:
+            user_id (uuid.UUID | str): ID from the access token.
+
+        Returns:
+            int | None: The token version, or None if there is no active
+                user with this ID.
+
+        """
+        token_version: int | None = identity_cache.get_token_version(user_id)
+        if token_version is not None:
+            return token_version
+        async with self.transaction():
+            token_version = await self.dao.get_token_version(user_id)
+        if token_version is not None:
+            identity_cache.set_token_version(user_id, token_version)
+        return token_version
+
     async def create_new_user(
         self,
         user: CreateUserRequestSchema,
@@ -119,18 +225,20 @@ class UserService(BaseService):
         """
         user_data = user.model_dump()
         user_secret_pass = user_data['password'].get_secret_value()
-        user_data['password'] = Hasher.hash_password(user_secret_pass)
-        async with self.session.begin():
+        user_data['password'] = await Hasher.hash_password_async(
+            user_secret_pass
+        )
+        async with self.transaction():
             created_user = await self.dao.create(user_data)
         return UserResponseShema.model_validate(created_user)
 
     async def deactivate_user(
-        self, target_user: User
+        self, target_user: User | UserPrincipal
     ) -> DeleteUserResponseSchema:
         """Deactivate a user in the database.
 
         Args:
-            target_user (User): The user to be deactivated
+            target_user (User | UserPrincipal): The user to be deactivated
 
         Returns:
             DeleteUserResponseSchema: Response with the deactivated user ID
@@ -139,26 +247,30 @@ class UserService(BaseService):
             UserNotFoundByIdException: If the target user is not found
 
         Note:
-            This operation sets the user's is_active flag to False
+            This operation sets the user's is_active flag to False, bumps
+            the token version and revokes issued access tokens
 
         """
-        async with self.dao.session.begin():
+        async with self.transaction():
             deleted_user: User | None = await self.dao.update(
                 self._DEACTIVATE_USER_UPDATE, id=target_user.id
             )
+            await identity_cache.invalidate(self.session, target_user.id)
+            await revocation_list.revoke_user(self.session, target_user.id)
         if not deleted_user:
             raise UserNotFoundByIdException
         return DeleteUserResponseSchema.model_validate(deleted_user)
 
     async def update_user(
         self,
-        target_user: User,
+        target_user: User | UserPrincipal,
         user_fields: UpdateUserRequestSchema,
     ) -> UpdateUserResponseSchema:
         """Update user information in the database.
 
         Args:
-            target_user (User): The user whose information will be updated
+            target_user (User | UserPrincipal): The user whose information
+             will be updated
             user_fields (UpdateUserRequestSchema): Schema containing
              the fields to update
 
@@ -179,10 +291,11 @@ class UserService(BaseService):
         )  # Delete None key value pair
         if not filtered_user_fields:
             raise ForgottenParametersException
-        async with self.session.begin():
+        async with self.transaction():
             updated_user: User | None = await self.dao.update(
                 filtered_user_fields, id=target_user.id
             )
+            await identity_cache.invalidate(self.session, target_user.id)
         if not updated_user:
             raise UserNotFoundByIdException
         return UpdateUserResponseSchema.model_validate(updated_user)
@@ -204,13 +317,16 @@ class UserService(BaseService):
             UserNotFoundByIdException: If the target user is not found
 
         Note:
-            This operation adds the ADMIN role to the user's roles list
+            This operation sets the user's role to ADMIN, bumps the
+            token version and revokes issued access tokens
 
         """
-        async with self.session.begin():
+        async with self.transaction():
             updated_user: User | None = await self.dao.update(
                 self._SET_ADMIN_UPDATE, id=target_user.id
             )
+            await identity_cache.invalidate(self.session, target_user.id)
+            await revocation_list.revoke_user(self.session, target_user.id)
         if not updated_user:
             raise UserNotFoundByIdException
         return UpdateUserResponseSchema.model_validate(updated_user)
@@ -231,13 +347,16 @@ class UserService(BaseService):
             UserNotFoundByIdException: If the target user is not found
 
         Note:
-            This operation removes the ADMIN role from the user's roles list
+            This operation sets the user's role back to USER, bumps the
+            token version and revokes issued access tokens
 
         """
-        async with self.session.begin():
+        async with self.transaction():
             updated_user: User | None = await self.dao.update(
-                self._REVOKE_ADMIN_UPDATE, target_user.id
+                self._REVOKE_ADMIN_UPDATE, id=target_user.id
             )
+            await identity_cache.invalidate(self.session, target_user.id)
+            await revocation_list.revoke_user(self.session, target_user.id)
         if not updated_user:
             raise UserNotFoundByIdException
         return UpdateUserResponseSchema.model_validate(updated_user)
@@ -0,0 +1,33 @@
+from collections.abc import Iterator
+
+import pytest
+from passlib.hash import bcrypt
+
+from src.auth.services import Hasher
+
+CONFIGURED_ROUNDS = 5
+
+
+@pytest.fixture
+def configured_rounds() -> Iterator[int]:
+    Hasher.configure_rounds(CONFIGURED_ROUNDS)
+    yield CONFIGURED_ROUNDS
+    Hasher.configure_rounds(bcrypt.default_rounds)
+
+
+@pytest.mark.parametrize(
+    ('rounds', 'outdated'),
+    [
+        (CONFIGURED_ROUNDS - 1, True),
+        (CONFIGURED_ROUNDS, False),
+        (CONFIGURED_ROUNDS + 1, False),
+    ],
+)
+@pytest.mark.usefixtures('configured_rounds')
+def test_only_hashes_below_the_configured_cost_need_update(
+    rounds: int,
+    outdated: bool,  # noqa: FBT001
+) -> None:
+    hashed_password = bcrypt.using(rounds=rounds).hash('password')
+
+    assert Hasher.needs_update(hashed_password) is outdated
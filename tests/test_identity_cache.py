@@ -0,0 +1,74 @@
+import uuid
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.users.cache import IdentityCache
+from src.users.enums import UserRole
+from src.users.models import Author, User
+
+
+def _loaded_user() -> User:
+    user = User(
+        id=uuid.uuid4(),
+        name='Ada',
+        surname='Lovelace',
+        email='ada@example.com',
+        password='hash',
+        role=UserRole.USER,
+        is_active=True,
+        token_version=1,
+    )
+    # Cached users are loaded by a session, whatever happens to it later
+    AsyncSession().sync_session.add(user)
+    return user
+
+
+async def test_every_hit_gets_its_own_instance() -> None:
+    cache = IdentityCache(max_size=10, ttl=60)
+    user = _loaded_user()
+    cache.set_user(user)
+    first, second = AsyncSession(), AsyncSession()
+
+    first_user = await cache.get_user(first, user.id)
+    second_user = await cache.get_user(second, user.id)
+
+    assert first_user is not None
+    assert second_user is not None
+    assert first_user is not user
+    assert first_user is not second_user
+    assert inspect(first_user).session is first.sync_session
+    assert inspect(second_user).session is second.sync_session
+    assert first_user.email == second_user.email == 'ada@example.com'
+    assert not first.dirty
+
+
+async def test_changes_are_not_shared() -> None:
+    cache = IdentityCache(max_size=10, ttl=60)
+    user = _loaded_user()
+    cache.set_user(user)
+
+    user.role = UserRole.ADMIN
+    cached_user = await cache.get_user(AsyncSession(), user.id)
+    assert cached_user is not None
+    cached_user.name = 'Changed'
+
+    assert cached_user.role == UserRole.USER
+    again = await cache.get_user(AsyncSession(), user.id)
+    assert again is not None
+    assert again.name == 'Ada'
+
+
+async def test_author_is_keyed_by_user() -> None:
+    cache = IdentityCache(max_size=10, ttl=60)
+    author = Author(
+        id=uuid.uuid4(), user_id=uuid.uuid4(), slug='ada', is_verified=True
+    )
+    cache.set_author(author)
+
+    cached_author = await cache.get_author(AsyncSession(), author.user_id)
+
+    assert cached_author is not None
+    assert cached_author is not author
+    assert cached_author.id == author.id
+    assert await cache.get_author(AsyncSession(), author.id) is None
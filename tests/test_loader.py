@@ -0,0 +1,102 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.base.loader import BatchLoader, get_batch_loader
+
+
+class StubModel:
+    pass
+
+
+class StubDAO:
+    """DAO serving rows from a dict and recording its queries."""
+
+    model = StubModel
+
+    def __init__(self, *ids: uuid.UUID, failures: int = 0) -> None:
+        """Initialize the DAO with rows of the given IDs."""
+        self.session = SimpleNamespace(info={})
+        self.rows = {id_: SimpleNamespace(id=id_) for id_ in ids}
+        self.calls: list[list[uuid.UUID]] = []
+        self.failures = failures
+
+    async def get_by_ids(
+        self, ids: list[uuid.UUID], **_: Any
+    ) -> list[SimpleNamespace]:
+        self.calls.append(ids)
+        await asyncio.sleep(0)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError
+        return [self.rows[id_] for id_ in ids if id_ in self.rows]
+
+
+async def test_loads_of_one_tick_share_a_query() -> None:
+    first, second, missing = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    dao = StubDAO(first, second)
+    loader = BatchLoader(dao)
+
+    rows = await asyncio.gather(
+        loader.load(first),
+        loader.load(str(second)),
+        loader.load(first),
+        loader.load(missing),
+    )
+
+    assert dao.calls == [[first, second, missing]]
+    assert rows == [dao.rows[first], dao.rows[second], dao.rows[first], None]
+
+
+async def test_loaded_rows_are_memoized() -> None:
+    id_ = uuid.uuid4()
+    dao = StubDAO(id_)
+    loader = BatchLoader(dao)
+
+    assert await loader.load(id_) is await loader.load(id_)
+    assert await loader.load_many([id_, id_]) == [dao.rows[id_]] * 2
+    assert len(dao.calls) == 1
+
+    loader.clear(id_)
+    await loader.load(id_)
+    assert len(dao.calls) == 2
+
+
+async def test_failed_batch_is_retried() -> None:
+    id_ = uuid.uuid4()
+    dao = StubDAO(id_, failures=1)
+    loader = BatchLoader(dao)
+
+    with pytest.raises(ConnectionError):
+        await loader.load(id_)
+
+    assert await loader.load(id_) is dao.rows[id_]
+    assert dao.calls == [[id_], [id_]]
+
+
+async def test_cancelled_load_does_not_fail_other_waiters() -> None:
+    id_ = uuid.uuid4()
+    dao = StubDAO(id_)
+    loader = BatchLoader(dao)
+
+    cancelled = asyncio.create_task(loader.load(id_))
+    waiting = asyncio.create_task(loader.load(id_))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await waiting is dao.rows[id_]
+    assert cancelled.cancelled()
+    assert len(dao.calls) == 1
+
+
+def test_loaders_are_shared_per_session_and_filters() -> None:
+    dao = StubDAO()
+
+    loader = get_batch_loader(dao, is_active=True)
+
+    assert get_batch_loader(dao, is_active=True) is loader
+    assert get_batch_loader(dao) is not loader
+    assert get_batch_loader(StubDAO(), is_active=True) is not loader
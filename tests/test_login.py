@@ -0,0 +1,56 @@
+import uuid
+from typing import Any
+
+import pytest
+
+from src.auth.exceptions import WrongCredentialsException
+from src.auth.schemas import Token
+from src.auth.services import AuthService, Hasher
+from src.users.models import User
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    async def auth_user(*_: Any, **__: Any) -> User:
+        calls.append('auth_user')
+        return User(id=uuid.uuid4(), password='outdated-hash')
+
+    monkeypatch.setattr(AuthService, 'auth_user', auth_user)
+    monkeypatch.setattr(
+        AuthService,
+        '_schedule_rehash',
+        lambda *_: calls.append('rehash'),
+    )
+    monkeypatch.setattr(Hasher, 'needs_update', lambda _: True)
+    return calls
+
+
+async def test_rehash_is_scheduled_after_the_token_issue(
+    calls: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def create_token(*_: Any) -> Token:
+        calls.append('create_token')
+        return Token(access_token='access', refresh_token='refresh')
+
+    monkeypatch.setattr(AuthService, 'create_token', create_token)
+
+    await AuthService(db_session=None).login('user@example.com', 'password')
+
+    assert calls == ['auth_user', 'create_token', 'rehash']
+
+
+async def test_failed_token_issue_schedules_no_rehash(
+    calls: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def create_token(*_: Any) -> Token:
+        calls.append('create_token')
+        raise WrongCredentialsException
+
+    monkeypatch.setattr(AuthService, 'create_token', create_token)
+
+    with pytest.raises(WrongCredentialsException):
+        await AuthService(db_session=None).login('user@example.com', 'password')
+
+    assert calls == ['auth_user', 'create_token']
@@ -0,0 +1,160 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.base.dao import BaseDAO
+from src.base.exceptions import InvalidCursorException
+from src.base.pagination import decode_cursor, encode_cursor
+from src.courses.models import Course
+
+CATALOG_ORDER = ('-rating', '-created_at')
+CATALOG_KEYS = ['-rating', '-created_at', '-id']
+
+
+class RecordingSession:
+    """Session returning fixed rows and recording its statements."""
+
+    def __init__(self, rows: list[SimpleNamespace]) -> None:
+        """Initialize the session with the rows every query returns."""
+        self.rows = rows
+        self.statements: list[Any] = []
+
+    async def scalars(self, statement: Any) -> SimpleNamespace:
+        self.statements.append(statement)
+        return SimpleNamespace(all=lambda: self.rows)
+
+    def compiled(self, index: int = -1) -> Any:
+        return self.statements[index].compile(dialect=postgresql.dialect())
+
+
+def make_courses(count: int) -> list[SimpleNamespace]:
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            rating=Decimal('4.50') - index,
+            created_at=created_at - timedelta(days=index),
+        )
+        for index in range(count)
+    ]
+
+
+def make_dao(rows: list[SimpleNamespace]) -> tuple[Any, RecordingSession]:
+    session = RecordingSession(rows)
+    return BaseDAO(session, Course), session
+
+
+async def test_cursor_round_trip() -> None:
+    courses = make_courses(3)
+    dao, session = make_dao(courses)
+
+    page = await dao.get_page(order_by=CATALOG_ORDER, limit=2)
+
+    assert page.items == courses[:2]
+    assert page.next_cursor is not None
+    last = courses[1]
+    rating, created_at, id_ = decode_cursor(page.next_cursor, CATALOG_KEYS)
+    assert Decimal(rating) == last.rating
+    assert datetime.fromisoformat(created_at) == last.created_at
+    assert uuid.UUID(id_) == last.id
+
+    await dao.get_page(order_by=CATALOG_ORDER, limit=2, cursor=page.next_cursor)
+
+    compiled = session.compiled()
+    assert '(courses.rating, courses.created_at, courses.id) < ' in str(
+        compiled
+    )
+    assert set(compiled.params.values()) >= {
+        last.rating,
+        last.created_at,
+        last.id,
+    }
+
+
+async def test_last_page_has_no_cursor() -> None:
+    dao, _ = make_dao(make_courses(2))
+
+    page = await dao.get_page(order_by=CATALOG_ORDER, limit=2)
+
+    assert page.next_cursor is None
+
+
+def test_tampered_cursor_is_rejected() -> None:
+    cursor = encode_cursor(CATALOG_KEYS, ['4.50', '2026-01-01', 'id'])
+    payload, _, signature = cursor.partition('.')
+    forged_payload = encode_cursor(CATALOG_KEYS, ['0', '2026-01-01', 'id'])
+
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(
+            f'{forged_payload.partition(".")[0]}.{signature}', CATALOG_KEYS
+        )
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(f'{payload}.{signature[::-1]}', CATALOG_KEYS)
+    with pytest.raises(InvalidCursorException):
+        decode_cursor('not-a-cursor', CATALOG_KEYS)
+
+
+async def test_cursor_of_another_ordering_is_rejected() -> None:
+    courses = make_courses(3)
+    dao, _ = make_dao(courses)
+    page = await dao.get_page(order_by=CATALOG_ORDER, limit=2)
+    assert page.next_cursor is not None
+
+    with pytest.raises(InvalidCursorException):
+        await dao.get_page(
+            order_by=('rating', 'created_at'),
+            limit=2,
+            cursor=page.next_cursor,
+        )
+
+
+async def test_cursor_with_values_of_wrong_type_is_rejected() -> None:
+    dao, _ = make_dao(make_courses(3))
+    cursor = encode_cursor(CATALOG_KEYS, ['not a number', 'x', 'y'])
+
+    with pytest.raises(InvalidCursorException):
+        await dao.get_page(order_by=CATALOG_ORDER, limit=2, cursor=cursor)
+
+
+async def test_mixed_directions_expand_to_an_or_predicate() -> None:
+    courses = make_courses(3)
+    dao, session = make_dao(courses)
+    order_by = ('-rating', 'created_at')
+    page = await dao.get_page(order_by=order_by, limit=2)
+    assert page.next_cursor is not None
+
+    await dao.get_page(order_by=order_by, limit=2, cursor=page.next_cursor)
+
+    sql = ' '.join(str(session.compiled()).split())
+    assert (
+        'WHERE courses.rating < %(rating_1)s'
+        ' OR courses.rating = %(rating_2)s'
+        ' AND courses.created_at > %(created_at_1)s'
+        ' OR courses.rating = %(rating_3)s'
+        ' AND courses.created_at = %(created_at_2)s'
+        ' AND courses.id > %(id_1)s'
+    ) in sql
+    assert 'ORDER BY courses.rating DESC, courses.created_at, courses.id' in sql
+
+
+@pytest.mark.parametrize(
+    ('order_by', 'expected'),
+    [
+        (('-rating',), 'ORDER BY courses.rating DESC, courses.id DESC'),
+        (('title',), 'ORDER BY courses.title, courses.id'),
+        (('-id',), 'ORDER BY courses.id DESC LIMIT'),
+    ],
+)
+async def test_id_breaks_ties_when_missing(
+    order_by: tuple[str, ...], expected: str
+) -> None:
+    dao, session = make_dao([])
+
+    await dao.get_page(order_by=order_by, limit=10)
+
+    assert expected in ' '.join(str(session.compiled()).split())
@@ -0,0 +1,62 @@
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from src.base.dao import BaseDAO
+from src.users.models import Author
+
+AUTHOR_ID = uuid.uuid4()
+
+
+class AuthorWithUserSchema(BaseModel):
+    id: uuid.UUID
+    slug: str
+    user: Any
+
+
+class AuthorWithOptionalUserSchema(BaseModel):
+    id: uuid.UUID
+    slug: str
+    user: Any = None
+
+
+class RecordingSession:
+    """Session returning one author row and recording its statements."""
+
+    def __init__(self) -> None:
+        """Initialize the session without any executed statement."""
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any) -> SimpleNamespace:
+        self.statements.append(statement)
+        row = SimpleNamespace(_asdict=lambda: {'id': AUTHOR_ID, 'slug': 'ada'})
+        return SimpleNamespace(one_or_none=lambda: row)
+
+
+def make_dao() -> tuple[Any, RecordingSession]:
+    session = RecordingSession()
+    return BaseDAO(session, Author), session
+
+
+async def test_required_field_without_column_is_rejected() -> None:
+    dao, session = make_dao()
+
+    with pytest.raises(ValueError, match='required fields user are not'):
+        await dao.get_one_projected(AuthorWithUserSchema, slug='ada')
+
+    assert not session.statements
+
+
+async def test_optional_field_without_column_keeps_its_default() -> None:
+    dao, session = make_dao()
+
+    author = await dao.get_one_projected(
+        AuthorWithOptionalUserSchema, slug='ada'
+    )
+
+    assert author == AuthorWithOptionalUserSchema(id=AUTHOR_ID, slug='ada')
+    selected = [column.key for column in session.statements[0].selected_columns]
+    assert selected == ['id', 'slug']
@@ -0,0 +1,72 @@
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import Engine, create_engine, text
+
+from src.base.query_budget import (
+    QueryBudget,
+    QueryBudgetExceededError,
+    QueryBudgetMiddleware,
+)
+from src.settings import QueryBudgetSettings
+
+MAX_QUERIES = 4
+MAX_REPEATS = 2
+
+
+@pytest.fixture
+def app() -> Iterator[FastAPI]:
+    # The budget only uses the sync engine of an AsyncEngine, which
+    # lets a stdlib SQLite engine stand in for PostgreSQL
+    engine: Engine = create_engine('sqlite://')
+    QueryBudget(
+        QueryBudgetSettings(
+            MODE='raise', MAX_QUERIES=MAX_QUERIES, MAX_REPEATS=MAX_REPEATS
+        )
+    ).register(SimpleNamespace(sync_engine=engine))
+    app = FastAPI()
+    app.add_middleware(QueryBudgetMiddleware)
+
+    @app.get('/repeated/{count}')
+    async def repeated(count: int) -> int:
+        with engine.connect() as conn:
+            for value in range(count):
+                conn.execute(text('SELECT :value'), {'value': value})
+        return count
+
+    @app.get('/distinct/{count}')
+    async def distinct(count: int) -> int:
+        with engine.connect() as conn:
+            for value in range(count):
+                conn.execute(text(f'SELECT {value}'))
+        return count
+
+    yield app
+    engine.dispose()
+
+
+async def get(app: FastAPI, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://test'
+    ) as client:
+        return await client.get(path)
+
+
+async def test_request_within_budget_succeeds(app: FastAPI) -> None:
+    response = await get(app, f'/repeated/{MAX_REPEATS}')
+
+    assert response.status_code == 200
+
+
+async def test_repeated_statement_over_budget_raises(app: FastAPI) -> None:
+    with pytest.raises(QueryBudgetExceededError, match='same SQL statement'):
+        await get(app, f'/repeated/{MAX_REPEATS + 1}')
+
+
+async def test_statements_over_budget_raise(app: FastAPI) -> None:
+    with pytest.raises(QueryBudgetExceededError, match='SQL statements'):
+        await get(app, f'/distinct/{MAX_QUERIES + 1}')
@@ -0,0 +1,37 @@
+from src.base.rate_limit import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    TokenBucketLimiter,
+)
+
+# Length of RateLimitBucket.key
+MAX_KEY_LENGTH = 320
+
+
+class RecordingBackend(RateLimitBackend):
+    def __init__(self) -> None:
+        """Initialize the backend without any recorded key."""
+        self.keys: list[str] = []
+
+    async def consume(self, key: str, capacity: float, rate: float) -> float:
+        self.keys.append(key)
+        return 0.0
+
+
+async def test_long_identity_fits_the_bucket_key() -> None:
+    backend = RecordingBackend()
+    limiter = TokenBucketLimiter('login_email', backend, 5, 5.0)
+
+    assert await limiter.check('a' * 10000) == 0
+    assert len(backend.keys[0]) <= MAX_KEY_LENGTH
+    assert backend.keys[0].startswith('login_email:')
+
+
+async def test_same_identity_shares_a_bucket() -> None:
+    limiter = TokenBucketLimiter(
+        'login_email', InMemoryRateLimitBackend(100), 1, 1.0
+    )
+
+    assert await limiter.check('user@example.com') == 0
+    assert await limiter.check('user@example.com') > 0
+    assert await limiter.check('other@example.com') == 0
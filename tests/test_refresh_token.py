@@ -0,0 +1,90 @@
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.auth.exceptions import RefreshTokenException
+from src.auth.models import RefreshToken
+from src.auth.revocation import revocation_list
+from src.auth.schemas import Token
+from src.auth.services import AuthService
+from src.auth.services.token import TokenManager
+from src.database import async_db_session
+from src.users.models import User
+from src.users.services import UserService
+
+pytestmark = pytest.mark.usefixtures('postgres')
+
+CONCURRENT_REFRESHES = 10
+
+
+async def _create_refresh_token() -> tuple[User, uuid.UUID]:
+    user = User(
+        name='Refresh',
+        surname='Test',
+        email='refresh@test.example.com',
+        password='!',
+    )
+    refresh_token = uuid.uuid4()
+    async with async_db_session() as session, session.begin():
+        session.add(user)
+        await session.flush()
+        session.add(
+            RefreshToken(
+                refresh_token=refresh_token,
+                expires_at=datetime.now(UTC) + timedelta(days=1),
+                user_id=user.id,
+            )
+        )
+    return user, refresh_token
+
+
+async def _refresh(refresh_token: uuid.UUID) -> Token:
+    async with async_db_session() as session:
+        return await AuthService(session).refresh_token(refresh_token)
+
+
+async def test_concurrent_refreshes_rotate_the_token_once() -> None:
+    _, refresh_token = await _create_refresh_token()
+
+    results = await asyncio.gather(
+        *(_refresh(refresh_token) for _ in range(CONCURRENT_REFRESHES)),
+        return_exceptions=True,
+    )
+
+    tokens = [result for result in results if isinstance(result, Token)]
+    failures = [result for result in results if not isinstance(result, Token)]
+    assert len(tokens) == 1
+    assert len(failures) == CONCURRENT_REFRESHES - 1
+    assert all(isinstance(exc, RefreshTokenException) for exc in failures)
+
+
+async def test_rotated_token_cannot_be_refreshed_again() -> None:
+    _, refresh_token = await _create_refresh_token()
+    token = await _refresh(refresh_token)
+
+    assert token.refresh_token != str(refresh_token)
+    with pytest.raises(RefreshTokenException):
+        await _refresh(refresh_token)
+
+
+async def test_token_refreshed_right_after_revocation_is_accepted() -> None:
+    user, refresh_token = await _create_refresh_token()
+    revoked_token = TokenManager.generate_access_token(
+        user.id, user.token_version
+    )
+    revocation_list.reset()
+
+    async with async_db_session() as session:
+        await UserService(session).set_admin_privilege(user)
+    token = await _refresh(refresh_token)
+
+    for access_token, revoked in (
+        (revoked_token, True),
+        (token.access_token, False),
+    ):
+        claims = TokenManager.verify_access_token(
+            access_token.removeprefix('Bearer ')
+        )
+        assert await revocation_list.is_revoked(claims) is revoked
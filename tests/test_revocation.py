@@ -0,0 +1,167 @@
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.auth import revocation
+from src.auth.dao import RevokedAccessTokenDAO
+from src.auth.models import RevokedAccessToken
+from src.auth.revocation import AccessTokenRevocationList
+from src.auth.services.token import TokenManager
+
+USER_ID = uuid.uuid4()
+USER_KEY = f'sub:{USER_ID}'
+
+
+class StubSession:
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[None]:
+        yield
+
+
+class StubRevocationList(AccessTokenRevocationList):
+    """Revocation list with the given revocations already loaded."""
+
+    def __init__(self, keys: list[str]) -> None:
+        """Initialize the list and add the keys to its filter."""
+        super().__init__(capacity=100, error_rate=0.01, rebuild_interval=60)
+        for key in keys:
+            self.mark_revoked(key)
+
+    async def _ensure_loaded(self) -> None:
+        pass
+
+
+@pytest.fixture
+def revocations(monkeypatch: pytest.MonkeyPatch) -> dict[str, int | None]:
+    """Return the revocations read by key instead of the database."""
+    stored: dict[str, int | None] = {}
+
+    @asynccontextmanager
+    async def async_db_session() -> AsyncIterator[StubSession]:
+        yield StubSession()
+
+    async def get_revocations(
+        _: RevokedAccessTokenDAO, keys: list[str]
+    ) -> dict[str, int | None]:
+        return {key: stored[key] for key in keys if key in stored}
+
+    monkeypatch.setattr(revocation, 'async_db_session', async_db_session)
+    monkeypatch.setattr(
+        RevokedAccessTokenDAO, 'get_revocations', get_revocations
+    )
+    return stored
+
+
+def _claims(**claims: str | int) -> dict[str, str | int]:
+    return {'sub': str(USER_ID), 'jti': uuid.uuid4().hex, **claims}
+
+
+@pytest.mark.parametrize(
+    ('token_version', 'revoked'),
+    [
+        (1, True),
+        (2, False),
+        (3, False),
+    ],
+)
+async def test_user_revocation_covers_older_token_versions(
+    revocations: dict[str, int | None],
+    token_version: int,
+    revoked: bool,  # noqa: FBT001
+) -> None:
+    revocations[USER_KEY] = 2
+    revocation_list = StubRevocationList([USER_KEY])
+
+    claims = _claims(ver=token_version)
+
+    assert await revocation_list.is_revoked(claims) is revoked
+
+
+async def test_token_without_version_is_revoked_with_its_user(
+    revocations: dict[str, int | None],
+) -> None:
+    revocations[USER_KEY] = 0
+    revocation_list = StubRevocationList([USER_KEY])
+
+    assert await revocation_list.is_revoked(_claims()) is True
+
+
+async def test_revoked_token_id_covers_every_version(
+    revocations: dict[str, int | None],
+) -> None:
+    claims = _claims(ver=5)
+    token_key = f'jti:{claims["jti"]}'
+    revocations[token_key] = None
+    revocation_list = StubRevocationList([token_key])
+
+    assert await revocation_list.is_revoked(claims) is True
+
+
+async def test_filter_false_positive_is_not_revoked(
+    revocations: dict[str, int | None],
+) -> None:
+    revocation_list = StubRevocationList([USER_KEY])
+
+    assert await revocation_list.is_revoked(_claims(ver=0)) is False
+
+
+async def test_token_refreshed_right_after_revoke_user_is_accepted(
+    revocations: dict[str, int | None],
+) -> None:
+    revoked_token = TokenManager.generate_access_token(USER_ID, 0)
+    # revoke_user runs in the transaction bumping the version to 1
+    revocations[USER_KEY] = 1
+    revocation_list = StubRevocationList([USER_KEY])
+    refreshed_token = TokenManager.generate_access_token(USER_ID, 1)
+
+    revoked_claims = TokenManager.verify_access_token(
+        revoked_token.removeprefix('Bearer ')
+    )
+    refreshed_claims = TokenManager.verify_access_token(
+        refreshed_token.removeprefix('Bearer ')
+    )
+
+    assert await revocation_list.is_revoked(revoked_claims) is True
+    assert await revocation_list.is_revoked(refreshed_claims) is False
+
+
+class RecordingSession:
+    def __init__(self) -> None:
+        """Initialize the session without any executed statement."""
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any) -> None:
+        self.statements.append(statement)
+
+
+async def test_revocation_time_is_bound_from_the_application_clock() -> None:
+    session = RecordingSession()
+    revoked_at = datetime.now(UTC)
+    expires_at = revoked_at + timedelta(minutes=15)
+
+    await RevokedAccessTokenDAO(session, RevokedAccessToken).revoke(
+        'jti:token', revoked_at, expires_at
+    )
+
+    compiled = session.statements[0].compile(dialect=postgresql.dialect())
+    assert 'now()' not in str(compiled)
+    assert revoked_at in compiled.params.values()
+
+
+async def test_user_revocation_stores_the_current_token_version() -> None:
+    session = RecordingSession()
+    revoked_at = datetime.now(UTC)
+
+    await RevokedAccessTokenDAO(session, RevokedAccessToken).revoke(
+        USER_KEY, revoked_at, revoked_at, user_id=USER_ID
+    )
+
+    compiled = session.statements[0].compile(dialect=postgresql.dialect())
+    assert 'SELECT users.token_version' in str(compiled)
+    assert 'token_version = excluded.token_version' in str(compiled)
+    assert USER_ID in compiled.params.values()
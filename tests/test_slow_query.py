@@ -0,0 +1,38 @@
+import datetime as dt
+import uuid
+from decimal import Decimal
+
+from src.base.slow_query import _redact
+
+PLAIN_VALUES = [
+    None,
+    True,
+    42,
+    1.5,
+    Decimal('9.99'),
+    uuid.UUID(int=1),
+    dt.datetime(2026, 1, 1, tzinfo=dt.UTC),
+    dt.date(2026, 1, 1),
+    dt.timedelta(minutes=15),
+]
+
+
+def test_plain_values_are_kept() -> None:
+    assert _redact(tuple(PLAIN_VALUES)) == [repr(v) for v in PLAIN_VALUES]
+
+
+def test_strings_and_other_values_are_redacted() -> None:
+    parameters = ('user@example.com', b'hash', ['secret'], {'key': 'secret'})
+
+    assert _redact(parameters) == ['<redacted>'] * len(parameters)
+
+
+def test_named_parameters_are_redacted_by_value() -> None:
+    assert _redact({'email': 'user@example.com', 'limit': 10}) == [
+        '<redacted>',
+        '10',
+    ]
+
+
+def test_missing_parameters() -> None:
+    assert _redact(None) == []